@@ -0,0 +1,200 @@
+"""A module with awaitable variants of the various (blocking) CAT jobs and workflows.
+
+Index
+-----
+.. currentmodule:: CAT.async_api
+.. autosummary::
+    run_in_executor
+    job_single_point_async
+    job_geometry_opt_async
+    prep_async
+
+API
+---
+.. autofunction:: run_in_executor
+.. autofunction:: job_single_point_async
+.. autofunction:: job_geometry_opt_async
+.. autofunction:: prep_async
+
+"""
+
+import pickle
+import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Optional, Tuple, Any, TypeVar
+
+from scm.plams import Molecule, Settings, Results
+
+from .base import prep
+from .jobs import job_single_point, job_geometry_opt
+from .mol_utils import pickle_dumps
+from .settings_dataframe import SettingsDataFrame
+
+__all__ = ['run_in_executor', 'job_single_point_async', 'job_geometry_opt_async', 'prep_async']
+
+T = TypeVar('T')
+
+
+async def run_in_executor(executor: Optional[Executor], func: Callable[..., T],
+                          *args: Any, semaphore: Optional[asyncio.Semaphore] = None,
+                          **kwargs: Any) -> T:
+    r"""Call :code:`func(*args, **kwargs)` in **executor** without blocking the event loop.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> import asyncio
+        >>> from CAT.async_api import run_in_executor
+
+        >>> loop = asyncio.new_event_loop()
+        >>> loop.run_until_complete(run_in_executor(None, sum, [1, 2, 3]))
+        6
+        >>> loop.close()
+
+    Parameters
+    ----------
+    executor : :class:`Executor<concurrent.futures.Executor>`, optional
+        The executor for calling **func**.
+        If ``None``, use the default executor of the event loop (*i.e.* a thread pool).
+
+    func : :data:`Callable<typing.Callable>`
+        The to-be called function.
+
+    semaphore : :class:`asyncio.Semaphore`, optional
+        If not ``None``, acquire **semaphore** before calling **func**.
+        Can be used for limiting the number of concurrent calls.
+
+    \*args/\**kwargs : :data:`Any<typing.Any>`
+        Further positional and keyword arguments for **func**.
+
+    Returns
+    -------
+    :data:`Any<typing.Any>`
+        The output of **func**.
+
+    """
+    loop = asyncio.get_event_loop()
+    call = functools.partial(func, *args, **kwargs)
+    if semaphore is None:
+        return await loop.run_in_executor(executor, call)
+    async with semaphore:
+        return await loop.run_in_executor(executor, call)
+
+
+async def job_single_point_async(mol: Molecule, *args: Any,
+                                 semaphore: Optional[asyncio.Semaphore] = None,
+                                 **kwargs: Any) -> Optional[Results]:
+    r"""An awaitable variant of :func:`job_single_point()<CAT.jobs.job_single_point>`.
+
+    The job is executed in the default (thread-based) executor of the event loop,
+    the event loop being free to run other tasks while waiting for the job to finish.
+    Note that PLAMS should be initialized beforehand
+    (see :func:`plams.init()<scm.plams.core.functions.init>`).
+
+    Parameters
+    ----------
+    mol : |plams.Molecule|_
+        The molecule for the single point calculation.
+
+    semaphore : :class:`asyncio.Semaphore`, optional
+        If not ``None``, acquire **semaphore** before starting the job.
+        Can be used for limiting the number of concurrently running jobs.
+
+    \*args/\**kwargs : :data:`Any<typing.Any>`
+        Further positional and keyword arguments for
+        :func:`job_single_point()<CAT.jobs.job_single_point>`.
+
+    """
+    return await run_in_executor(None, job_single_point, mol, *args,
+                                 semaphore=semaphore, **kwargs)
+
+
+async def job_geometry_opt_async(mol: Molecule, *args: Any,
+                                 semaphore: Optional[asyncio.Semaphore] = None,
+                                 **kwargs: Any) -> Optional[Results]:
+    r"""An awaitable variant of :func:`job_geometry_opt()<CAT.jobs.job_geometry_opt>`.
+
+    The job is executed in the default (thread-based) executor of the event loop,
+    the event loop being free to run other tasks while waiting for the job to finish.
+    Note that PLAMS should be initialized beforehand
+    (see :func:`plams.init()<scm.plams.core.functions.init>`).
+
+    Parameters
+    ----------
+    mol : |plams.Molecule|_
+        The to-be optimized molecule.
+
+    semaphore : :class:`asyncio.Semaphore`, optional
+        If not ``None``, acquire **semaphore** before starting the job.
+        Can be used for limiting the number of concurrently running jobs.
+
+    \*args/\**kwargs : :data:`Any<typing.Any>`
+        Further positional and keyword arguments for
+        :func:`job_geometry_opt()<CAT.jobs.job_geometry_opt>`.
+
+    """
+    return await run_in_executor(None, job_geometry_opt, mol, *args,
+                                 semaphore=semaphore, **kwargs)
+
+
+def _prep(arg: Settings, return_mol: bool = True) -> bytes:
+    """Call :func:`CAT.base.prep` and pickle its output; used as target by :func:`prep_async`."""
+    return pickle_dumps(prep(arg, return_mol=return_mol))
+
+
+async def prep_async(arg: Settings, return_mol: bool = True, *,
+                     executor: Optional[Executor] = None,
+                     semaphore: Optional[asyncio.Semaphore] = None
+                     ) -> Optional[Tuple[SettingsDataFrame, SettingsDataFrame, SettingsDataFrame]]:
+    """An awaitable variant of :func:`CAT.base.prep`.
+
+    As the PLAMS job manager is global to a given process,
+    :func:`CAT.base.prep` is executed in a separate process.
+    Multiple pipelines can thus be executed concurrently,
+    though pipelines sharing the same :attr:`optional.database.dirname` should be avoided.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> import asyncio
+        >>> from CAT.async_api import prep_async
+
+        >>> async def main(arg_list):
+        ...     semaphore = asyncio.Semaphore(2)
+        ...     coros = [prep_async(arg, semaphore=semaphore) for arg in arg_list]
+        ...     return await asyncio.gather(*coros)
+
+        >>> loop = asyncio.get_event_loop()  # doctest: +SKIP
+        >>> out = loop.run_until_complete(main(arg_list))  # doctest: +SKIP
+
+    Parameters
+    ----------
+    arg : |plams.Settings|_
+        A settings object containing all (optional) arguments.
+
+    return_mol : bool
+        If qd_df, core_df & ligand_df should be returned or not.
+
+    executor : :class:`Executor<concurrent.futures.Executor>`, optional
+        A process-based executor for running :func:`CAT.base.prep`.
+        If ``None``, create a new single-process executor for this call.
+
+    semaphore : :class:`asyncio.Semaphore`, optional
+        If not ``None``, acquire **semaphore** before starting the pipeline.
+        Can be used for limiting the number of concurrently running pipelines.
+
+    Returns
+    -------
+    |CAT.SettingsDataFrame|_
+        Optional: If ``return_mol=True`` return the three QD, core and ligand dataframes.
+
+    """
+    if executor is not None:
+        ret = await run_in_executor(executor, _prep, arg, return_mol, semaphore=semaphore)
+    else:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            ret = await run_in_executor(executor, _prep, arg, return_mol, semaphore=semaphore)
+    return pickle.loads(ret)
@@ -0,0 +1,223 @@
+"""A module with an incrementally updatable uniform-grid cell list.
+
+Index
+-----
+.. currentmodule:: CAT.attachment.cell_list
+.. autosummary::
+    CellList
+
+API
+---
+.. autoclass:: CellList
+    :members:
+
+"""
+
+from typing import Dict, Tuple, List
+from itertools import product
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+__all__ = ['CellList']
+
+#: All 27 offsets of a cell and its (diagonal) neighbours.
+_OFFSETS: Tuple[Tuple[int, int, int], ...] = tuple(product((-1, 0, 1), repeat=3))
+_OFFSETS_AR = np.array(_OFFSETS, dtype=np.int64)
+
+
+class CellList:
+    """A uniform-grid cell list for k-nearest neighbour queries within a fixed distance.
+
+    Contrary to :class:`scipy.spatial.cKDTree`, new points can be cheaply inserted,
+    removed or moved (see :meth:`CellList.insert`, :meth:`CellList.remove` and
+    :meth:`CellList.update`) without having to rebuild the entire index.
+    The edge length of each cell is equal to **distance_upper_bound**,
+    all neighbours of a given point thus being located in
+    its own or one of the 26 surrounding cells.
+
+    Points with non-finite coordinates (*e.g.* the ``nan`` padding of
+    :func:`~CAT.attachment.ligand_attach.sanitize_dim_3`) are stored but otherwise ignored:
+    they are never returned as neighbours and have no neighbours themselves.
+
+    Parameters
+    ----------
+    xyz : :math:`(n, 3)` :class:`numpy.ndarray`
+        The Cartesian coordinates of the initial :math:`n` points.
+
+    distance_upper_bound : :class:`float`
+        The (exclusive) maximum distance of to-be returned neighbours.
+
+    """
+
+    def __init__(self, xyz: np.ndarray, distance_upper_bound: float) -> None:
+        """Initialize a :class:`CellList` instance."""
+        if not distance_upper_bound > 0:
+            raise ValueError("'distance_upper_bound' should be larger than 0; "
+                             f"observed value: {distance_upper_bound!r}")
+        self.distance_upper_bound = float(distance_upper_bound)
+        self._xyz = np.empty((0, 3), dtype=float)
+        self._size = 0
+        self._active = np.empty(0, dtype=bool)
+        self._cells: Dict[Tuple[int, int, int], List[int]] = {}
+        self.insert(xyz)
+
+    def __len__(self) -> int:
+        """Return the number of points in this instance, including removed ones."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """Implement :code:`str(self)` and :code:`repr(self)`."""
+        cls = type(self).__name__
+        return f'{cls}(n={self._size}, distance_upper_bound={self.distance_upper_bound!r})'
+
+    @property
+    def xyz(self) -> np.ndarray:
+        """Get a read-only view of the Cartesian coordinates of all points."""
+        ret = self._xyz[:self._size]
+        ret.setflags(write=False)
+        return ret
+
+    def _get_cells(self, xyz: np.ndarray) -> np.ndarray:
+        """Return the integer cell coordinates of all points in **xyz**."""
+        return np.floor(xyz / self.distance_upper_bound).astype(np.int64)
+
+    def insert(self, xyz: np.ndarray) -> None:
+        """Insert the :math:`(m, 3)` array of Cartesian coordinates **xyz** into this instance.
+
+        The storage of all points is grown geometrically,
+        the cost of :math:`n` inserts thus scaling linearly with :math:`n`.
+
+        """
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        i, j = self._size, self._size + len(xyz)
+
+        # Grow the storage arrays
+        if j > len(self._xyz):
+            size = max(j, 2 * len(self._xyz))
+            xyz_new = np.empty((size, 3), dtype=float)
+            xyz_new[:i] = self._xyz[:i]
+            self._xyz = xyz_new
+            active_new = np.zeros(size, dtype=bool)
+            active_new[:i] = self._active[:i]
+            self._active = active_new
+        self._xyz[i:j] = xyz
+        self._size = j
+        self._add_to_cells(np.arange(i, j))
+
+    def _add_to_cells(self, idx: np.ndarray) -> None:
+        """Assign all points in **idx** to their respective cells."""
+        idx = idx[np.isfinite(self._xyz[idx]).all(axis=1)]
+        cells = self._cells
+        for i, key in zip(idx.tolist(), map(tuple, self._get_cells(self._xyz[idx]).tolist())):
+            try:
+                cells[key].append(i)
+            except KeyError:
+                cells[key] = [i]
+        self._active[idx] = True
+
+    def remove(self, idx: np.ndarray) -> None:
+        """Remove all points in the index array **idx** from this instance.
+
+        Removed points are ignored by :meth:`CellList.query`,
+        but retain their index and can be reinserted with :meth:`CellList.update`.
+
+        """
+        idx = np.asarray(idx, dtype=np.intp).ravel()
+        idx = idx[self._active[idx]]
+        cells = self._cells
+        for i, key in zip(idx.tolist(), map(tuple, self._get_cells(self._xyz[idx]).tolist())):
+            cells[key].remove(i)
+        self._active[idx] = False
+
+    def update(self, idx: np.ndarray, xyz: np.ndarray) -> None:
+        """Move all points in the index array **idx** to the Cartesian coordinates **xyz**.
+
+        Previously removed points are reinserted (see :meth:`CellList.remove`).
+
+        """
+        idx = np.asarray(idx, dtype=np.intp).ravel()
+        self.remove(idx)
+        self._xyz[idx] = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        self._add_to_cells(idx)
+
+    def _get_neighbour_idx(self, cell: Tuple[int, int, int]) -> np.ndarray:
+        """Return the indices of all points in **cell** and its 26 neighbouring cells."""
+        x, y, z = cell
+        get = self._cells.get
+        ret: List[int] = []
+        for i, j, k in _OFFSETS:
+            ret += get((x + i, y + j, z + k), ())
+        return np.array(ret, dtype=np.intp)
+
+    def query_candidates(self, xyz: np.ndarray) -> np.ndarray:
+        """Return the indices of all points in the cells neighbouring any point in **xyz**.
+
+        The returned points are a superset of all points within
+        :attr:`CellList.distance_upper_bound` of **xyz**.
+
+        """
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        cells = np.unique(self._get_cells(xyz[np.isfinite(xyz).all(axis=1)]), axis=0)
+        cells = np.unique((cells[:, None, :] + _OFFSETS_AR).reshape(-1, 3), axis=0)
+
+        get = self._cells.get
+        ret: List[int] = []
+        for key in map(tuple, cells.tolist()):
+            ret += get(key, ())
+        return np.array(ret, dtype=np.intp)
+
+    def query(self, xyz: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the **k** nearest neighbours of all points in **xyz**.
+
+        Equivalent to :meth:`cKDTree.query<scipy.spatial.cKDTree.query>`
+        with the :attr:`CellList.distance_upper_bound` parameter.
+
+        Parameters
+        ----------
+        xyz : :math:`(m, 3)` :class:`numpy.ndarray`
+            The Cartesian coordinates of the to-be queried points.
+
+        k : :class:`int`
+            The number of to-be returned nearest neighbours.
+
+        Returns
+        -------
+        :math:`(m, k)` :class:`numpy.ndarray` & :math:`(m, k)` :class:`numpy.ndarray`
+            The sorted distances to and indices of the **k** nearest neighbours.
+            Missing neighbours are marked by a distance of ``inf`` and
+            an index equal to the number of points in this instance.
+
+        """
+        xyz = np.asarray(xyz, dtype=float).reshape(-1, 3)
+        dist = np.full((len(xyz), k), np.inf)
+        idx = np.full((len(xyz), k), self._size, dtype=np.intp)
+
+        finite = np.isfinite(xyz).all(axis=1)
+        if not finite.all():
+            dist[finite], idx[finite] = self.query(xyz[finite], k=k)
+            return dist, idx
+
+        # Group all points by cell, the neighbours of each cell thus being collected only once
+        cells, inverse = np.unique(self._get_cells(xyz), axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(cells) + 1))
+
+        for n, cell in enumerate(map(tuple, cells.tolist())):
+            idx_other = self._get_neighbour_idx(cell)
+            if not len(idx_other):
+                continue
+
+            i = order[bounds[n]:bounds[n+1]]
+            dist_sub = cdist(xyz[i], self._xyz[idx_other])
+            dist_sub[dist_sub >= self.distance_upper_bound] = np.inf
+
+            j = np.argsort(dist_sub, axis=1, kind='stable')[:, :k]
+            dist_sub = np.take_along_axis(dist_sub, j, axis=1)
+            idx_sub = idx_other[j]
+            idx_sub[dist_sub == np.inf] = self._size
+
+            dist[i, :dist_sub.shape[1]] = dist_sub
+            idx[i, :idx_sub.shape[1]] = idx_sub
+        return dist, idx
@@ -29,6 +29,7 @@ from nanoutils import as_nd_array
 
 from CAT.utils import cycle_accumulate
 from CAT.attachment.edge_distance import edge_dist
+from CAT.attachment.kernels import get_backend, nan_update_arg
 
 __all__ = ['distribute_idx']
 
@@ -270,6 +271,17 @@ def uniform_idx(dist: np.ndarray, operation: str = 'min',
 def _min_or_max(dist_sqr: np.ndarray, dist_1d_sqr: np.ndarray,
                 arg_func: Callable[[np.ndarray], int]) -> Generator[int, None, None]:
     """Helper function for :func:`uniform_idx` if :code:`cluster_size == 1`."""
+    # Fuse the nan-assignment, summation and argmin/argmax into a single JIT-compiled loop
+    if get_backend() == 'numba' and arg_func in (np.nanargmin, np.nanargmax):
+        n = len(dist_1d_sqr) - 1
+        is_min = arg_func is np.nanargmin
+        i = arg_func(dist_1d_sqr) if n > 0 else 0
+        for j in range(n):
+            yield i
+            if j != n - 1:
+                i = nan_update_arg(dist_sqr, dist_1d_sqr, i, is_min)
+        return
+
     for _ in range(len(dist_1d_sqr)-1):
         i = arg_func(dist_1d_sqr)
         dist_1d_sqr[i] = np.nan
@@ -0,0 +1,193 @@
+"""Optionally JIT-compiled kernels for the hot loops of the ligand attachment.
+
+The kernels herein are compiled with Numba_ if it is installed,
+in which case the ``"numba"`` backend is used by default.
+The plain NumPy implementations (*i.e.* the ``"numpy"`` backend) are used otherwise.
+The backend can be manually changed with :func:`set_backend`,
+*e.g.* for comparing the results of both backends.
+
+.. _Numba: https://numba.pydata.org
+
+Index
+-----
+.. currentmodule:: CAT.attachment.kernels
+.. autosummary::
+    get_backend
+    set_backend
+    weighted_dist
+    nan_update_arg
+
+API
+---
+.. autofunction:: get_backend
+.. autofunction:: set_backend
+.. autofunction:: weighted_dist
+.. autofunction:: nan_update_arg
+
+"""
+
+import math
+from typing import Optional, Callable, TypeVar, Any
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA: Optional[ImportError] = None
+except ImportError as ex:
+    NUMBA = ex
+
+    FT = TypeVar('FT', bound=Callable[..., Any])
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[FT], FT]:
+        """Return the decorated function unaltered if Numba is not installed."""
+        return lambda func: func
+
+__all__ = ['get_backend', 'set_backend', 'weighted_dist', 'nan_update_arg']
+
+#: All accepted backends.
+BACKENDS = frozenset({'numpy', 'numba'})
+
+_BACKEND = 'numba' if NUMBA is None else 'numpy'
+
+
+def get_backend() -> str:
+    """Return the currently used backend; either ``"numba"`` or ``"numpy"``."""
+    return _BACKEND
+
+
+def set_backend(backend: str) -> None:
+    """Set the backend used for the hot loops of the ligand attachment.
+
+    Parameters
+    ----------
+    backend : :class:`str`
+        The name of the backend.
+        Accepted values are ``"numba"`` and ``"numpy"``.
+
+    Raises
+    ------
+    ImportError
+        Raised if ``backend="numba"`` and Numba is not installed.
+
+    """
+    global _BACKEND
+    if backend not in BACKENDS:
+        raise ValueError("'backend' expected either 'numba' or 'numpy'; "
+                         f"observed value: {backend!r}")
+    elif backend == 'numba' and NUMBA is not None:
+        raise ImportError("The 'numba' backend requires the Numba package") from NUMBA
+    _BACKEND = backend
+
+
+@njit(cache=True)
+def weighted_dist(xyz: np.ndarray, xyz_other: np.ndarray,
+                  distance_upper_bound: float, k: int = 10) -> np.ndarray:
+    r"""Compute the weighted distance of all :math:`b` rotamers in **xyz** with respect to **xyz_other**.
+
+    The weighted distance of a rotamer is defined as :math:`\sum e^{-d}`,
+    the summation running over, for each atom, the distance :math:`d` to its **k**
+    nearest neighbours in **xyz_other** that are closer than **distance_upper_bound**.
+    Atoms with ``nan`` coordinates (*i.e.* padding) do not contribute.
+    Equivalent to the NumPy-based scoring of
+    :func:`rotation_check_kdtree()<CAT.attachment.ligand_attach.rotation_check_kdtree>`,
+    but without creating any temporary distance arrays.
+
+    Parameters
+    ----------
+    xyz : :math:`(b, n, 3)` :class:`numpy.ndarray`
+        The Cartesian coordinates of :math:`b` rotamers with :math:`n` atoms each.
+
+    xyz_other : :math:`(p, 3)` :class:`numpy.ndarray`
+        The Cartesian coordinates of all (potential) neighbours.
+
+    distance_upper_bound : :class:`float`
+        The (exclusive) maximum distance of to-be considered neighbours.
+
+    k : :class:`int`
+        The maximum number of to-be considered neighbours per atom.
+
+    Returns
+    -------
+    :math:`(b,)` :class:`numpy.ndarray`
+        The weighted distance of all :math:`b` rotamers.
+
+    """  # noqa
+    b, n, _ = xyz.shape
+    p = len(xyz_other)
+    ret = np.zeros(b)
+    buffer = np.empty(k)
+
+    for i in range(b):
+        total = 0.0
+        for j in range(n):
+            # Keep a sorted buffer with the (at most) k smallest distances
+            m = 0
+            x, y, z = xyz[i, j, 0], xyz[i, j, 1], xyz[i, j, 2]
+            for q in range(p):
+                dx = x - xyz_other[q, 0]
+                dy = y - xyz_other[q, 1]
+                dz = z - xyz_other[q, 2]
+                d = math.sqrt(dx * dx + dy * dy + dz * dz)
+                if not d < distance_upper_bound or (m == k and d >= buffer[k - 1]):
+                    continue  # Note that the former also catches ``nan``
+
+                pos = m if m < k else k - 1
+                while pos > 0 and buffer[pos - 1] > d:
+                    buffer[pos] = buffer[pos - 1]
+                    pos -= 1
+                buffer[pos] = d
+                if m < k:
+                    m += 1
+
+            for q in range(m):
+                total += math.exp(-buffer[q])
+        ret[i] = total
+    return ret
+
+
+@njit(cache=True)
+def nan_update_arg(dist_sqr: np.ndarray, dist_1d_sqr: np.ndarray,
+                   i: int, is_min: bool = True) -> int:
+    """Perform a single iteration of :func:`uniform_idx()<CAT.attachment.distribution.uniform_idx>`.
+
+    Sets element **i** of **dist_1d_sqr** to ``nan``, adds row **i** of **dist_sqr** to it
+    and returns the index of its (``nan``-ignoring) minimum or maximum.
+    Performs an inplace update of **dist_1d_sqr**.
+
+    Parameters
+    ----------
+    dist_sqr : :math:`(n, n)` :class:`numpy.ndarray`
+        The (weighted) distance matrix.
+
+    dist_1d_sqr : :math:`(n,)` :class:`numpy.ndarray`
+        The summed distances of all previously selected indices.
+
+    i : :class:`int`
+        The previously selected index.
+
+    is_min : :class:`bool`
+        Whether to return the index of the minimum (equivalent to :func:`numpy.nanargmin`)
+        or maximum (equivalent to :func:`numpy.nanargmax`).
+
+    Returns
+    -------
+    :class:`int`
+        The next index.
+
+    """  # noqa
+    dist_1d_sqr[i] = np.nan
+    ret = -1
+    best = 0.0
+    for j in range(len(dist_1d_sqr)):
+        value = dist_1d_sqr[j] + dist_sqr[i, j]
+        dist_1d_sqr[j] = value
+        if value != value:  # i.e. nan
+            continue
+        elif ret == -1 or (value < best if is_min else value > best):
+            ret = j
+            best = value
+
+    if ret == -1:
+        raise ValueError("All-NaN slice encountered")
+    return ret
@@ -42,7 +42,7 @@ import scm.plams.interfaces.molecule.rdkit as molkit
 from rdkit.Chem import AllChem
 from scm.plams.core.basejob import Job
 from scm.plams import (Molecule, Atom, Bond, MoleculeError, add_to_class, Units,
-                       Settings, AMSJob, ADFJob, Cp2kJob)
+                       Settings, AMSJob, ADFJob, Cp2kJob, JobRunner)
 
 from .mol_split_cm import SplitMol
 from .remove_atoms_cm import RemoveAtoms
@@ -52,7 +52,7 @@ from ..workflows import WorkFlow, MOL
 from ..mol_utils import fix_carboxyl, to_atnum
 from ..settings_dataframe import SettingsDataFrame
 from ..data_handling.mol_to_file import mol_to_file
-from ..jobs import job_geometry_opt  # noqa: F401
+from ..jobs import job_geometry_opt, map_parallel_jobs  # noqa: F401
 
 __all__ = ['init_ligand_opt']
 
@@ -69,6 +69,11 @@ def init_ligand_opt(ligand_df: SettingsDataFrame) -> None:
     if not ligand_df.settings.optional.ligand.optimize:
         return None
 
+    # PLAMS jobs are managed by the (process-specific) default job manager;
+    # only distribute the RDKit UFF optimizations over multiple processes
+    if workflow.jobs[-1] is not None:
+        workflow.n_workers = 1
+
     # Start the ligand optimization
     workflow(start_ligand_jobs, ligand_df, columns=[], index=idx)
 
@@ -110,7 +115,7 @@ CHARGE_FUNC_MAPPING: Mapping[Type[Job], ChargeFunc] = MappingProxyType({
 def start_ligand_jobs(ligand_list: Iterable[Molecule],
                       jobs: Iterable[Optional[Type[Job]]],
                       settings: Iterable[Optional[Settings]],
-                      use_ff: bool = False, **kwargs) -> None:
+                      use_ff: bool = False, max_parallel_jobs: int = 1, **kwargs) -> None:
     """Loop over all molecules in ``ligand_df.loc[idx]`` and perform geometry optimizations."""
     _j1, job = jobs
     _s1, s = settings
@@ -124,26 +129,33 @@ def start_ligand_jobs(ligand_list: Iterable[Molecule],
         _start_ligand_jobs_uff(ligand_list)
     else:
         charge_func = CHARGE_FUNC_MAPPING[job]
-        _start_ligand_jobs_plams(ligand_list, job, s, charge_func)
+        _start_ligand_jobs_plams(ligand_list, job, s, charge_func, max_parallel_jobs)
     return None
 
 
 def _start_ligand_jobs_plams(ligand_list: Iterable[Molecule],
                              job: Type[Job], settings: Settings,
-                             charge_func: ChargeFunc) -> None:
+                             charge_func: ChargeFunc, max_parallel_jobs: int = 1) -> None:
     """Loop over all molecules in ``ligand_df.loc[idx]`` and perform geometry optimizations."""
-    for ligand in ligand_list:
-        try:
-            optimize_ligand(ligand)
-        except Exception as ex:
-            logger.debug(f'{ex.__class__.__name__}: {ex}', exc_info=True)
-            ligand.properties.is_opt = False
-            continue
+    map_parallel_jobs(_ligand_job_plams, ligand_list, job, settings, charge_func,
+                      max_parallel_jobs=max_parallel_jobs)
+    return None
+
+
+def _ligand_job_plams(ligand: Molecule, job: Type[Job], settings: Settings,
+                      charge_func: ChargeFunc, jobrunner: Optional[JobRunner] = None) -> None:
+    """Perform a geometry optimization of a single ligand; see :func:`_start_ligand_jobs_plams`."""
+    try:
+        optimize_ligand(ligand)
+    except Exception as ex:
+        logger.debug(f'{ex.__class__.__name__}: {ex}', exc_info=True)
+        ligand.properties.is_opt = False
+        return None
 
-        s = Settings(settings)
-        charge_func(s, int(sum(at.properties.get('charge', 0) for at in ligand)))
-        ligand.job_geometry_opt(job, s, name='ligand_opt')
-        ligand.round_coords()  # `.is_opt = True` is set by `ligand.job_geometry_opt()``
+    s = Settings(settings)
+    charge_func(s, int(sum(at.properties.get('charge', 0) for at in ligand)))
+    ligand.job_geometry_opt(job, s, name='ligand_opt', jobrunner=jobrunner)
+    ligand.round_coords()  # `.is_opt = True` is set by `ligand.job_geometry_opt()``
     return None
 
 
@@ -22,10 +22,10 @@ API
 
 from typing import Tuple, Iterable, Optional, Type, NoReturn, Any
 
-from scm.plams import Molecule, Settings, AMSJob
+from scm.plams import Molecule, Settings, AMSJob, JobRunner
 from scm.plams.core.basejob import Job
 
-from ..jobs import job_geometry_opt  # noqa: F401
+from ..jobs import job_geometry_opt, map_parallel_jobs  # noqa: F401
 from ..workflows import WorkFlow, MOL, JOB_SETTINGS_QD_OPT
 from ..mol_utils import fix_carboxyl, fix_h
 from ..settings_dataframe import SettingsDataFrame
@@ -64,15 +64,27 @@ def init_qd_opt(qd_df: SettingsDataFrame) -> None:
 
 def start_qd_opt(mol_list: Iterable[Molecule],
                  jobs: Tuple[Optional[Type[Job]], ...], settings: Tuple[Optional[Settings], ...],
-                 use_ff: bool = False, **kwargs) -> None:
-    """Loop over all molecules in **mol_list** and perform geometry optimizations."""
+                 use_ff: bool = False, max_parallel_jobs: int = 1, **kwargs) -> None:
+    """Loop over all molecules in **mol_list** and perform geometry optimizations.
+
+    At most **max_parallel_jobs** molecules are optimized concurrently;
+    the jobs of each individual molecule are always executed in order.
+
+    """
+    mol_list = list(mol_list)
     for mol in mol_list:
         mol.properties.job_path = []
-        qd_opt(mol, jobs, settings, use_ff=use_ff)
+
+    # The forcefield-based optimizations of Nano-CAT are restricted to the default job runner
+    if use_ff:
+        max_parallel_jobs = 1
+    map_parallel_jobs(qd_opt, mol_list, jobs, settings, use_ff=use_ff,
+                      max_parallel_jobs=max_parallel_jobs)
 
 
 def qd_opt(mol: Molecule, jobs: Tuple[Optional[Type[Job]], ...],
-           settings: Tuple[Optional[Settings], ...], use_ff: bool = False) -> None:
+           settings: Tuple[Optional[Settings], ...], use_ff: bool = False,
+           jobrunner: Optional[JobRunner] = None) -> None:
     """Perform an optimization of the quantum dot.
 
     Performs an inplace update of **mol**.
@@ -89,6 +101,10 @@ def qd_opt(mol: Molecule, jobs: Tuple[Optional[Type[Job]], ...],
     forcefield : bool
         If ``True``, perform the job with CP2K with a user-specified forcefield.
 
+    jobrunner : :class:`JobRunner<scm.plams.core.jobrunner.JobRunner>`, optional
+        The job runner for executing the jobs.
+        If ``None``, use the default job runner.
+
     """
     # Prepare the job settings
     if use_ff:
@@ -108,12 +124,12 @@ def qd_opt(mol: Molecule, jobs: Tuple[Optional[Type[Job]], ...],
         s2.input.ams.constraints.atom = mol.properties.indices
 
     # Run the first job and fix broken angles
-    mol.job_geometry_opt(job1, s1, name='QD_opt_part1')
+    mol.job_geometry_opt(job1, s1, name='QD_opt_part1', jobrunner=jobrunner)
     fix_carboxyl(mol)
     fix_h(mol)
     mol.round_coords()
 
     # Run the second job
-    mol.job_geometry_opt(job2, s2, name='QD_opt_part2')
+    mol.job_geometry_opt(job2, s2, name='QD_opt_part2', jobrunner=jobrunner)
     mol.round_coords()
     return None
@@ -1,7 +1,10 @@
 """Substitution symmetry."""
 
+from typing import Optional, Tuple, List
+
 import numpy as np
 import pandas as pd
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 
 from scm.plams import Molecule
@@ -9,7 +12,7 @@ from scm.plams.tools.geometry import rotation_matrix
 
 from ..logger import logger
 
-__all__ = ['del_equiv_structures']
+__all__ = ['del_equiv_structures', 'get_symmetry_operations', 'get_anchor_orbits']
 
 
 def find_equivalent_atoms(mol, idx=None, idx_substract=0):
@@ -317,3 +320,150 @@ def symm_permutations(condition, elements):
         final = []
         final = [a, b]
     return final
+
+
+def _axis_rotation(axis: np.ndarray, angle: float) -> np.ndarray:
+    """Return the matrix for rotating column vectors about the unit vector **axis** by **angle** radian."""  # noqa
+    v1, v2, v3 = axis
+    w = np.array([[0, -v3, v2],
+                  [v3, 0, -v1],
+                  [-v2, v1, 0]], dtype=float)
+    return np.identity(3) + np.sin(angle) * w + (1 - np.cos(angle)) * w @ w
+
+
+def _get_permutation(tree: cKDTree, rotmat: np.ndarray, tol: float,
+                     atnum: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+    """Return the permutation of the points in **tree** under **rotmat** or ``None`` if it is not a symmetry operation."""  # noqa
+    dist, idx = tree.query(tree.data @ rotmat.T, distance_upper_bound=tol)
+    if not np.isfinite(dist).all() or len(np.unique(idx)) != len(idx):
+        return None
+    elif atnum is not None and (atnum[idx] != atnum).any():
+        return None
+    return idx
+
+
+def get_symmetry_operations(mol: Molecule, tol: float = 0.1, n_max: int = 8,
+                            axes: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    r"""Find all proper rotations, besides the identity, that map **mol** onto itself.
+
+    All candidate rotation axes pass through the centroid of **mol**,
+    consisting of its three principal axes and, optionally, all vectors in **axes**.
+    For each axis, rotations by :math:`2 \pi k / n` radian are considered for all
+    :math:`n` smaller than or equal to **n_max**.
+    A rotation is accepted if every atom is mapped onto an atom of the same element.
+    Improper rotations (*e.g.* reflections) are not considered,
+    as these invert the chirality of any ligand attached to **mol**.
+
+    Parameters
+    ----------
+    mol : |plams.Molecule|
+        A PLAMS molecule.
+    tol : float
+        The maximum distance (Angstrom) between an atom and its symmetry-equivalent image.
+    n_max : int
+        The maximum order of the to-be considered rotation axes.
+    axes : |np.ndarray|, optional
+        An array with additional candidate rotation axes of shape :math:`(k, 3)`.
+
+    Returns
+    -------
+    |np.ndarray| and |np.ndarray|
+        The centroid of **mol** and an array of shape :math:`(g, 3, 3)`
+        with all :math:`g` rotation matrices.
+        The matrices act on column vectors, relative to the centroid.
+
+    """
+    xyz = mol.as_array()
+    atnum = np.array([at.atnum for at in mol])
+    center = xyz.mean(axis=0)
+    xyz -= center
+
+    # Gather all unique candidate rotation axes
+    _, principal_axes = np.linalg.eigh(xyz.T @ xyz)
+    axes_all = principal_axes.T if axes is None else np.vstack([principal_axes.T, axes])
+    axes_unique: List[np.ndarray] = []
+    for axis in axes_all:
+        norm = np.linalg.norm(axis)
+        if norm < 1e-8:
+            continue
+        axis = axis / norm
+        if all(abs(axis @ u) < 1 - 1e-6 for u in axes_unique):
+            axes_unique.append(axis)
+
+    # Duplicate operations (e.g. from anti-parallel axes) are identified by their permutation
+    tree = cKDTree(xyz)
+    fractions = sorted({k / n for n in range(2, n_max + 1) for k in range(1, n)})
+    ret: List[np.ndarray] = []
+    perm_set = set()
+    for axis in axes_unique:
+        for frac in fractions:
+            rotmat = _axis_rotation(axis, 2 * np.pi * frac)
+            perm = _get_permutation(tree, rotmat, tol, atnum)
+            if perm is not None and perm.tobytes() not in perm_set:
+                perm_set.add(perm.tobytes())
+                ret.append(rotmat)
+    return center, np.array(ret).reshape(-1, 3, 3)
+
+
+def get_anchor_orbits(mol: Molecule, anchor: np.ndarray, tol: float = 0.1,
+                      n_max: int = 8) -> Tuple[np.ndarray, List[Tuple[np.ndarray, np.ndarray]]]:
+    """Partition all anchors of **mol** into orbits of symmetry-equivalent anchors.
+
+    The symmetry operations of **mol** are identified with :func:`get_symmetry_operations`,
+    only keeping the operations that map the anchors onto each other.
+
+    Parameters
+    ----------
+    mol : |plams.Molecule|
+        A PLAMS molecule.
+    anchor : |np.ndarray|
+        An array of shape :math:`(m, 3)` with the Cartesian coordinates of all anchors.
+    tol : float
+        The maximum distance (Angstrom) between an atom and its symmetry-equivalent image.
+    n_max : int
+        The maximum order of the to-be considered rotation axes.
+
+    Returns
+    -------
+    |np.ndarray| and |list|
+        The centroid of **mol** and a list with one tuple for each orbit.
+        Each tuple contains an array with the (0-based) indices of all anchors in the orbit
+        and an array of shape :math:`(o, 3, 3)` with the rotation matrices that map
+        the first anchor (the orbit's representative) onto each respective anchor.
+
+    """
+    # The vectors connecting the centroid and all anchors are used as candidate rotation axes
+    anchor = np.asarray(anchor, dtype=float)
+    axes = anchor - mol.as_array().mean(axis=0)
+    center, rotmat_all = get_symmetry_operations(mol, tol, n_max, axes=axes)
+    anchor = anchor - center
+
+    # Only keep the operations that map the anchors onto each other
+    tree = cKDTree(anchor)
+    rotmat_list, perm_list = [], []
+    for rotmat in rotmat_all:
+        perm = _get_permutation(tree, rotmat, tol)
+        if perm is not None:
+            rotmat_list.append(rotmat)
+            perm_list.append(perm)
+
+    # Perform a breadth-first search for all anchors reachable from the orbit's representative
+    visited = np.zeros(len(anchor), dtype=bool)
+    ret = []
+    for i in range(len(anchor)):
+        if visited[i]:
+            continue
+        visited[i] = True
+        idx, mat = [i], [np.identity(3)]
+        j = 0
+        while j < len(idx):
+            u, mat_u = idx[j], mat[j]
+            j += 1
+            for rotmat, perm in zip(rotmat_list, perm_list):
+                v = perm[u]
+                if not visited[v]:
+                    visited[v] = True
+                    idx.append(v)
+                    mat.append(rotmat @ mat_u)
+        ret.append((np.array(idx), np.array(mat)))
+    return center, ret
@@ -23,17 +23,19 @@ API
 """
 
 from time import time
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Callable, Iterable, List
 
 import numpy as np
 import pandas as pd
 
-from scm.plams import Settings, MoleculeError
+from scm.plams import Settings, Molecule, MoleculeError
 
 from .__version__ import __version__
 
 from .logger import logger
 from .mol_utils import to_symbol
+from .timing import TIMING_REPORT, _TimingCounter
+from .scheduler import Stage, run_stages
 from .settings_dataframe import SettingsDataFrame
 
 from .data_handling.mol_import import read_mol
@@ -95,6 +97,7 @@ def prep(arg: Settings, return_mol: bool = True
     """
     # The start
     time_start = time()
+    TIMING_REPORT.clear()
     logger.info(f'Starting CAT (version: {__version__})')
     if NANO_CAT is None:
         logger.info(f'The optional Nano-CAT package was successfully found '
@@ -113,16 +116,22 @@ def prep(arg: Settings, return_mol: bool = True
     # Interpret and extract the input settings
     ligand_df, core_df, qd_df = prep_input(arg)
 
-    if qd_df is None:
-        # Adds the indices of the core dummy atoms to core.properties.core
-        core_df = prep_core(core_df)
+    try:
+        if qd_df is None:
+            # Adds the indices of the core dummy atoms to core.properties.core
+            core_df = _checkpoint_stage('core', prep_core, core_df)
 
-        # Optimize the ligands, find functional groups, calculate properties
-        # and read/write the results
-        ligand_df = prep_ligand(ligand_df)
+            # Optimize the ligands, find functional groups, calculate properties
+            # and read/write the results
+            ligand_df = _checkpoint_stage('ligand', prep_ligand, ligand_df)
 
-    # Combine the cores and ligands; analyze the resulting quantum dots
-    qd_df = prep_qd(ligand_df, core_df, qd_df)
+        # Combine the cores and ligands; analyze the resulting quantum dots
+        qd_df = _checkpoint_stage('qd', prep_qd, ligand_df, core_df, qd_df)
+
+    # Export the timings, even if the run is interrupted
+    finally:
+        logger.info(f'Timing report:\n{TIMING_REPORT.to_dataframe().to_string(index=False)}\n')
+        TIMING_REPORT.export(arg.path)
 
     # The End
     delta_t = time() - time_start
@@ -133,6 +142,28 @@ def prep(arg: Settings, return_mol: bool = True
     return None
 
 
+def _checkpoint_stage(stage: str, func: Callable[..., SettingsDataFrame],
+                      *args: Optional[SettingsDataFrame]) -> SettingsDataFrame:
+    """Call **func** with **args** or, if available, load its result from a checkpoint.
+
+    The (new) result of **func** is checkpointed if ``optional.checkpoint`` has been specified.
+
+    """
+    settings = next(df for df in args if df is not None).settings
+    checkpoint = settings.optional.checkpoint
+    if checkpoint is None:
+        return func(*args)
+
+    df = checkpoint.load(stage)
+    if df is not None:
+        logger.info(f"Loading the {stage} stage from a checkpoint; skipping to the next stage\n")
+        return SettingsDataFrame(df, settings=settings)
+
+    ret = func(*args)
+    checkpoint.save(stage, ret)
+    return ret
+
+
 def prep_input(arg: Settings) -> Tuple[SettingsDataFrame, SettingsDataFrame, SettingsDataFrame]:
     """Interpret and extract the input settings. Returns a list of ligands and a list of cores.
 
@@ -151,9 +182,10 @@ def prep_input(arg: Settings) -> Tuple[SettingsDataFrame, SettingsDataFrame, Set
     validate_input(arg)
 
     # Read the input ligands and cores
-    lig_list = read_mol(arg.input_ligands)
-    core_list = read_mol(arg.input_cores)
-    qd_list = read_mol(arg.input_qd)
+    with TIMING_REPORT.record('prep_input') as counter:
+        lig_list = _read_mol(arg.input_ligands, counter)
+        core_list = _read_mol(arg.input_cores, counter)
+        qd_list = _read_mol(arg.input_qd, counter)
     del arg.input_ligands
     del arg.input_cores
     del arg.input_qd
@@ -192,6 +224,21 @@ def prep_input(arg: Settings) -> Tuple[SettingsDataFrame, SettingsDataFrame, Set
     return ligand_df, core_df, qd_df
 
 
+def _read_mol(input_mol: Iterable[Settings], counter: _TimingCounter) -> List[Molecule]:
+    """Call :func:`.read_mol` and update the molecule and failure count of **counter**.
+
+    Entries in **input_mol** which failed to produce any molecules are marked as failed.
+
+    """
+    ret = []
+    for mol_dict in input_mol:
+        mol_list = read_mol([mol_dict])
+        counter.n_failed += not mol_list
+        ret += mol_list
+    counter.n_mol += len(ret)
+    return ret
+
+
 # TODO: Move this function to its own module; this is a workflow and NOT a workflow manager
 def prep_core(core_df: SettingsDataFrame) -> SettingsDataFrame:
     """Function that handles the identification and marking of all core dummy atoms.
@@ -211,38 +258,39 @@ def prep_core(core_df: SettingsDataFrame) -> SettingsDataFrame:
     dummy = core_df.settings.optional.core.dummy
     subset = core_df.settings.optional.core.subset
 
-    idx_tuples = []
-    for core in core_df[MOL]:
-        # Checks the if the dummy is a string (atomic symbol) or integer (atomic number)
-        formula = core.get_formula()
-
-        # Returns the indices of all dummy atom ligand placeholders in the core
-        if not core.properties.dummies:
-            at_idx = np.array([i for i, atom in enumerate(core) if atom.atnum == dummy])
-        else:
-            dummies = core.properties.dummies
-            at_idx = np.fromiter(dummies, count=len(dummies), dtype=int)
-            at_idx -= 1
-        if subset:
-            at_idx = distribute_idx(core, at_idx, **subset)
-
-        # Convert atomic indices into Atoms
-        at_idx += 1
-        at_idx.sort()
-        core.properties.dummies = dummies = [core[i] for i in at_idx]
-
-        # Returns an error if no dummy atoms were found
-        if not dummies:
-            raise MoleculeError(f"{repr(to_symbol(dummy))} was specified as core dummy atom, yet "
-                                f"no matching atoms were found in {core.properties.name} "
-                                f"(formula: {formula})")
-
-        # Delete all core dummy atoms
-        for at in dummies:
-            core.delete_atom(at)
-        idx_tuples.append(
-            (formula, ' '.join(at_idx.astype(str)))
-        )
+    with TIMING_REPORT.record('prep_core', n_mol=len(core_df)):
+        idx_tuples = []
+        for core in core_df[MOL]:
+            # Checks the if the dummy is a string (atomic symbol) or integer (atomic number)
+            formula = core.get_formula()
+
+            # Returns the indices of all dummy atom ligand placeholders in the core
+            if not core.properties.dummies:
+                at_idx = np.array([i for i, atom in enumerate(core) if atom.atnum == dummy])
+            else:
+                dummies = core.properties.dummies
+                at_idx = np.fromiter(dummies, count=len(dummies), dtype=int)
+                at_idx -= 1
+            if subset:
+                at_idx = distribute_idx(core, at_idx, **subset)
+
+            # Convert atomic indices into Atoms
+            at_idx += 1
+            at_idx.sort()
+            core.properties.dummies = dummies = [core[i] for i in at_idx]
+
+            # Returns an error if no dummy atoms were found
+            if not dummies:
+                raise MoleculeError(f"{repr(to_symbol(dummy))} was specified as core dummy atom, "
+                                    f"yet no matching atoms were found in {core.properties.name} "
+                                    f"(formula: {formula})")
+
+            # Delete all core dummy atoms
+            for at in dummies:
+                core.delete_atom(at)
+            idx_tuples.append(
+                (formula, ' '.join(at_idx.astype(str)))
+            )
 
     # Create and return a new dataframe
     idx = pd.MultiIndex.from_tuples(idx_tuples, names=['formula', 'anchor'])
@@ -283,6 +331,7 @@ def prep_ligand(ligand_df: SettingsDataFrame) -> SettingsDataFrame:
     optimize = ligand_df.settings.optional.ligand.optimize
     crs = ligand_df.settings.optional.ligand.crs
     cdft = ligand_df.settings.optional.ligand.cdft
+    max_parallel_stages = ligand_df.settings.optional.max_parallel_stages
 
     # Identify functional groups within the ligand.
     ligand_df = init_ligand_anchoring(ligand_df)
@@ -303,22 +352,26 @@ def prep_ligand(ligand_df: SettingsDataFrame) -> SettingsDataFrame:
         for lig in ligand_df[MOL]:
             allign_axis(lig, lig.properties.dummies)
 
+    # The remaining workflows depend only on the (optimized) ligands
+    stages = []
+
     # Perform a COSMO-RS calculation on the ligands
     if crs:
         val_nano_cat("Ligand COSMO-RS calculations require the nano-CAT package")
-        init_solv(ligand_df)
+        stages.append(Stage('crs', init_solv))
 
     # Assign CHARMM CGenFF atom types to all ligands
     if forcefield:
         val_nano_cat("Automatic ligand forcefield assignment requires MATCH "
                      "(Multipurpose Atom-Typer for CHARMM) and the nano-CAT package")
-        init_ff_assignment(ligand_df)
+        stages.append(Stage('forcefield', init_ff_assignment, modifies_mol=True))
 
     # Run conceptual DFT calculations
     if cdft:
         val_nano_cat("Ligand conceptual DFT calculations require the nano-CAT package")
-        init_cdft(ligand_df)
+        stages.append(Stage('cdft', init_cdft))
 
+    run_stages(ligand_df, stages, max_workers=max_parallel_stages)
     return ligand_df
 
 
@@ -332,6 +385,10 @@ def prep_qd(ligand_df: Optional[SettingsDataFrame],
     * Peforming activation strain analyses
     * Dissociating ligands on the quantum dot surface
 
+    If ``optional.qd.chunk_size`` is specified then the quantum dots are constructed and
+    processed in chunks, the molecules of each chunk being discarded afterwards.
+    In this case the *mol* column of the returned dataframe is filled with ``None``.
+
     .. _Nano-CAT: https://github.com/nlesc-nano/nano-CAT
 
     Has two accepted signatures:
@@ -363,17 +420,14 @@ def prep_qd(ligand_df: Optional[SettingsDataFrame],
 
     """
     # Unpack arguments
-    bulk = ligand_df.settings.optional.qd.bulkiness
-    optimize = ligand_df.settings.optional.qd.optimize
-    forcefield = ligand_df.settings.optional.forcefield
-    dissociate = ligand_df.settings.optional.qd.dissociate
-    activation_strain = ligand_df.settings.optional.qd.activation_strain
     construct_qd = ligand_df.settings.optional.qd.construct_qd
-    multi_ligand = ligand_df.settings.optional.qd.multi_ligand
+    chunk_size = ligand_df.settings.optional.qd.chunk_size
 
     # Construct the quantum dot DataFrame
     # If construct_qd is False, construct the dataframe without filling it with quantum dots
-    if qd_df is None:  # Construct new quantum dots
+    if qd_df is None and construct_qd and chunk_size is not None:  # Construct in chunks
+        return _prep_qd_chunked(ligand_df, core_df, chunk_size)
+    elif qd_df is None:  # Construct new quantum dots
         qd_df = init_qd_construction(ligand_df, core_df, construct_qd=construct_qd)
     elif ligand_df is core_df is None:  # Update existing quantum dots
         update_qd_df(qd_df)
@@ -381,13 +435,74 @@ def prep_qd(ligand_df: Optional[SettingsDataFrame],
         raise TypeError("Either qd_df must be 'None' or ligand_df "
                         " and core_df must both be 'None'")
 
-    # Start the ligand bulkiness workflow
+    return _prep_qd_workflows(qd_df, ligand_df, core_df)
+
+
+def _prep_qd_chunked(ligand_df: SettingsDataFrame, core_df: SettingsDataFrame,
+                     chunk_size: int) -> SettingsDataFrame:
+    """Construct and process all quantum dots in chunks of at most **chunk_size** molecules.
+
+    Each chunk is passed through the entirety of :func:`prep_qd`,
+    including the database and :func:`.mol_to_file` exports,
+    after which its molecules are discarded.
+    The peak memory usage is thus dictated by **chunk_size** rather than
+    the total number of quantum dots.
+
+    Returns
+    -------
+    |CAT.SettingsDataFrame|_
+        A dataframe of quantum dots.
+        Note that the *mol* column is filled with ``None``.
+
+    """
+    # Construct an empty dataframe spanning all core/ligand combinations
+    qd_df = init_qd_construction(ligand_df, core_df, construct_qd=False)
+    n = len(qd_df)
+    logger.info(f'Processing {n} quantum dots in chunks of (at most) {chunk_size} molecules')
+
+    df_list = []
+    is_valid = False
+    chunks = range(0, n, chunk_size)
+    for j, i in enumerate(chunks, 1):
+        logger.info(f'Starting quantum dot chunk {j} / {len(chunks)}')
+        chunk_df = qd_df.iloc[i:i + chunk_size].copy()
+        chunk_df = init_qd_construction(ligand_df, core_df, qd_df=chunk_df)
+        if chunk_df[MOL].any():
+            is_valid = True
+            chunk_df = _prep_qd_workflows(chunk_df, ligand_df, core_df)
+
+        # Free the quantum dots; keep all other results
+        chunk_df[MOL] = None
+        df_list.append(chunk_df)
+        del chunk_df
+
+    if not is_valid:
+        raise MoleculeError('No valid quantum dots found, aborting')
+    return SettingsDataFrame(pd.concat(df_list, sort=False), settings=qd_df.settings)
+
+
+def _prep_qd_workflows(qd_df: SettingsDataFrame, ligand_df: Optional[SettingsDataFrame],
+                       core_df: Optional[SettingsDataFrame]) -> SettingsDataFrame:
+    """Run all quantum dot workflows on the (constructed) quantum dots in **qd_df**."""
+    # Unpack arguments
+    bulk = qd_df.settings.optional.qd.bulkiness
+    optimize = qd_df.settings.optional.qd.optimize
+    forcefield = qd_df.settings.optional.forcefield
+    dissociate = qd_df.settings.optional.qd.dissociate
+    activation_strain = qd_df.settings.optional.qd.activation_strain
+    construct_qd = qd_df.settings.optional.qd.construct_qd
+    multi_ligand = qd_df.settings.optional.qd.multi_ligand
+    max_parallel_stages = qd_df.settings.optional.max_parallel_stages
+
+    # Start the ligand bulkiness workflow; it does not depend on any of the other workflows
+    stages = []
     if bulk:
         val_nano_cat("Ligand bulkiness calculations require the nano-CAT package")
-        init_lig_bulkiness(qd_df, ligand_df, core_df)
+        stages.append(Stage('bulkiness', init_lig_bulkiness, args=(ligand_df, core_df)))
 
     # Skip the actual quantum dot construction
     if not construct_qd:
+        run_stages(qd_df, stages, max_workers=max_parallel_stages)
         return qd_df
 
     if not qd_df[MOL].any():
@@ -399,23 +514,24 @@ def prep_qd(ligand_df: Optional[SettingsDataFrame],
 
     # Optimize the qd with the core frozen
     if optimize:
-        init_qd_opt(qd_df)
+        stages.append(Stage('qd_opt', init_qd_opt, modifies_mol=True))
 
     if multi_ligand:
-        init_multi_ligand(qd_df)
+        stages.append(Stage('multi_ligand', init_multi_ligand, requires=('qd_opt',)))
 
     # Calculate the interaction between ligands on the quantum dot surface
     if activation_strain:
         val_nano_cat("Quantum dot activation-strain calculations require the nano-CAT package")
-        init_asa(qd_df)
+        stages.append(Stage('activation_strain', init_asa, requires=('qd_opt',)))
 
     # Calculate the interaction between ligands on the quantum dot surface upon removal of CdX2
     if dissociate:
         val_nano_cat("Quantum dot ligand dissociation calculations require the nano-CAT package")
         # Start the BDE calculation
         logger.info('Calculating ligand dissociation energy')
-        init_bde(qd_df)
+        stages.append(Stage('dissociate', init_bde, requires=('qd_opt',)))
 
+    run_stages(qd_df, stages, max_workers=max_parallel_stages)
     return qd_df
 
 
@@ -0,0 +1,188 @@
+"""A module with a local, content-addressed cache for the results of the various CAT workflows.
+
+Index
+-----
+.. currentmodule:: CAT.cache
+.. autosummary::
+    ResultCache
+
+API
+---
+.. autoclass:: ResultCache
+    :members:
+
+"""
+
+import os
+import time
+import sqlite3
+from typing import Optional, Dict, Iterable, Hashable, Tuple, Union, List, Any
+
+from .logger import logger
+from .checkpoint import _get_hash
+
+__all__ = ['ResultCache']
+
+PathType = Union[str, 'os.PathLike[str]']
+
+_CREATE_TABLE = """CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    atime REAL NOT NULL
+)"""
+
+#: The maximum number of SQL variables in a single query.
+_MAX_VARIABLES = 900
+
+
+class ResultCache:
+    """A class for storing the results of the various CAT workflows in a local SQLite database.
+
+    Results are stored per molecule, using a key based on both the molecule's index
+    (*e.g.* the canonical SMILES string and anchor of a ligand or the formula and
+    anchor indices of a core) and a hash of the workflow settings (see :meth:`get_key`).
+    In contrast to the Data-CAT database, the cache does not require any optional dependencies.
+
+    If the total size of the cache exceeds :attr:`ResultCache.max_size` then
+    the least recently used entries are removed.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> import os
+        >>> import tempfile
+        >>> from CAT.cache import ResultCache
+
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     cache = ResultCache(os.path.join(tmpdir, 'cache.db'))
+        ...     key = cache.get_key('settings_hash', ('CCO', 'O2'))
+        ...     cache.set_many('ligand', {key: b'value'})
+        ...     cache.get_many([key]) == {key: b'value'}
+        True
+
+    Parameters
+    ----------
+    filename : :class:`str`
+        The path to the SQLite database.
+        The database will be created if it does not yet exist.
+
+    max_size : :class:`int`, optional
+        The maximum size of all stored values in bytes.
+        If ``None``, do not impose a size limit.
+
+    Attributes
+    ----------
+    filename : :class:`str`
+        The path to the SQLite database.
+
+    max_size : :class:`int`, optional
+        The maximum size of all stored values in bytes.
+
+    """
+
+    def __init__(self, filename: PathType, max_size: Optional[int] = None) -> None:
+        """Initialize a :class:`ResultCache` instance."""
+        self.filename = os.fspath(filename)
+        self.max_size = max_size
+        with self._connect() as con:
+            con.execute(_CREATE_TABLE)
+            con.execute("CREATE INDEX IF NOT EXISTS atime_index ON cache (atime)")
+        con.close()
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        return f'{self.__class__.__name__}(filename={self.filename!r}, max_size={self.max_size!r})'
+
+    def __reduce__(self):
+        """Helper function for :mod:`pickle`."""
+        return type(self), (self.filename, self.max_size)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection to the database.
+
+        A new connection is opened for every transaction,
+        so the cache can be safely shared between threads and processes.
+
+        """
+        return sqlite3.connect(self.filename, timeout=60)
+
+    @staticmethod
+    def get_key(settings_hash: str, index: Hashable) -> str:
+        """Construct a key from the hash of the workflow settings and the index of a molecule."""
+        index_list = [str(i) for i in index] if isinstance(index, tuple) else [str(index)]
+        return _get_hash([settings_hash, index_list])
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, bytes]:
+        """Return a dictionary with the values of all **keys** present in the cache.
+
+        The access time of all retrieved entries is updated.
+
+        """
+        key_list = list(keys)
+        ret: Dict[str, bytes] = {}
+        atime = time.time()
+        with self._connect() as con:
+            for i in range(0, len(key_list), _MAX_VARIABLES):
+                chunk = key_list[i:i + _MAX_VARIABLES]
+                placeholders = ', '.join('?' * len(chunk))
+                query = f"SELECT key, value FROM cache WHERE key IN ({placeholders})"
+                ret.update(con.execute(query, chunk))
+                query = f"UPDATE cache SET atime = ? WHERE key IN ({placeholders})"
+                con.execute(query, [atime] + chunk)
+        con.close()
+        return ret
+
+    def set_many(self, stage: str, mapping: Dict[str, bytes]) -> None:
+        """Store all key/value pairs in **mapping**, overwriting any previous values.
+
+        Least recently used entries are removed afterwards if :attr:`ResultCache.max_size`
+        has been exceeded.
+
+        """
+        atime = time.time()
+        data = [(k, stage, v, len(v), atime) for k, v in mapping.items()]
+        with self._connect() as con:
+            con.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)", data)
+            if self.max_size is not None:
+                self._evict(con, self.max_size)
+        con.close()
+
+    @staticmethod
+    def _evict(con: sqlite3.Connection, max_size: int) -> None:
+        """Remove the least recently used entries until the total size is at most **max_size**."""
+        size: int = con.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if size <= max_size:
+            return
+
+        keys: List[str] = []
+        cursor = con.execute("SELECT key, size FROM cache ORDER BY atime ASC")
+        for key, i in cursor:
+            if size <= max_size:
+                break
+            keys.append(key)
+            size -= i
+        cursor.close()
+
+        con.executemany("DELETE FROM cache WHERE key = ?", [(k,) for k in keys])
+        logger.debug(f"Removing {len(keys)} least recently used entries from the cache")
+
+    def clear(self, stage: Optional[str] = None) -> None:
+        """Remove all entries from the cache; only remove the entries of **stage** if specified."""
+        with self._connect() as con:
+            if stage is None:
+                con.execute("DELETE FROM cache")
+            else:
+                con.execute("DELETE FROM cache WHERE stage = ?", (stage,))
+        con.close()
+
+    def get_info(self) -> Tuple[int, int]:
+        """Return the number of entries and their total size in bytes."""
+        with self._connect() as con:
+            ret: Tuple[Any, Any] = con.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+            ).fetchone()
+        con.close()
+        return int(ret[0]), int(ret[1])
@@ -0,0 +1,226 @@
+"""A module for checkpointing and resuming the :func:`CAT.base.prep` pipeline.
+
+Index
+-----
+.. currentmodule:: CAT.checkpoint
+.. autosummary::
+    Checkpoint
+    get_fingerprints
+    STAGES
+
+API
+---
+.. autoclass:: Checkpoint
+    :members:
+.. autofunction:: get_fingerprints
+.. autodata:: STAGES
+    :annotation: : Mapping[str, Tuple[Tuple[str, ...], ...]]
+
+"""
+
+import os
+import json
+import glob
+import pickle
+import hashlib
+from types import MappingProxyType
+from typing import Mapping, Tuple, Optional, Dict, Any, Hashable, Iterable, Union
+
+import pandas as pd
+from scm.plams import Settings
+
+from .__version__ import __version__
+from .logger import logger
+from .mol_utils import pickle_dumps
+
+__all__ = ['Checkpoint', 'get_fingerprints']
+
+#: A mapping with all checkpointed stages of :func:`CAT.base.prep`.
+#: Values consists of the (nested) keys of all input settings affecting the respective stage.
+#: Note that the fingerprint of the ``"qd"`` stage is further dependant on
+#: the fingerprints of the ``"core"`` and ``"ligand"`` stages.
+STAGES: Mapping[str, Tuple[Tuple[str, ...], ...]] = MappingProxyType({
+    'core': (('input_cores',), ('optional', 'core')),
+    'ligand': (('input_ligands',), ('optional', 'ligand'), ('optional', 'forcefield')),
+    'qd': (('input_qd',), ('optional', 'qd')),
+})
+
+
+def _get_hash(obj: Any) -> str:
+    """Return the SHA256 hash of **obj** as based on its (sorted) JSON representation."""
+    obj_str = json.dumps(obj, sort_keys=True, default=repr)
+    return hashlib.sha256(obj_str.encode()).hexdigest()
+
+
+def get_fingerprints(s: Settings) -> Dict[str, str]:
+    """Construct a fingerprint for every stage in :data:`STAGES` from the **unvalidated** input.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from scm.plams import Settings
+        >>> from CAT.checkpoint import get_fingerprints
+
+        >>> s1 = Settings({'input_cores': ['Cd68Se55.xyz'], 'input_ligands': ['CO']})
+        >>> s2 = Settings({'input_cores': ['Cd68Se55.xyz'], 'input_ligands': ['CCO']})
+
+        >>> fp1 = get_fingerprints(s1)
+        >>> fp2 = get_fingerprints(s2)
+        >>> fp1['core'] == fp2['core']
+        True
+        >>> fp1['ligand'] == fp2['ligand']
+        False
+        >>> fp1['qd'] == fp2['qd']
+        False
+
+    Parameters
+    ----------
+    s : |plams.Settings|_
+        The (unvalidated) CAT input settings.
+
+    Returns
+    -------
+    :class:`dict` [:class:`str`, :class:`str`]
+        A dictionary with the names of all stages as keys and their fingerprints as values.
+
+    """
+    with Settings.supress_missing():
+        def get_nested(key: Tuple[str, ...]) -> Any:
+            try:
+                value = s.get_nested(key)
+            except (KeyError, TypeError):
+                return None
+            return value.as_dict() if isinstance(value, Settings) else value
+
+        ret = {}
+        for stage, keys in STAGES.items():
+            values = [__version__, str(s.get('path'))]
+            values += [get_nested(k) for k in keys]
+            if stage == 'qd':
+                values += [ret['core'], ret['ligand']]
+            ret[stage] = _get_hash(values)
+    return ret
+
+
+class Checkpoint:
+    """A class for storing and loading the (intermediate) results of :func:`CAT.base.prep`.
+
+    Results are stored as pickle files in :attr:`Checkpoint.path` and are identified by
+    the fingerprint of the respective stage (see :func:`get_fingerprints`).
+    A change in either the input molecules or the settings of a given stage will thus
+    invalidate all checkpoints of said stage (and all stages depending on it).
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The path to the checkpoint directory.
+        The directory will be created if it does not yet exist.
+
+    fingerprints : :class:`Mapping<collections.abc.Mapping>` [:class:`str`, :class:`str`]
+        A mapping with the fingerprints of all stages; see :func:`get_fingerprints`.
+
+    interval : :class:`int`, optional
+        If not ``None``, additionally checkpoint the (partial) results of all workflows
+        after every **interval** molecules (see :meth:`WorkFlow.__call__()<CAT.workflows.WorkFlow.__call__>`).
+
+    Attributes
+    ----------
+    path : :class:`str`
+        The path to the checkpoint directory.
+
+    fingerprints : :class:`Mapping<collections.abc.Mapping>` [:class:`str`, :class:`str`]
+        A mapping with the fingerprints of all stages.
+
+    interval : :class:`int`, optional
+        The number of molecules in between two consecutive intra-workflow checkpoints.
+
+    """  # noqa: E501
+
+    def __init__(self, path: Union[str, 'os.PathLike[str]'],
+                 fingerprints: Mapping[str, str],
+                 interval: Optional[int] = None) -> None:
+        """Initialize a :class:`Checkpoint` instance."""
+        self.path = os.fspath(path)
+        self.fingerprints = MappingProxyType(dict(fingerprints))
+        self.interval = interval
+        if not os.path.isdir(self.path):
+            os.mkdir(self.path)
+
+    def __repr__(self) -> str:
+        """Implement :func:`repr(self)<repr>`."""
+        return f'{self.__class__.__name__}(path={self.path!r}, interval={self.interval!r})'
+
+    def __reduce__(self):
+        """Helper function for :mod:`pickle`."""
+        return type(self), (self.path, dict(self.fingerprints), self.interval)
+
+    def get_filename(self, stage: str, *keys: Hashable) -> str:
+        """Return the name of the checkpoint file of **stage**.
+
+        Additional **keys** can be supplied for identifying intra-workflow checkpoints.
+
+        """
+        fingerprint = self.fingerprints[stage][:16]
+        name = '_'.join(str(i) for i in (stage, fingerprint) + keys)
+        return os.path.join(self.path, f'{name}.pkl')
+
+    def _dump(self, filename: str, obj: Any) -> None:
+        """Pickle **obj**; an intermediate file is used to prevent the creation of corrupt files."""
+        tmp = f'{filename}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(pickle_dumps(obj))
+        os.replace(tmp, filename)
+
+    def _load(self, filename: str) -> Any:
+        """Unpickle the content of **filename**; return ``None`` if it does not exist."""
+        if not os.path.isfile(filename):
+            return None
+        with open(filename, 'rb') as f:
+            return pickle.load(f)
+
+    def save(self, stage: str, df: pd.DataFrame) -> None:
+        """Store the dataframe produced by **stage**.
+
+        All intra-workflow checkpoints of **stage** are removed afterwards.
+
+        """
+        filename = self.get_filename(stage)
+        self._dump(filename, pd.DataFrame(df))
+        logger.info(f"Saving a checkpoint of the {stage} stage to {filename!r}\n")
+        for name in glob.glob(self.get_filename(stage, '*')):
+            os.remove(name)
+
+    def load(self, stage: str) -> Optional[pd.DataFrame]:
+        """Load the dataframe produced by **stage**; return ``None`` if it is not available."""
+        return self._load(self.get_filename(stage))
+
+    @staticmethod
+    def get_key(name: str, index: Iterable[Hashable]) -> str:
+        """Create a key for identifying intra-workflow checkpoints of a given workflow and index."""
+        return _get_hash([name, [str(i) for i in index]])[:16]
+
+    def save_chunk(self, stage: str, key: str, i: int,
+                   value: Any, mol_series: pd.Series) -> None:
+        """Store the results of the **i**'th chunk of an intra-workflow checkpoint.
+
+        **value** and **mol_series** are, respectively, the output of the workflow
+        and the (potentially modified) molecules of the chunk.
+
+        """
+        # Strip the settings from any Settings(DataFrame|Series); they are not necessarily picklable
+        if isinstance(value, pd.DataFrame):
+            value = pd.DataFrame(value)
+        elif isinstance(value, pd.Series):
+            value = pd.Series(value)
+        self._dump(self.get_filename(stage, key, i), (value, pd.Series(mol_series)))
+
+    def load_chunk(self, stage: str, key: str,
+                   i: int) -> Optional[Tuple[Any, pd.Series]]:
+        """Load the results of the **i**'th chunk of an intra-workflow checkpoint.
+
+        Returns a 2-tuple with the output of the workflow and the molecules of the chunk, or
+        ``None`` if the chunk is not available.
+
+        """
+        return self._load(self.get_filename(stage, key, i))
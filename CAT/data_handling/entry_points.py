@@ -26,6 +26,7 @@ from scm.plams import Settings
 
 from CAT import base
 from CAT.logger import logger
+from CAT.plan import plan, log_plan
 
 
 def extract_args(args: Optional[List[str]] = None) -> Settings:
@@ -47,7 +48,7 @@ def main(args: Optional[List[str]] = None) -> None:
     """Launch CAT via the command line."""
     parser = argparse.ArgumentParser(
         prog='CAT',
-        usage='init_cat my_settings_file.yaml',
+        usage='init_cat my_settings_file.yaml [--plan]',
         description=('Description: This script initalizes the Compound Attachment Tool (CAT).')
     )
 
@@ -56,9 +57,18 @@ def main(args: Optional[List[str]] = None) -> None:
         help='Required: A .yaml file with the settings for CAT'
     )
 
+    parser.add_argument(
+        '--plan', action='store_true',
+        help=('Optional: Estimate the size and cost of the run without '
+              'constructing or optimizing any molecules')
+    )
+
     try:
         args = parser.parse_args(args)
-        base.prep(extract_args(args), return_mol=False)
+        if args.plan:
+            log_plan(plan(extract_args(args)))
+        else:
+            base.prep(extract_args(args), return_mol=False)
     except Exception as ex:
         logger.critical(f'{ex.__class__.__name__}: {ex}')
         raise ex
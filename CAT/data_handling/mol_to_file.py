@@ -19,6 +19,8 @@ from os.path import join, isdir, isfile, exists
 
 from scm.plams import Molecule, writepdb
 
+from ..timing import TIMING_REPORT
+
 __all__ = ['mol_to_file']
 
 MolExportFunc = Callable[[Molecule, Union[str, bytes, os.PathLike]], None]
@@ -76,10 +78,12 @@ def mol_to_file(mol_list: Iterable[Molecule],
         raise ValueError("No valid values found in the mol_format argument; accepted values are: "
                          "'xyz', 'pdb', 'mol' and/or 'mol2'")
 
-    for mol in mol_list:
-        mol_path = join(_path, mol.properties.name)
-        if not condition:
-            continue
+    with TIMING_REPORT.record('mol_to_file') as counter:
+        for mol in mol_list:
+            counter.n_mol += 1
+            mol_path = join(_path, mol.properties.name)
+            if not condition:
+                continue
 
-        for ext, func in export_dict.items():
-            func(mol, f'{mol_path}.{ext}')
+            for ext, func in export_dict.items():
+                func(mol, f'{mol_path}.{ext}')
@@ -18,6 +18,9 @@ from os.path import (join, isdir)
 from scm.plams import Settings
 
 from .validation_schemas import (
+    optional_schema,
+    checkpoint_schema,
+    cache_schema,
     core_schema,
     ligand_schema,
     qd_schema,
@@ -37,6 +40,8 @@ from .validate_ff import validate_ff, update_ff_jobs
 from .validate_mol import validate_mol
 from ..utils import validate_path
 from ..logger import logger
+from ..cache import ResultCache
+from ..checkpoint import Checkpoint, get_fingerprints
 from ..attachment.ligand_anchoring import get_functional_groups
 
 try:
@@ -77,6 +82,9 @@ def validate_input(s: Settings) -> None:
         A Settings instance with to-be validated CAT input settings.
 
     """
+    # Construct the checkpoint fingerprints before the input is modified
+    fingerprints = get_fingerprints(s)
+
     # Validate the path
     s.path = path = validate_path(s.path)
 
@@ -89,12 +97,24 @@ def validate_input(s: Settings) -> None:
             mkdir(value)
 
     # Validate optional argument
+    s.optional = optional_schema.validate(s.optional)
     s.optional.database = database_schema.validate(s.optional.database)
     s.optional.ligand = ligand_schema.validate(s.optional.ligand)
     s.optional.core = core_schema.validate(s.optional.core)
     s.optional.qd = qd_schema.validate(s.optional.qd)
 
     # Validate some of the more complex optionala rguments
+    if s.optional.checkpoint is not False:
+        checkpoint = checkpoint_schema.validate(s.optional.checkpoint)
+        s.optional.checkpoint = Checkpoint(join(path, checkpoint['dirname']), fingerprints,
+                                           interval=checkpoint['interval'])
+    else:
+        s.optional.checkpoint = None
+    if s.optional.cache is not False:
+        cache = cache_schema.validate(s.optional.cache)
+        s.optional.cache = ResultCache(join(path, cache['filename']), max_size=cache['max_size'])
+    else:
+        s.optional.cache = None
     if s.optional.database.mongodb:
         s.optional.database.mongodb = mongodb_schema.validate(s.optional.database.mongodb)
     if s.optional.core.subset:
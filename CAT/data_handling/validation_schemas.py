@@ -4,6 +4,9 @@ Index
 -----
 .. currentmodule:: CAT.data_handling.validation_schemas
 .. autosummary::
+    optional_schema
+    checkpoint_schema
+    cache_schema
     mol_schema
     core_schema
     ligand_schema
@@ -22,6 +25,12 @@ Index
 
 API
 ---
+.. autodata:: optional_schema
+    :annotation: : schema.Schema
+.. autodata:: checkpoint_schema
+    :annotation: : schema.Schema
+.. autodata:: cache_schema
+    :annotation: : schema.Schema
 .. autodata:: mol_schema
     :annotation: : schema.Schema
 .. autodata:: core_schema
@@ -55,6 +64,7 @@ API
 
 """
 
+import os
 from types import MappingProxyType
 from typing import Collection, Callable, Any, Optional, TypeVar, Mapping, Type, Tuple
 from operator import __index__
@@ -85,9 +95,9 @@ from .str_to_func import str_to_func
 from ..utils import get_template, validate_path, validate_core_atom, check_sys_var
 from ..mol_utils import to_atnum
 
-__all__ = ['mol_schema', 'core_schema', 'ligand_schema', 'qd_schema', 'database_schema',
-           'mongodb_schema', 'bde_schema', 'ligand_opt_schema', 'qd_opt_schema', 'crs_schema',
-           'asa_schema', 'subset_schema']
+__all__ = ['optional_schema', 'checkpoint_schema', 'cache_schema', 'mol_schema', 'core_schema',
+           'ligand_schema', 'qd_schema', 'database_schema', 'mongodb_schema', 'bde_schema',
+           'ligand_opt_schema', 'qd_opt_schema', 'crs_schema', 'asa_schema', 'subset_schema']
 
 
 def val_float(value: Any) -> bool:
@@ -224,6 +234,46 @@ _crs_s2_default = get_template('qd.yaml')['COSMO-RS activity coefficient']
 _crs_s2_default.update(get_template('crs.yaml')['MOPAC PM6'])
 
 
+#: Schema for validating the top-level keys of the ``['optional']`` block.
+optional_schema: Schema = Schema({
+    # The number of processes used for constructing molecules
+    Optional_('n_workers', default=1):
+        Or(
+            And(None, Use(lambda n: os.cpu_count() or 1)),
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.n_workers expects None or an integer larger than 0'
+        ),
+
+    # The maximum number of independent workflows which are executed concurrently
+    Optional_('max_parallel_stages', default=1):
+        Or(
+            And(None, Use(lambda n: os.cpu_count() or 1)),
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.max_parallel_stages expects None or an integer larger than 0'
+        ),
+
+    # Checkpoint the results of the various stages
+    Optional_('checkpoint', default=False):
+        Or(
+            dict,
+            And(bool, Use(lambda n: ({} if n else False))),
+            error='optional.checkpoint expects a boolean or dictionary'
+        ),
+
+    # Cache the results of the various workflows
+    Optional_('cache', default=False):
+        Or(
+            dict,
+            And(bool, Use(lambda n: ({} if n else False))),
+            error='optional.cache expects a boolean or dictionary'
+        ),
+
+    # The database, ligand, core and qd blocks are validated by their respective schemas
+    Optional_(str):
+        object
+})
+
+
 #: Schema for validating the ``['input_ligands']`` and ``['input_cores']`` blocks.
 mol_schema: Schema = Schema({
     Optional_('guess_bonds', default=False):
@@ -531,6 +581,105 @@ qd_schema: Schema = Schema({
             None, dict,
             error='optional.qd.multi_ligand expects None or dictionary'
         ),
+
+    # Construct and process the quantum dots in chunks of a given size
+    Optional_('chunk_size', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.qd.chunk_size expects None or an integer larger than 0'
+        ),
+
+    # Refine the rotation angle of all ligands following the initial rotamer scan
+    Optional_('rotamer_refinement', default=False):
+        And(bool, error='optional.qd.rotamer_refinement expects a boolean'),
+
+    # Re-rotate all ligands after constructing the entire ligand shell
+    Optional_('packing_sweeps', default=0):
+        And(val_int, lambda n: int(n) >= 0, Use(int),
+            error='optional.qd.packing_sweeps expects an integer larger than or equal to 0'),
+
+    # Pre-screen all rotamers using a coarse-grained bead representation of the ligands
+    Optional_('bead_candidates', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.qd.bead_candidates expects None or an integer larger than 0'
+        ),
+
+    # Simultaneously place all ligands that cannot interact with each other
+    Optional_('parallel_placement', default=False):
+        And(bool, error='optional.qd.parallel_placement expects a boolean'),
+
+    # Attach blocks of ligands to a single core in one batch
+    Optional_('batch_size', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.qd.batch_size expects None or an integer larger than 0'
+        ),
+
+    # Screen all ligand/core pairs for steric incompatibilities prior to their construction
+    Optional_('screening_threshold', default=None):
+        Or(
+            None,
+            And(val_float, lambda n: float(n) > 0, Use(float)),
+            error='optional.qd.screening_threshold expects None or a float larger than 0'
+        ),
+
+    # Place a single ligand per orbit of symmetry-equivalent anchors and propagate it by symmetry
+    Optional_('symmetric_placement', default=False):
+        And(bool, error='optional.qd.symmetric_placement expects a boolean'),
+
+    # Adjust a few backbone dihedral angles of all clashing ligands
+    Optional_('torsional_relief', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.qd.torsional_relief expects None or an integer larger than 0'
+        ),
+
+    # The distance below which inter-ligand and ligand-core atom-pairs are considered clashing
+    Optional_('clash_threshold', default=1.0):
+        And(val_float, lambda n: float(n) >= 0, Use(float),
+            error='optional.qd.clash_threshold expects a float larger than or equal to 0'),
+
+    # The action to be performed when encountering clashing quantum dots
+    Optional_('clash_action', default='warn'):
+        And(str, Use(str.lower), lambda n: n in {'warn', 'raise', 'ignore', 'skip'},
+            error="optional.qd.clash_action expects 'warn', 'raise', 'ignore' or 'skip'"),
+})
+
+
+#: Schema for validating the ``['optional']['checkpoint']`` block.
+checkpoint_schema: Schema = Schema({
+    # Name of the checkpoint directory
+    Optional_('dirname', default='checkpoint'):
+        And(str, error='optional.checkpoint.dirname expects a string'),
+
+    # Checkpoint the results of all workflows after every n molecules
+    Optional_('interval', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.checkpoint.interval expects None or an integer larger than 0'
+        ),
+})
+
+
+#: Schema for validating the ``['optional']['cache']`` block.
+cache_schema: Schema = Schema({
+    # Name of the cache file
+    Optional_('filename', default='cache.db'):
+        And(str, error='optional.cache.filename expects a string'),
+
+    # The maximum size of the cache in bytes
+    Optional_('max_size', default=None):
+        Or(
+            None,
+            And(val_int, lambda n: int(n) > 0, Use(int)),
+            error='optional.cache.max_size expects None or an integer larger than 0'
+        ),
 })
 
 
@@ -566,6 +715,11 @@ ligand_opt_schema: Schema = Schema({
     Optional_('keep_files', default=True):
         And(bool, error='optional.ligand.optimize.keep_files expects a boolean'),
 
+    # The maximum number of concurrently running PLAMS jobs
+    Optional_('max_parallel_jobs', default=1):
+        And(val_int, lambda n: int(n) > 0, Use(int),
+            error='optional.ligand.optimize.max_parallel_jobs expects an integer larger than 0'),
+
     # The Job type and settings for the conformation search
     Optional_('job1', default=None): None,
     Optional_('s1', default=None): dict,
@@ -737,6 +891,11 @@ qd_opt_schema: Schema = Schema({
     Optional_('keep_files', default=True):
         And(bool, error='optional.qd.opt.keep_files expects a boolean'),
 
+    # The maximum number of concurrently running PLAMS jobs
+    Optional_('max_parallel_jobs', default=1):
+        And(val_int, lambda n: int(n) > 0, Use(int),
+            error='optional.qd.opt.max_parallel_jobs expects an integer larger than 0'),
+
     # The job type for the first half of the optimization
     Optional_('job1', default=_get_amsjob):
         Or(
@@ -19,7 +19,7 @@ API
 
 import copy
 import textwrap
-from typing import (NoReturn, Hashable)
+from typing import (NoReturn, Hashable, Tuple, Type)
 
 from scm.plams import Settings
 
@@ -124,6 +124,10 @@ class FrozenSettings(Settings):
             Settings.__setitem__(ret, key, value_cp)
         return ret
 
+    def __reduce__(self) -> Tuple[Type['FrozenSettings'], Tuple[dict]]:
+        """Helper for :mod:`pickle`; reconstruct this instance from a :class:`dict`."""
+        return type(self), (dict(self),)
+
     def __copy__(self) -> 'FrozenSettings':
         """Create a shallow copy of this instance by calling :meth:`FrozenSettings.copy`."""
         return self.copy(deep=False)
@@ -13,6 +13,7 @@ Index
     job_single_point
     job_geometry_opt
     job_freq
+    map_parallel_jobs
 
 API
 ---
@@ -25,17 +26,19 @@ API
 .. autofunction:: job_single_point
 .. autofunction:: job_geometry_opt
 .. autofunction:: job_freq
+.. autofunction:: map_parallel_jobs
 
 """
 
 from shutil import rmtree
-from typing import (Optional, Type)
+from typing import (Optional, Type, Callable, Iterable, Any)
+from concurrent.futures import ThreadPoolExecutor
 from os.path import join
 
 import numpy as np
 
 from scm.plams.core.basejob import Job
-from scm.plams import (Molecule, Settings, Results, config, add_to_class, ResultsError,
+from scm.plams import (Molecule, Settings, Results, JobRunner, config, add_to_class, ResultsError,
                        ADFJob, AMSJob, Units, Cp2kResults)
 
 import qmflows
@@ -44,7 +47,7 @@ from .logger import (logger, log_start, log_succes, log_fail, log_copy)
 from .thermo_chem import get_thermo
 from .utils import type_to_string
 
-__all__ = ['job_single_point', 'job_geometry_opt', 'job_freq']
+__all__ = ['job_single_point', 'job_geometry_opt', 'job_freq', 'map_parallel_jobs']
 
 
 @add_to_class(Cp2kResults)
@@ -256,7 +259,8 @@ def job_single_point(self, job_type: Type[Job],
                      settings: Settings,
                      name: str = 'Single_point',
                      ret_results: bool = False,
-                     read_template: bool = True) -> Optional[Results]:
+                     read_template: bool = True,
+                     jobrunner: Optional[JobRunner] = None) -> Optional[Results]:
     """Function for running an arbritrary jobs, extracting total energies.
 
     Paramaters
@@ -277,6 +281,12 @@ def job_single_point(self, job_type: Type[Job],
     read_template : bool
         Whether or not to update **settings** using a QMFlows template or not.
 
+    jobrunner : :class:`JobRunner<scm.plams.core.jobrunner.JobRunner>`, optional
+        The job runner for executing **job**.
+        If ``None``, use the default job runner (see :data:`plams.config`).
+        Note that this function will always wait for the job to finish,
+        even when a parallel job runner is passed.
+
     Returns
     -------
     |plams.Results|_
@@ -292,7 +302,8 @@ def job_single_point(self, job_type: Type[Job],
     _name = _get_name(name)
     log_start(job, self, 'single point', _name)
 
-    results = job.run()
+    results = job.run(jobrunner=jobrunner)
+    results.wait()
     retrieve_results(self, results, 'single point')
 
     inp_name = join(job.path, f'{job.name}.in')
@@ -312,7 +323,8 @@ def job_geometry_opt(self, job_type: Type[Job],
                      settings: Settings,
                      name: str = 'Geometry_optimization',
                      ret_results: bool = False,
-                     read_template: bool = True) -> Optional[Results]:
+                     read_template: bool = True,
+                     jobrunner: Optional[JobRunner] = None) -> Optional[Results]:
     """Function for running an arbritrary jobs, extracting total energies and final geometries.
 
     Paramaters
@@ -333,6 +345,12 @@ def job_geometry_opt(self, job_type: Type[Job],
     read_template : bool
         Whether or not to update **settings** using a QMFlows template or not.
 
+    jobrunner : :class:`JobRunner<scm.plams.core.jobrunner.JobRunner>`, optional
+        The job runner for executing **job**.
+        If ``None``, use the default job runner (see :data:`plams.config`).
+        Note that this function will always wait for the job to finish,
+        even when a parallel job runner is passed.
+
     Returns
     -------
     |plams.Results|_
@@ -348,7 +366,8 @@ def job_geometry_opt(self, job_type: Type[Job],
     _name = _get_name(name)
     log_start(job, self, 'geometry optimization', _name)
 
-    results = job.run()
+    results = job.run(jobrunner=jobrunner)
+    results.wait()
     retrieve_results(self, results, 'geometry optimization')
 
     inp_name = join(job.path, f'{job.name}.in')
@@ -483,3 +502,47 @@ def job_freq(self, job_type: Type[Job],
     if ret_results:
         return job.results
     return None
+
+
+def map_parallel_jobs(func: Callable[..., Any], mol_list: Iterable[Molecule],
+                      *args: Any, max_parallel_jobs: int = 1, **kwargs: Any) -> None:
+    r"""Call **func** on all molecules in **mol_list**, running multiple PLAMS jobs concurrently.
+
+    Every molecule is processed by its own :code:`func(mol, *args, jobrunner=..., **kwargs)` call,
+    ensuring that all jobs belonging to a single molecule are executed in order.
+    Separate molecules are processed concurrently,
+    running at most **max_parallel_jobs** jobs at any given time.
+
+    Parameters
+    ----------
+    func : :data:`Callable<typing.Callable>`
+        The to-be called function.
+        Should accept a molecule as first positional argument and
+        a :class:`JobRunner<scm.plams.core.jobrunner.JobRunner>` via the **jobrunner** keyword.
+
+    mol_list : :class:`Iterable<collections.abc.Iterable>` [|plams.Molecule|_]
+        An iterable consisting of PLAMS molecules.
+
+    max_parallel_jobs : :class:`int`
+        The maximum number of concurrently running jobs.
+        Molecules are processed sequentially (using the default job runner)
+        if this value is equal to ``1``.
+
+    \*args/\**kwargs : :data:`Any<typing.Any>`
+        Further positional and keyword arguments for **func**.
+
+    """
+    if max_parallel_jobs <= 1:
+        for mol in mol_list:
+            func(mol, *args, **kwargs)
+        return None
+
+    jobrunner = JobRunner(parallel=True, maxjobs=max_parallel_jobs)
+    with ThreadPoolExecutor(max_workers=max_parallel_jobs) as executor:
+        futures = [executor.submit(func, mol, *args, jobrunner=jobrunner, **kwargs) for
+                   mol in mol_list]
+
+    # Re-raise any exceptions encountered in the worker threads
+    for fut in futures:
+        fut.result()
+    return None
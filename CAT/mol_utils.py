@@ -13,6 +13,7 @@ Index
     adf_connectivity
     fix_carboxyl
     fix_h
+    pickle_dumps
 
 API
 ---
@@ -25,21 +26,25 @@ API
 .. autofunction:: adf_connectivity
 .. autofunction:: fix_carboxyl
 .. autofunction:: fix_h
+.. autofunction:: pickle_dumps
 
 """
 
-from typing import Optional, Iterable, Union, Tuple, List
+import io
+import pickle
+import copyreg
+from typing import Optional, Iterable, Union, Tuple, List, Dict, Type, Any, Callable
 
 import numpy as np
 
-from scm.plams import Molecule, Atom, Bond, MoleculeError, add_to_class, PTError
+from scm.plams import Molecule, Atom, Bond, MoleculeError, Settings, add_to_class, PTError
 from scm.plams.tools.periodic_table import PeriodicTable
 import scm.plams.interfaces.molecule.rdkit as molkit
 
 from rdkit import Chem
 from rdkit.Chem import rdMolTransforms
 
-__all__ = ['adf_connectivity', 'fix_h', 'fix_carboxyl']
+__all__ = ['adf_connectivity', 'fix_h', 'fix_carboxyl', 'pickle_dumps']
 
 try:
     SANITIZE: int = Chem.SanitizeFlags.SANITIZE_ALL ^ Chem.SanitizeFlags.SANITIZE_ADJUSTHS
@@ -390,3 +395,88 @@ def fix_h(mol: Molecule) -> None:
 
     if update:
         mol.from_rdmol(rdmol)
+
+
+AtomRef = Union[int, List[int]]
+
+
+def _rebuild_mol(cls: Type[Molecule], state: dict, atom_refs: Dict[str, AtomRef]) -> Molecule:
+    """Counterpart of :func:`_reduce_mol`; used for unpickling molecules."""
+    mol = cls.from_dict(state)
+    for key, idx in atom_refs.items():
+        if isinstance(idx, int):
+            mol.properties[key] = mol.atoms[idx]
+        else:
+            mol.properties[key] = [mol.atoms[i] for i in idx]
+    return mol
+
+
+def _reduce_mol(mol: Molecule) -> Tuple[Callable[..., Molecule], Tuple[Any, ...]]:
+    """Reduce **mol** for :mod:`pickle`; atoms referenced in :attr:`Molecule.properties` are preserved.
+
+    :meth:`Molecule.__getstate__` pickles atoms stored in :attr:`Molecule.properties`
+    (*e.g.* ``properties.dummies``) as independent copies,
+    thus breaking their identity with the atoms in :attr:`Molecule.atoms`.
+    Such references are herein converted into (0-based) atomic indices.
+
+    """  # noqa: E501
+    atom_idx = {id(at): i for i, at in enumerate(mol.atoms)}
+    atom_refs: Dict[str, AtomRef] = {}
+    for key, value in mol.properties.items():
+        if isinstance(value, Atom) and id(value) in atom_idx:
+            atom_refs[key] = atom_idx[id(value)]
+        elif (isinstance(value, list) and value and
+                all(isinstance(at, Atom) and id(at) in atom_idx for at in value)):
+            atom_refs[key] = [atom_idx[id(at)] for at in value]
+
+    state = mol.as_dict()
+    state['properties'] = Settings({k: v for k, v in mol.properties.items() if k not in atom_refs})
+    return _rebuild_mol, (type(mol), state, atom_refs)
+
+
+def pickle_dumps(obj: Any, protocol: int = pickle.HIGHEST_PROTOCOL) -> bytes:
+    """Pickle **obj**, preserving any references between molecules and their atoms.
+
+    Contrary to :func:`pickle.dumps`, atoms stored in the :attr:`Molecule.properties` of a
+    PLAMS :class:`Molecule` (*e.g.* ``properties.dummies``) will remain part of their
+    respective molecule after unpickling.
+    The serialized object can be unpickled with :func:`pickle.loads`.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> import pickle
+        >>> from scm.plams import Molecule, Atom
+        >>> from CAT.mol_utils import pickle_dumps
+
+        >>> mol = Molecule()
+        >>> mol.add_atom(Atom(symbol='H', coords=(0.0, 0.0, 0.0)))
+        >>> mol.add_atom(Atom(symbol='H', coords=(0.74, 0.0, 0.0)))
+        >>> mol.properties.dummies = mol[2]
+
+        >>> mol_new = pickle.loads(pickle_dumps(mol))
+        >>> mol_new.properties.dummies in mol_new
+        True
+
+    Parameters
+    ----------
+    obj : :class:`object`
+        The to-be pickled object.
+        Molecules can be nested within other objects (*e.g.* a :class:`pandas.DataFrame`).
+
+    protocol : :class:`int`
+        The pickle protocol.
+
+    Returns
+    -------
+    :class:`bytes`
+        The pickled representation of **obj**.
+
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=protocol)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[Molecule] = _reduce_mol
+    pickler.dump(obj)
+    return buffer.getvalue()
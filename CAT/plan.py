@@ -0,0 +1,217 @@
+"""A module for estimating the size and cost of a CAT run without actually executing it.
+
+Index
+-----
+.. currentmodule:: CAT.plan
+.. autosummary::
+    plan
+    log_plan
+
+API
+---
+.. autofunction:: plan
+.. autofunction:: log_plan
+
+"""
+
+import os
+import sys
+from typing import Optional, Tuple, Iterable
+
+import numpy as np
+import pandas as pd
+
+from scm.plams import Settings, Molecule
+
+from .logger import logger
+from .base import prep_input, prep_core
+from .workflows import MOL
+from .data import coskf
+from .settings_dataframe import SettingsDataFrame
+from .attachment.ligand_anchoring import init_ligand_anchoring
+
+__all__ = ['plan', 'log_plan']
+
+
+def _get_nbytes(mol: Molecule) -> int:
+    """Estimate the memory footprint of a PLAMS molecule in bytes.
+
+    Only the molecule, its atoms (including their coordinates) and bonds are considered;
+    the content of the various :attr:`properties<scm.plams.mol.molecule.Molecule.properties>`
+    attributes is ignored.
+
+    """
+    getsizeof = sys.getsizeof
+    ret = getsizeof(mol) + getsizeof(vars(mol)) + getsizeof(mol.atoms) + getsizeof(mol.bonds)
+    for at in mol.atoms:
+        ret += getsizeof(at) + getsizeof(vars(at)) + getsizeof(at.bonds) + getsizeof(at.properties)
+        ret += getsizeof(at.coords) + sum(getsizeof(i) for i in at.coords)
+    for bond in mol.bonds:
+        ret += getsizeof(bond) + getsizeof(vars(bond)) + getsizeof(bond.properties)
+    return ret
+
+
+def _get_job_count(jobs: Iterable[Optional[type]]) -> int:
+    """Return the number of non-``None`` job types in **jobs**."""
+    return sum(job is not None for job in jobs)
+
+
+def _get_n_dissociate(s: Settings, core_df: Optional[SettingsDataFrame]) -> np.ndarray:
+    """Estimate the number of dissociation products of each core; see ``optional.qd.dissociate``.
+
+    Returns an array with one element for each core.
+
+    """
+    core_atom = s.core_atom
+    pairs = s.lig_core_pairs or 1
+    if core_df is None:
+        return np.zeros(0, dtype=int)
+
+    ret = []
+    for core in core_df[MOL]:
+        if s.core_index:
+            n = len(s.core_index)
+        elif isinstance(core_atom, Molecule):  # A SMILES string; i.e. a molecular fragment
+            n = len(core.properties.dummies) // max(1, s.lig_count)
+        else:
+            n = sum(at.atnum == core_atom for at in core)
+        ret.append(n * pairs)
+    return np.array(ret, dtype=int)
+
+
+def _get_qd_shape(ligand_df: pd.DataFrame,
+                  core_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Return 2D arrays with the number of atoms and memory usage of each core/ligand pair.
+
+    Rows and columns correspond to the cores and ligands, respectively.
+
+    """
+    core_atoms = np.array([len(core) for core in core_df[MOL]], dtype=int)
+    core_nbytes = np.array([_get_nbytes(core) for core in core_df[MOL]], dtype=int)
+    n_anchor = np.array([len(core.properties.dummies) for core in core_df[MOL]], dtype=int)
+    lig_atoms = np.array([len(lig) for lig in ligand_df[MOL]], dtype=int)
+    lig_nbytes = np.array([_get_nbytes(lig) for lig in ligand_df[MOL]], dtype=int)
+
+    # Every core dummy atom is substituted for a ligand
+    qd_atoms = core_atoms[:, None] + n_anchor[:, None] * lig_atoms
+    qd_nbytes = core_nbytes[:, None] + n_anchor[:, None] * lig_nbytes
+    return qd_atoms, qd_nbytes
+
+
+def _get_solvents() -> Tuple[str, ...]:
+    """Return the names of all solvents used in COSMO-RS calculations."""
+    path = os.path.dirname(coskf.__file__)
+    return tuple(sorted(f[:-6] for f in os.listdir(path) if f.endswith('.coskf')))
+
+
+def plan(arg: Settings) -> Settings:
+    """Estimate the size and cost of a CAT run without constructing or optimizing any molecules.
+
+    The input settings are validated and all input molecules are read,
+    after which the functional groups of the ligands and the anchors of the cores are identified.
+    The number of to-be constructed quantum dots, their size and
+    the number of PLAMS jobs that each enabled workflow would submit are then estimated.
+
+    Note that these are estimates: the number of quantum dots constitutes an upper bound,
+    as ligands for which the geometry optimization fails are discarded
+    and :attr:`optional.qd.multi_ligand` is ignored.
+
+    Parameters
+    ----------
+    arg : |plams.Settings|_
+        A settings object containing all (optional) arguments.
+
+    Returns
+    -------
+    |plams.Settings|_
+        A Settings instance with all estimated quantities.
+
+    """
+    ligand_df, core_df, qd_df = prep_input(arg)
+    s = arg.optional
+
+    ret = Settings()
+    if qd_df is None:
+        core_df = prep_core(core_df)
+        ligand_df = init_ligand_anchoring(ligand_df)
+        qd_atoms, qd_nbytes = _get_qd_shape(ligand_df, core_df)
+        if not s.qd.construct_qd:
+            qd_atoms = qd_nbytes = np.zeros((len(core_df), 0), dtype=int)
+
+        ret.ligand.count = len(ligand_df)
+        ret.core.count = len(core_df)
+        ret.core.anchor_count = [len(core.properties.dummies) for core in core_df[MOL]]
+    else:
+        mol_list = qd_df[MOL]
+        qd_atoms = np.array([[len(mol) for mol in mol_list]], dtype=int)
+        qd_nbytes = np.array([[_get_nbytes(mol) for mol in mol_list]], dtype=int)
+        ret.ligand.count = ret.core.count = 0
+        ret.core.anchor_count = []
+
+    n_lig = ret.ligand.count
+    n_qd = qd_atoms.size
+    ret.qd.count = n_qd
+    if n_qd:
+        ret.qd.atom_count.min = int(qd_atoms.min())
+        ret.qd.atom_count.mean = float(qd_atoms.mean())
+        ret.qd.atom_count.max = int(qd_atoms.max())
+    else:
+        ret.qd.atom_count.min = ret.qd.atom_count.mean = ret.qd.atom_count.max = 0
+    ret.qd.nbytes = int(qd_nbytes.sum())
+
+    # Estimate the number of PLAMS jobs per workflow
+    jobs = ret.job_count
+    jobs.ligand_opt = 0
+    if s.ligand.optimize:
+        opt = s.ligand.optimize
+        jobs.ligand_opt = n_lig * _get_job_count([opt.job1, opt.job2])
+
+    jobs.crs = 0
+    if s.ligand.crs:
+        # One job for constructing the COSMO surface + one COSMO-RS job per solvent
+        n_solvent = len(_get_solvents())
+        jobs.crs = n_lig * (1 + n_solvent)
+
+    jobs.cdft = n_lig if s.ligand.cdft else 0
+
+    jobs.qd_opt = 0
+    if s.qd.optimize:
+        opt = s.qd.optimize
+        n_job = 1 if opt.use_ff else _get_job_count([opt.job1, opt.job2])
+        jobs.qd_opt = n_qd * n_job
+
+    jobs.activation_strain = 0
+    if s.qd.activation_strain:
+        asa = s.qd.activation_strain
+        jobs.activation_strain = n_qd if (asa.use_ff or asa.job1 is not None) else 0
+
+    jobs.dissociate = 0
+    if s.qd.dissociate and qd_df is None:
+        bde = s.qd.dissociate
+        n_job = 1 if bde.use_ff else _get_job_count([bde.job1, bde.job2])
+
+        # The quantum dot, the dissociated fragment and all dissociation products
+        n_product = _get_n_dissociate(bde, core_df)[:, None] + 2
+        n_product = np.broadcast_to(n_product, qd_atoms.shape)
+        jobs.dissociate = int(n_product.sum()) * n_job
+
+    jobs.total = sum(jobs.values())
+    return ret
+
+
+def log_plan(ret: Settings) -> None:
+    """Log the output of :func:`plan`."""
+    atom_count = ret.qd.atom_count
+    logger.info('Estimated size and cost of the CAT run:')
+    logger.info(f'    Number of ligands (after the functional group search): {ret.ligand.count}')
+    logger.info(f'    Number of cores: {ret.core.count}')
+    logger.info(f'    Number of anchors per core: {ret.core.anchor_count}')
+    logger.info(f'    Number of quantum dots: {ret.qd.count}')
+    logger.info(f'    Number of atoms per quantum dot (min / mean / max): '
+                f'{atom_count.min} / {atom_count.mean:.1f} / {atom_count.max}')
+    logger.info(f'    Estimated memory of the quantum dot dataframe: '
+                f'{ret.qd.nbytes / 2**20:.1f} MiB')
+    logger.info('    Number of PLAMS jobs per workflow:')
+    for k, v in ret.job_count.items():
+        logger.info(f'        {k}: {v}')
+    logger.info('')
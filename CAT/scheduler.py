@@ -0,0 +1,216 @@
+"""A module for scheduling (potentially concurrent) stages of the CAT workflow manager.
+
+Index
+-----
+.. currentmodule:: CAT.scheduler
+.. autosummary::
+    Stage
+    run_stages
+
+API
+---
+.. autoclass:: Stage
+.. autofunction:: run_stages
+
+"""
+
+import pickle
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import (
+    NamedTuple, Callable, Tuple, Any, Iterable, Dict, List, Iterator, Set, ContextManager
+)
+
+import pandas as pd
+from scm.plams import Settings
+
+from .logger import logger
+from .mol_utils import pickle_dumps
+from .timing import TIMING_REPORT
+from .workflows import MOL, workflow as _workflow
+from .frozen_settings import FrozenSettings
+from .settings_dataframe import SettingsDataFrame
+
+__all__ = ['Stage', 'run_stages']
+
+
+class Stage(NamedTuple):
+    """A named tuple representing a single stage of the workflow manager.
+
+    A stage is executed by calling :code:`func(df, *args)`,
+    after which all results are expected to be stored (inplace) in **df**.
+
+    """
+
+    #: The name of the stage.
+    name: str
+
+    #: The callable performing the actual stage.
+    func: Callable[..., Any]
+
+    #: Additional positional arguments for :attr:`Stage.func`.
+    args: Tuple[Any, ...] = ()
+
+    #: The names of all stages which have to be finished before this stage can be started.
+    requires: Tuple[str, ...] = ()
+
+    #: Whether or not this stage modifies the molecules in the *mol* column inplace.
+    modifies_mol: bool = False
+
+
+def _sort_stages(stages: Iterable[Stage]) -> List[Stage]:
+    """Validate the dependencies of all **stages** and return them in topological order.
+
+    Dependencies on stages not present in **stages** (*e.g.* disabled stages) are ignored.
+
+    """
+    stage_dict = {stage.name: stage for stage in stages}
+    ret: List[Stage] = []
+    done: Set[str] = set()
+    while len(ret) != len(stage_dict):
+        ready = [stage for name, stage in stage_dict.items() if name not in done and
+                 all(i in done or i not in stage_dict for i in stage.requires)]
+        if not ready:
+            names = sorted(set(stage_dict) - done)
+            raise ValueError(f"Circular dependency between the following stages: {names!r}")
+        ret += ready
+        done.update(stage.name for stage in ready)
+    return ret
+
+
+def _run_stage(payload: bytes, lock: ContextManager[Any]) -> bytes:
+    """Call a single stage in a child process; used as target by :func:`run_stages`.
+
+    **payload** is a pickled tuple consisting of the to-be called function, the dataframe
+    and a tuple of additional positional arguments.
+    **lock** is used for serializing all database interactions between processes.
+    The (modified) dataframe is returned together with all timing records of the stage.
+
+    """
+    func, df, args = pickle.loads(payload)
+    TIMING_REPORT.clear()
+    with _swap_db_lock(lock):
+        func(df, *args)
+    return pickle_dumps((pd.DataFrame(df), TIMING_REPORT.records))
+
+
+def _get_payload(stage: Stage, df: SettingsDataFrame) -> bytes:
+    """Pickle the function and (positional) arguments of **stage**."""
+    args = tuple(_serial_df(i) for i in stage.args)
+    return pickle_dumps((stage.func, _serial_df(df), args))
+
+
+def _serial_df(obj: Any) -> Any:
+    """Return a shallow copy of **obj** with all nested process pools disabled.
+
+    Objects without a :attr:`~.SettingsDataFrame.settings` attribute are returned unaltered.
+
+    """
+    if not isinstance(obj, SettingsDataFrame):
+        return obj
+    settings = Settings(obj.settings)
+    settings.optional.n_workers = 1
+    ret = obj.copy(deep=False)
+    ret.settings = FrozenSettings(settings)
+    return ret
+
+
+def _merge(df: pd.DataFrame, ret: pd.DataFrame, modifies_mol: bool = False) -> None:
+    """Update **df** (inplace) with all new or modified columns in **ret**."""
+    for key in ret.columns:
+        if key == MOL:
+            if modifies_mol:
+                df[MOL] = ret[MOL]
+        elif key not in df.columns or not df[key].equals(ret[key]):
+            df[key] = ret[key]
+
+
+@contextmanager
+def _swap_db_lock(lock: ContextManager[Any]) -> Iterator[None]:
+    """Temporary substitute :data:`CAT.workflows.workflow.DB_LOCK` for **lock**."""
+    lock_old = _workflow.DB_LOCK
+    _workflow.DB_LOCK = lock
+    try:
+        yield None
+    finally:
+        _workflow.DB_LOCK = lock_old
+
+
+def run_stages(df: SettingsDataFrame, stages: Iterable[Stage], max_workers: int = 1) -> None:
+    """Run all **stages** on **df**, executing independent stages concurrently.
+
+    Stages are executed in a pool of at most **max_workers** processes,
+    a stage being submitted as soon as all stages in :attr:`Stage.requires` are finished.
+    All results are subsequently merged back into **df**:
+    all new (or modified) columns are updated, while the *mol* column is only updated
+    if :attr:`Stage.modifies_mol` is ``True``.
+
+    All database interactions are serialized between processes.
+    Stages whose arguments cannot be pickled are executed in the main process.
+    If :code:`max_workers == 1` then all stages are executed in the main process, one at a time.
+
+    Parameters
+    ----------
+    df : |CAT.SettingsDataFrame|_
+        The dataframe which will be updated inplace by all stages.
+
+    stages : :class:`Iterable<collections.abc.Iterable>` [:class:`Stage`]
+        An iterable of stages.
+        Dependencies on stages absent from **stages** are ignored.
+
+    max_workers : :class:`int`
+        The maximum number of concurrently executed stages.
+
+    Raises
+    ------
+    ValueError
+        Raised if there is a circular dependency between any of the stages.
+
+    """
+    stage_list = _sort_stages(stages)
+    if max_workers == 1 or len(stage_list) <= 1:
+        for stage in stage_list:
+            stage.func(df, *stage.args)
+        return None
+
+    names = {stage.name for stage in stage_list}
+    pending: Dict[str, Stage] = {stage.name: stage for stage in stage_list}
+    running: Dict[Future, Tuple[Stage, float]] = {}
+    done: Set[str] = set()
+
+    logger.info(f"Running {len(stage_list)} stages with (at most) {max_workers} processes")
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers) as executor:
+        lock = manager.Lock()
+        while pending or running:
+            ready = [stage for stage in pending.values() if
+                     all(i in done or i not in names for i in stage.requires)]
+            for stage in ready:
+                del pending[stage.name]
+                try:
+                    payload = _get_payload(stage, df)
+                except (pickle.PicklingError, AttributeError, TypeError) as ex:
+                    logger.warning(f"Failed to pickle the {stage.name!r} stage; running it "
+                                   f"in the main process ({ex.__class__.__name__}: {ex})")
+                    with _swap_db_lock(lock):
+                        stage.func(df, *stage.args)
+                    done.add(stage.name)
+                    continue
+
+                logger.info(f"Submitting the {stage.name!r} stage")
+                fut = executor.submit(_run_stage, payload, lock)
+                running[fut] = stage, TIMING_REPORT.get_time()
+
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                stage, start = running.pop(fut)
+                ret, records = pickle.loads(fut.result())
+                _merge(df, ret, stage.modifies_mol)
+                for record in records:
+                    TIMING_REPORT.add(record._replace(start=record.start + start))
+                done.add(stage.name)
+                logger.info(f"Finishing the {stage.name!r} stage")
+    return None
@@ -46,7 +46,7 @@ class SettingsSeries(pd.Series):
 
     """
 
-    _metadata = ['settings']
+    _metadata = ['name', 'settings']
 
     def __init__(self, data=None, index=None, dtype=None, name=None, copy=False, fastpath=False,
                  settings: Optional[dict] = None) -> None:
@@ -0,0 +1,190 @@
+"""A module for recording the timings and throughput of the various CAT stages.
+
+Index
+-----
+.. currentmodule:: CAT.timing
+.. autosummary::
+    TimingRecord
+    TimingReport
+    TIMING_REPORT
+
+API
+---
+.. autoclass:: TimingRecord
+    :members:
+.. autoclass:: TimingReport
+    :members:
+.. autodata:: TIMING_REPORT
+    :annotation: = CAT.timing.TimingReport()
+
+"""
+
+import os
+import csv
+import json
+import time
+import threading
+from contextlib import contextmanager
+from typing import NamedTuple, List, Dict, Any, Iterator, Union
+
+import pandas as pd
+
+from .logger import logger
+
+__all__ = ['TimingRecord', 'TimingReport', 'TIMING_REPORT']
+
+PathType = Union[str, 'os.PathLike[str]']
+
+
+def _get_cpu_time() -> float:
+    """Return the CPU time of this process and all its terminated (and waited for) children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+class TimingRecord(NamedTuple):
+    """A named tuple with the timings and throughput of a single CAT stage or workflow."""
+
+    #: The name of the stage or workflow.
+    name: str
+
+    #: The start of the stage relative to the start of the report, in seconds.
+    start: float
+
+    #: The elapsed wall time in seconds.
+    wall_time: float
+
+    #: The elapsed CPU time in seconds,
+    #: including the CPU time of all (terminated) child processes.
+    cpu_time: float
+
+    #: The number of processed molecules.
+    n_mol: int
+
+    #: The number of molecules for which the stage failed.
+    n_failed: int
+
+    @property
+    def mol_per_sec(self) -> float:
+        """The number of processed molecules per second of wall time."""
+        return self.n_mol / self.wall_time if self.wall_time else float('nan')
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert this instance into a dictionary, including :attr:`mol_per_sec`."""
+        ret = self._asdict()
+        ret['mol_per_sec'] = self.mol_per_sec
+        return dict(ret)
+
+
+class _TimingCounter:
+    """A mutable counter for the number of (failed) molecules of a :class:`TimingRecord`."""
+
+    __slots__ = ('n_mol', 'n_failed')
+
+    def __init__(self, n_mol: int = 0, n_failed: int = 0) -> None:
+        self.n_mol = n_mol
+        self.n_failed = n_failed
+
+
+class TimingReport:
+    """A class for recording the timings and throughput of the various CAT stages.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from CAT.timing import TimingReport
+
+        >>> report = TimingReport()
+        >>> with report.record('my_stage', n_mol=10) as counter:
+        ...     counter.n_failed += 1
+
+        >>> record = report.records[0]
+        >>> record.name, record.n_mol, record.n_failed
+        ('my_stage', 10, 1)
+
+    """
+
+    #: The fields of a single record in :meth:`TimingReport.to_csv`.
+    FIELDS = TimingRecord._fields + ('mol_per_sec',)
+
+    def __init__(self) -> None:
+        """Initialize a :class:`TimingReport` instance."""
+        self._records: List[TimingRecord] = []
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    @property
+    def records(self) -> List[TimingRecord]:
+        """Get a copy of all records in this instance."""
+        with self._lock:
+            return self._records.copy()
+
+    def get_time(self) -> float:
+        """Return the number of seconds since the start of the report."""
+        return time.perf_counter() - self._start
+
+    def add(self, record: TimingRecord) -> None:
+        """Add a single (previously created) record to this instance."""
+        with self._lock:
+            self._records.append(record)
+
+    def clear(self) -> None:
+        """Remove all records and reset the start of the report."""
+        with self._lock:
+            self._records = []
+            self._start = time.perf_counter()
+
+    @contextmanager
+    def record(self, name: str, n_mol: int = 0) -> Iterator[_TimingCounter]:
+        """A context manager for timing the enclosed stage.
+
+        Yields a counter whose ``n_mol`` and ``n_failed`` attributes can be used for
+        updating the number of (failed) molecules.
+        Upon raising an exception all molecules are marked as failed.
+
+        """
+        counter = _TimingCounter(n_mol)
+        start = time.perf_counter()
+        cpu_start = _get_cpu_time()
+        try:
+            yield counter
+        except BaseException:
+            counter.n_failed = counter.n_mol
+            raise
+        finally:
+            wall_time = time.perf_counter() - start
+            cpu_time = _get_cpu_time() - cpu_start
+            record = TimingRecord(name, start - self._start, wall_time, cpu_time,
+                                  counter.n_mol, counter.n_failed)
+            self.add(record)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Convert all records into a DataFrame."""
+        data = [record.as_dict() for record in self.records]
+        return pd.DataFrame(data, columns=self.FIELDS)
+
+    def to_json(self, filename: PathType) -> None:
+        """Export all records to a .json file."""
+        data = [record.as_dict() for record in self.records]
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=4)
+
+    def to_csv(self, filename: PathType) -> None:
+        """Export all records to a .csv file."""
+        with open(filename, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(record.as_dict() for record in self.records)
+
+    def export(self, path: PathType) -> None:
+        """Export all records to the ``timings.json`` and ``timings.csv`` files in **path**."""
+        for ext, func in [('json', self.to_json), ('csv', self.to_csv)]:
+            filename = os.path.join(path, f'timings.{ext}')
+            func(filename)
+        logger.info(f"Exporting the timing report to {os.path.join(path, 'timings.(json|csv)')!r}")
+
+
+#: The global :class:`TimingReport` instance of CAT.
+#: It is reset at the start of every :func:`CAT.base.prep` call.
+TIMING_REPORT = TimingReport()
@@ -53,7 +53,10 @@ KEY_MAP: Mapping[str, Tuple[str, str]] = MappingProxyType({
     'SETTINGS_BDE1': ('settings', 'BDE 1'),
     'SETTINGS_BDE2': ('settings', 'BDE 2'),
     'SETTINGS_CDFT': ('settings', 'cdft 1'),
-    'V_BULK': ('V_bulk', '')
+    'V_BULK': ('V_bulk', ''),
+    'CLASH_MIN_DIST': ('clash', 'min distance'),
+    'CLASH_COUNT': ('clash', 'count'),
+    'FOOTPRINT_RATIO': ('screening', 'footprint ratio')
 })
 
 globals().update(KEY_MAP)
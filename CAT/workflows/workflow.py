@@ -14,13 +14,21 @@ API
 """
 
 import os
+import json
+import hashlib
+import inspect
 import operator
+import pickle
+import threading
 from shutil import rmtree
 from pathlib import Path
+from itertools import chain
 from collections import abc
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
     Optional, Union, Dict, Hashable, MutableMapping, TypeVar, Iterable, Container, Tuple, Callable,
-    Any, List, Type, Mapping, TYPE_CHECKING, cast, ClassVar, ContextManager
+    Any, List, Type, Mapping, TYPE_CHECKING, cast, ClassVar, ContextManager, Iterator, Sequence
 )
 
 import numpy as np
@@ -28,6 +36,7 @@ import pandas as pd
 
 import rdkit
 import qmflows
+from rdkit import Chem
 from rdkit.Chem.AllChem import UFFGetMoleculeForceField as UFF  # noqa: N814
 from scm.plams import finish, Settings, Molecule
 from scm.plams.core.basejob import Job
@@ -37,7 +46,18 @@ from .key_map import MOL, OPT
 from .workflow_dicts import WORKFLOW_TEMPLATE, _TemplateMapping
 from ..utils import restart_init, JOB_MAP
 from ..logger import logger
-from ..settings_dataframe import SettingsDataFrame
+from ..mol_utils import pickle_dumps
+from ..timing import TIMING_REPORT
+from ..cache import ResultCache
+from ..checkpoint import Checkpoint
+from ..frozen_settings import FrozenSettings
+from ..settings_dataframe import SettingsDataFrame, SettingsSeries
+
+try:
+    from threadpoolctl import threadpool_limits
+    THREADPOOLCTL: Optional[ImportError] = None
+except ImportError as ex:
+    THREADPOOLCTL = ex
 
 if TYPE_CHECKING:
     from dataCAT import Database
@@ -53,6 +73,56 @@ aNDRepr = NDRepr()
 
 T = TypeVar('T')
 
+#: A lock for serializing all database interactions of :class:`WorkFlow`.
+#: Substituted for a lock shared between processes by :func:`CAT.scheduler.run_stages`.
+DB_LOCK: ContextManager[Any] = threading.RLock()
+
+#: Attributes of :class:`WorkFlow` which do not affect the results of a workflow,
+#: and are thus ignored when constructing the keys of :attr:`WorkFlow.cache`.
+_CACHE_IGNORE = frozenset({
+    'db', 'read', 'write', 'overwrite', 'path', 'keep_files', 'n_workers',
+    'max_parallel_jobs', 'checkpoint', 'cache', 'dump_csv', 'mol_format', 'parallel_placement',
+    'batch_size'
+})
+
+
+def _to_cache_key(obj: Any) -> Any:
+    """Convert **obj** into a JSON-serializable object for :meth:`WorkFlow.get_cache_hash`.
+
+    Mappings (*e.g.* :class:`~scm.plams.core.settings.Settings`) are converted into
+    a sorted list of key/value pairs, thus supporting non-string keys,
+    while arrays are represented by their dtype, shape and the hash of their data.
+    Classes and functions are represented by their (qualified) name.
+
+    Raises
+    ------
+    TypeError
+        Raised if **obj** is of a type without an unambiguous serialization.
+
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return ['ndarray', list(obj.shape), _to_cache_key(obj.ravel().tolist())]
+        data = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+        return ['ndarray', obj.dtype.str, list(obj.shape), data]
+    elif isinstance(obj, abc.Mapping):
+        items = [[_to_cache_key(k), _to_cache_key(v)] for k, v in obj.items()]
+        return ['dict', sorted(items, key=lambda kv: json.dumps(kv[0]))]
+    elif isinstance(obj, (list, tuple)):
+        return [_to_cache_key(i) for i in obj]
+    elif isinstance(obj, (set, frozenset)):
+        return ['set', sorted((_to_cache_key(i) for i in obj), key=json.dumps)]
+    elif isinstance(obj, type) or inspect.isroutine(obj):
+        return f'{obj.__module__}.{obj.__qualname__}'
+    elif isinstance(obj, Chem.Mol):
+        return ['Mol', Chem.MolToSmiles(obj)]
+    raise TypeError(f"Unable to construct a cache key from an object of type "
+                    f"{obj.__class__.__name__!r}")
+
 
 def _return_true(value: object) -> bool:
     """Return :data:`True`."""
@@ -125,6 +195,132 @@ def pop_and_concatenate(mapping: MutableMapping[str, T], base_key: object,
             i += 1
 
 
+#: Environment variables used for limiting the number of threads spawned by BLAS/OpenMP.
+BLAS_ENV_VARS: Tuple[str, ...] = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMEXPR_NUM_THREADS'
+)
+
+
+@contextmanager
+def _limit_blas_threads(n: int = 1) -> Iterator[None]:
+    """Temporary limit the number of BLAS/OpenMP threads to **n**.
+
+    The environment variables in :data:`BLAS_ENV_VARS` are only respected by newly spawned
+    processes; the thread pools of already loaded libraries are (optionally)
+    limited with the help of threadpoolctl_.
+
+    .. _threadpoolctl: https://github.com/joblib/threadpoolctl
+
+    """
+    env_old = {k: os.environ.get(k) for k in BLAS_ENV_VARS}
+    os.environ.update({k: str(n) for k in BLAS_ENV_VARS})
+    try:
+        if THREADPOOLCTL is None:
+            with threadpool_limits(limits=n):
+                yield None
+        else:
+            yield None
+    finally:
+        for k, v in env_old.items():
+            if v is None:
+                del os.environ[k]
+            else:
+                os.environ[k] = v
+
+
+def _run_chunk(payload: bytes) -> bytes:
+    """Call a function on a chunk of molecules; used as target by :meth:`WorkFlow.__call__`.
+
+    **payload** is a pickled tuple consisting of the to-be called function,
+    a Series of molecules and a dictionary of keyword arguments.
+    The (potentially modified) molecules are returned together with the output of the function,
+    as inplace operations performed in a child process would otherwise be lost.
+
+    Pickling is herein performed with :func:`~CAT.mol_utils.pickle_dumps`,
+    ensuring that molecules remain in possession of any atoms stored in their properties
+    (*e.g.* the ligand anchor atom in ``Molecule.properties.dummies``).
+
+    """
+    func, mol_series, kwargs = pickle.loads(payload)
+    with _limit_blas_threads(1):
+        value = func(mol_series, **kwargs)
+    if isinstance(value, abc.Iterator):
+        value = list(value)
+    return pickle_dumps((value, mol_series))
+
+
+def _del_db(obj: T) -> T:
+    """Return a shallow copy of **obj** without the :class:`~dataCAT.Database` in its settings.
+
+    Database instances are not designed to be shared between processes.
+    Objects without a :attr:`~.SettingsDataFrame.settings` attribute are returned unaltered.
+
+    """
+    if not isinstance(obj, (SettingsDataFrame, SettingsSeries)):
+        return obj
+    elif not obj.settings.optional.database.db:
+        return obj
+
+    settings = Settings(obj.settings)
+    settings.optional.database.db = False
+    ret = obj.copy(deep=False)
+    ret.settings = FrozenSettings(settings)
+    return ret
+
+
+def _get_chunks(n: int, n_workers: int, chunks_per_worker: int = 4) -> List[Tuple[int, int]]:
+    """Return a list of start/stop pairs for dividing a sequence of length **n** into chunks.
+
+    Examples
+    --------
+    .. code:: python
+
+        >>> from CAT.workflows.workflow import _get_chunks
+
+        >>> _get_chunks(10, n_workers=2, chunks_per_worker=2)
+        [(0, 2), (2, 5), (5, 7), (7, 10)]
+
+    """
+    n_chunks = max(1, min(n, n_workers * chunks_per_worker))
+    bounds = np.linspace(0, n, n_chunks + 1).astype(int)
+    return list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+
+def _concatenate(value_list: Sequence[Any], no_loc: bool = False) -> Any:
+    """Concatenate the chunk-wise output of :func:`_run_chunk`, preserving the order of rows."""
+    if all(value is None for value in value_list):
+        return None
+
+    value = value_list[0]
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return pd.concat(value_list)
+    elif isinstance(value, list) and not no_loc:
+        return list(chain.from_iterable(value_list))
+    else:  # In the no_loc case each row in the array represents a column in the dataframe
+        return np.concatenate(value_list, axis=int(no_loc))
+
+
+def _count_failed_mol(mol_series: pd.Series) -> int:
+    """Return the number of molecules in **mol_series** marked as unoptimized (``is_opt=False``).
+
+    Used for workflows which modify their molecules inplace rather than returning any results.
+
+    """
+    return sum(mol.properties.get('is_opt', True) is False for mol in mol_series)
+
+
+def _count_failed_rows(df: Union[pd.Series, pd.DataFrame]) -> int:
+    """Return the number of rows in **df** consisting exclusively of null values."""
+    is_null = df.isnull()
+    if isinstance(is_null, pd.DataFrame):
+        is_null = is_null.all(axis=1)
+    return int(is_null.sum())
+
+
 OptionalJobType = Union[None, Type[Job], Iterable[Optional[Type[Job]]]]
 OptionalSettings = Union[None, Settings, Iterable[Optional[Settings]]]
 
@@ -311,6 +507,9 @@ class WorkFlow(AbstractDataClass):
                  read_template: bool = True,
                  jobs: OptionalJobType = None,
                  settings: OptionalSettings = None,
+                 n_workers: int = 1,
+                 checkpoint: Optional[Checkpoint] = None,
+                 cache: Optional[ResultCache] = None,
                  **kwargs: Any) -> None:
         """Initialize a :class:`WorkFlow` instance; see also :meth:`Workflow.from_template`."""
         super().__init__()
@@ -331,6 +530,9 @@ class WorkFlow(AbstractDataClass):
         self.read_template = read_template
         self.jobs = cast(Tuple[Optional[Type[Job]], ...], jobs)
         self.settings = cast(Tuple[Optional[Settings], ...], settings)
+        self.n_workers = n_workers
+        self.checkpoint = checkpoint
+        self.cache = cache
 
         for k, v in kwargs.items():
             if hasattr(self, k):
@@ -377,6 +579,24 @@ class WorkFlow(AbstractDataClass):
         \**kwargs : :data:`Any<typing.Any>`
             Optional keyword arguments for **func**.
 
+        Note
+        ----
+        If :attr:`WorkFlow.n_workers` is larger than ``1`` then the selected rows
+        of **df** are divided into chunks and distributed over a pool of
+        :attr:`WorkFlow.n_workers` processes (see :class:`~concurrent.futures.ProcessPoolExecutor`).
+        In this case both **func** and its arguments must be picklable.
+        :attr:`WorkFlow.db` is not passed to the worker processes.
+
+        If :attr:`WorkFlow.checkpoint` is specified (and has a non-``None``
+        :attr:`~CAT.checkpoint.Checkpoint.interval`) then the selected rows of **df** are
+        processed in chunks, the results of each chunk being checkpointed.
+        Chunks of which the results are already available will be skipped.
+
+        If :attr:`WorkFlow.cache` is specified then the results of all molecules
+        are imported from and exported to the cache (see :class:`~CAT.cache.ResultCache`),
+        **func** only being called on molecules absent from the cache.
+        The cache is not used if **no_loc** is ``True``.
+
         See Also
         --------
         :meth:`Workflow.from_db`:
@@ -393,24 +613,195 @@ class WorkFlow(AbstractDataClass):
         logger.info(f"Starting {self.description}")
         with PlamsInit(path=self.path, folder=self.name), self._SUPRESS_SETTINGWITHCOPYWARNING:
             self_vars = {k.strip('_'): v for k, v in vars(self).items()}
-            value = func(df.loc[slice1], columns=columns, **self_vars, **kwargs)
+            mol_series = df.loc[slice1]
 
-            if not isinstance(value, abc.Iterator) and not np.any(value):
-                return
-            elif no_loc:
-                for k, v in zip(slice2[1], value):
-                    df[k] = v
-            else:
+            # Import all previously cached results
+            cache_hash: Optional[str] = None
+            if self.cache is not None and not no_loc:
                 try:
-                    df.loc[slice2] = value
-                except ValueError as ex:
-                    logger.debug(f"df = {aNDRepr.repr(df)}")
-                    logger.debug(f"index = {aNDRepr.repr(slice2[0])}")
-                    logger.debug(f"columns = {aNDRepr.repr(slice2[1])}")
-                    logger.debug(f"value = {aNDRepr.repr(value)}")
-                    raise ex
+                    cache_hash = self.get_cache_hash(func, slice2[1])
+                except TypeError as ex:
+                    logger.warning(f"Unable to cache the results of {self.description}: {ex}")
+                    is_cached = np.zeros(len(mol_series), dtype=bool)
+                else:
+                    is_cached = self._from_cache(df, mol_series.index, slice2[1], cache_hash)
+                if is_cached.any():
+                    logger.info(f"Loading {is_cached.sum()} / {len(is_cached)} molecules "
+                                "from the cache")
+                    mol_series = mol_series[~is_cached]
+                    slice1 = mol_series.index, MOL
+                    slice2 = mol_series.index, slice2[1]
+                if not len(mol_series):
+                    logger.info(f"Finishing {self.description}\n")
+                    return
+
+            with TIMING_REPORT.record(self.name, n_mol=len(mol_series)) as counter:
+                interval = getattr(self.checkpoint, 'interval', None)
+                if interval is not None and len(mol_series) > interval:
+                    value, mol_series = self._call_checkpoint(
+                        func, mol_series, no_loc, columns=columns, **self_vars, **kwargs
+                    )
+                    df.loc[slice1] = mol_series
+                elif self.n_workers > 1 and len(mol_series) > 1:
+                    value, mol_series = self._call_parallel(
+                        func, mol_series, no_loc, columns=columns, **self_vars, **kwargs
+                    )
+                    df.loc[slice1] = mol_series
+                else:
+                    value = func(mol_series, columns=columns, **self_vars, **kwargs)
+
+                if not isinstance(value, abc.Iterator) and not np.any(value):
+                    counter.n_failed = _count_failed_mol(mol_series)
+                    if cache_hash is not None:
+                        self._to_cache(df, mol_series.index, slice2[1], cache_hash)
+                    return
+                elif no_loc:
+                    for k, v in zip(slice2[1], value):
+                        df[k] = v
+                else:
+                    try:
+                        df.loc[slice2] = value
+                    except ValueError as ex:
+                        logger.debug(f"df = {aNDRepr.repr(df)}")
+                        logger.debug(f"index = {aNDRepr.repr(slice2[0])}")
+                        logger.debug(f"columns = {aNDRepr.repr(slice2[1])}")
+                        logger.debug(f"value = {aNDRepr.repr(value)}")
+                        raise ex
+                counter.n_failed = _count_failed_rows(df.loc[slice2])
+                if cache_hash is not None:
+                    self._to_cache(df, mol_series.index, slice2[1], cache_hash)
         logger.info(f"Finishing {self.description}\n")
 
+    def get_cache_hash(self, func: Callable, columns: Union[Hashable, List[Hashable]]) -> str:
+        """Construct a hash of all parameters affecting the results of this workflow.
+
+        Besides **func** and **columns** all instance attributes are used,
+        with the exception of those that do not affect the actual results
+        (*e.g.* :attr:`WorkFlow.path` and :attr:`WorkFlow.n_workers`).
+        The hash is used for constructing the keys of :attr:`WorkFlow.cache`.
+
+        Raises
+        ------
+        TypeError
+            Raised if one of the attributes cannot be unambiguously serialized
+            (see :func:`_to_cache_key`).
+
+        """
+        self_vars = {k.strip('_'): v for k, v in vars(self).items() if
+                     k.strip('_') not in _CACHE_IGNORE}
+        column_list = columns if isinstance(columns, list) else [columns]
+        key = _to_cache_key([func, [str(i) for i in column_list], self_vars])
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    @staticmethod
+    def _get_cache_columns(columns: Union[Hashable, List[Hashable]]) -> List[Hashable]:
+        """Return all columns in **columns** except *mol*; molecules are always cached."""
+        column_list = columns if isinstance(columns, list) else [columns]
+        return [i for i in column_list if i != MOL]
+
+    def _from_cache(self, df: pd.DataFrame, index: pd.Index,
+                    columns: Union[Hashable, List[Hashable]], cache_hash: str) -> np.ndarray:
+        """Import the cached molecules and results of all rows in **index** into **df**.
+
+        Returns a boolean array denoting which rows were imported from the cache.
+
+        """
+        cache = cast(ResultCache, self.cache)
+        keys = [cache.get_key(cache_hash, i) for i in index]
+        values = cache.get_many(keys)
+        is_cached = np.fromiter((k in values for k in keys), count=len(keys), dtype=bool)
+        if not is_cached.any():
+            return is_cached
+
+        idx = index[is_cached]
+        value_list, mol_list = zip(*[pickle.loads(values[k]) for k in keys if k in values])
+        with self._SUPRESS_SETTINGWITHCOPYWARNING:
+            df.loc[idx, MOL] = pd.Series(mol_list, index=idx, dtype=object)
+            for i, key in enumerate(self._get_cache_columns(columns)):
+                df.loc[idx, key] = pd.Series([v[i] for v in value_list], index=idx)
+        return is_cached
+
+    def _to_cache(self, df: pd.DataFrame, index: pd.Index,
+                  columns: Union[Hashable, List[Hashable]], cache_hash: str) -> None:
+        """Export the molecules and results of all rows in **index** to the cache.
+
+        Rows without a molecule or wherein all results are null are skipped.
+
+        """
+        cache = cast(ResultCache, self.cache)
+        column_list = self._get_cache_columns(columns)
+        if column_list:
+            value_iter = zip(*[df.loc[index, k].tolist() for k in column_list])
+            is_null = self._isnull(df.loc[index], column_list).all(axis=1).values
+        else:
+            value_iter = (() for _ in index)
+            is_null = np.zeros(len(index), dtype=bool)
+
+        mapping = {}
+        iterator = zip(index, df.loc[index, MOL], value_iter, is_null)
+        for i, mol, value, null in iterator:
+            if mol is None or null:
+                continue
+            mapping[cache.get_key(cache_hash, i)] = pickle_dumps((value, mol))
+        cache.set_many(self.mol_type, mapping)
+
+    def _call_checkpoint(self, func: Callable, mol_series: pd.Series, no_loc: bool = False,
+                         **kwargs: Any) -> Tuple[Any, pd.Series]:
+        """Divide **mol_series** into chunks and checkpoint the results of **func** for each chunk.
+
+        Returns the concatenated output of **func** and a (new) Series with all
+        molecules, as the latter could have been altered inplace by **func**
+        (or loaded from a previous checkpoint).
+
+        """
+        checkpoint = cast(Checkpoint, self.checkpoint)
+        interval = cast(int, checkpoint.interval)
+        key = checkpoint.get_key(self.name, mol_series.index)
+
+        value_list = []
+        mol_list = []
+        for i, j in enumerate(range(0, len(mol_series), interval)):
+            ret = checkpoint.load_chunk(self.mol_type, key, i)
+            if ret is not None:
+                logger.info(f"Loading chunk {i} of the {self.description} from a checkpoint")
+            else:
+                chunk = mol_series.iloc[j:j + interval]
+                if self.n_workers > 1 and len(chunk) > 1:
+                    ret = self._call_parallel(func, chunk, no_loc, **kwargs)
+                else:
+                    value = func(chunk, **kwargs)
+                    if isinstance(value, abc.Iterator):
+                        value = list(value)
+                    ret = value, chunk
+                checkpoint.save_chunk(self.mol_type, key, i, *ret)
+
+            value_list.append(ret[0])
+            mol_list.append(ret[1])
+        return _concatenate(value_list, no_loc=no_loc), pd.concat(mol_list)
+
+    def _call_parallel(self, func: Callable, mol_series: pd.Series, no_loc: bool = False,
+                       **kwargs: Any) -> Tuple[Any, pd.Series]:
+        """Divide **mol_series** into chunks and pass them to **func** in a pool of processes.
+
+        Returns the concatenated output of **func** and a (new) Series with all
+        molecules, as the latter could have been altered inplace by **func**.
+
+        """
+        n_workers = min(self.n_workers, len(mol_series))
+        kwargs = {k: _del_db(v) for k, v in kwargs.items()}
+        kwargs['db'] = None
+        mol_series = _del_db(mol_series)
+
+        logger.info(f"Distributing {len(mol_series)} molecules over {n_workers} processes")
+        with _limit_blas_threads(1), ProcessPoolExecutor(max_workers=n_workers) as executor:
+            payloads = (pickle_dumps((func, mol_series.iloc[i:j], kwargs)) for
+                        i, j in _get_chunks(len(mol_series), n_workers))
+            futures = [executor.submit(_run_chunk, payload) for payload in payloads]
+            value_list, mol_list = zip(*[pickle.loads(fut.result()) for fut in futures])
+
+        value = _concatenate(value_list, no_loc=no_loc)
+        return value, pd.concat(mol_list)
+
     def from_db(self, df: pd.DataFrame, inplace: bool = True, get_mol: bool = True,
                 columns: Optional[Mapping] = None) -> Union[slice, pd.Series]:
         """Ensure that all required keys are present in **df** and import from the database.
@@ -457,7 +848,7 @@ class WorkFlow(AbstractDataClass):
             return slice(None)
 
         # Import from the database
-        with self._SUPRESS_SETTINGWITHCOPYWARNING:
+        with self._SUPRESS_SETTINGWITHCOPYWARNING, DB_LOCK:
             mol_list = self.db.from_csv(df, database=self.mol_type,
                                         get_mol=get_mol, inplace=inplace)
             if not inplace:  # mol_list is an actual sequence instead of None
@@ -509,7 +900,7 @@ class WorkFlow(AbstractDataClass):
 
         # Write results to the database
         if self.write:
-            with self._SUPRESS_SETTINGWITHCOPYWARNING:
+            with self._SUPRESS_SETTINGWITHCOPYWARNING, DB_LOCK:
                 self.db.update_csv(
                     df.loc[index],
                     database=self.mol_type,
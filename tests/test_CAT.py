@@ -1,14 +1,19 @@
 """Tests for the various workflows within the CAT package."""
 
+import copy
+import json
 from pathlib import Path
 from typing import Optional
 
 import yaml
 import pytest
+import numpy as np
 from scm.plams import Settings
 from nanoutils import delete_finally, ignore_if
+from assertionlib import assertion
 
 from CAT.base import prep
+from CAT.workflows import MOL
 
 try:
     import nanoCAT  # noqa: F401
@@ -20,11 +25,12 @@ PATH = Path('tests') / 'test_files'
 LIG_PATH = PATH / 'ligand'
 QD_PATH = PATH / 'qd'
 DB_PATH = PATH / 'database'
+TIMINGS_PATHS = (PATH / 'timings.json', PATH / 'timings.csv')
 
 
 @pytest.mark.slow
 @ignore_if(NANOCAT_EX)
-@delete_finally(LIG_PATH, QD_PATH, DB_PATH)
+@delete_finally(LIG_PATH, QD_PATH, DB_PATH, *TIMINGS_PATHS)
 def test_cat() -> None:
     """Tests for the CAT package."""
     yaml_path = PATH / 'CAT.yaml'
@@ -33,3 +39,34 @@ def test_cat() -> None:
 
     arg.path = PATH
     prep(arg)
+
+
+@delete_finally(LIG_PATH, QD_PATH, DB_PATH, *TIMINGS_PATHS)
+def test_cat_chunked() -> None:
+    """Tests for the ``optional.qd.chunk_size`` option."""
+    arg = Settings()
+    arg.path = PATH
+    arg.input_cores = ['Cd68Se55.xyz']
+    arg.input_ligands = ['CO', 'CCO', 'CCCO']
+    arg.optional.database.read = False
+    arg.optional.database.write = False
+    arg.optional.database.mol_format = ['xyz']
+    arg.optional.core.dummy = 'Cl'
+    arg.optional.ligand.optimize = False
+    arg.optional.ligand.split = True
+
+    qd_df1, *_ = prep(copy.deepcopy(arg))
+    xyz1 = {f.name: f.read_text() for f in QD_PATH.glob('*.xyz')}
+
+    arg.optional.qd.chunk_size = 2
+    qd_df2, *_ = prep(copy.deepcopy(arg))
+    xyz2 = {f.name: f.read_text() for f in QD_PATH.glob('*.xyz')}
+
+    np.testing.assert_array_equal(qd_df1.index, qd_df2.index)
+    assertion.eq(len(xyz1), 3)
+    assertion.eq(xyz1, xyz2)
+    assertion.assert_(qd_df2[MOL].isnull().all)
+
+    with open(TIMINGS_PATHS[0], 'r') as f:
+        names = {record['name'] for record in json.load(f)}
+    assertion.le({'prep_input', 'prep_core', 'qd_attach', 'mol_to_file'}, names)
@@ -0,0 +1,75 @@
+"""Tests for :mod:`CAT.async_api`."""
+
+import time
+import asyncio
+import threading
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from scm.plams import Settings
+from nanoutils import delete_finally
+from assertionlib import assertion
+
+from CAT.base import prep
+from CAT.workflows import MOL
+from CAT.async_api import run_in_executor, prep_async
+
+PATH = Path('tests') / 'test_files'
+LIG_PATH = PATH / 'ligand'
+QD_PATH = PATH / 'qd'
+DB_PATH = PATH / 'database'
+TIMINGS_PATHS = (PATH / 'timings.json', PATH / 'timings.csv')
+
+
+def test_run_in_executor() -> None:
+    """Tests for :func:`CAT.async_api.run_in_executor`."""
+    lock = threading.Lock()
+    count = [0]
+    count_max: List[int] = []
+
+    def func(i: int) -> int:
+        with lock:
+            count[0] += 1
+            count_max.append(count[0])
+        time.sleep(0.05)
+        with lock:
+            count[0] -= 1
+        return i
+
+    async def main() -> List[int]:
+        semaphore = asyncio.Semaphore(2)
+        coros = [run_in_executor(None, func, i, semaphore=semaphore) for i in range(6)]
+        return await asyncio.gather(*coros)
+
+    loop = asyncio.new_event_loop()
+    try:
+        out = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assertion.eq(out, list(range(6)))
+    assertion.le(max(count_max), 2)
+
+
+@delete_finally(LIG_PATH, QD_PATH, DB_PATH, *TIMINGS_PATHS)
+def test_prep_async() -> None:
+    """Tests for :func:`CAT.async_api.prep_async`."""
+    arg = Settings()
+    arg.path = PATH
+    arg.input_cores = ['Cd68Se55.xyz']
+    arg.input_ligands = ['CO', 'CCO']
+    arg.optional.database.read = False
+    arg.optional.database.write = False
+    arg.optional.database.mol_format = None
+    arg.optional.ligand.optimize = False
+
+    loop = asyncio.new_event_loop()
+    try:
+        qd_df1, *_ = loop.run_until_complete(prep_async(arg.copy()))
+    finally:
+        loop.close()
+    qd_df2, *_ = prep(arg.copy())
+
+    np.testing.assert_array_equal(qd_df1.index, qd_df2.index)
+    for mol1, mol2 in zip(qd_df1[MOL], qd_df2[MOL]):
+        np.testing.assert_allclose(mol1.as_array(), mol2.as_array())
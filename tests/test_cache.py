@@ -0,0 +1,55 @@
+"""Tests for :mod:`CAT.cache`."""
+
+import time
+import pickle
+from pathlib import Path
+
+from assertionlib import assertion
+from nanoutils import delete_finally
+
+from CAT.cache import ResultCache
+
+PATH = Path('tests') / 'test_files'
+CACHE_PATH = PATH / 'cache.db'
+
+
+@delete_finally(CACHE_PATH)
+def test_cache() -> None:
+    """Tests for :class:`CAT.cache.ResultCache`."""
+    cache = ResultCache(CACHE_PATH)
+    assertion.isfile(CACHE_PATH)
+    assertion.eq(cache.get_info(), (0, 0))
+
+    key1 = cache.get_key('a', ('CCO', 'O3'))
+    key2 = cache.get_key('b', ('CCO', 'O3'))
+    assertion.ne(key1, key2)
+    assertion.eq(key1, cache.get_key('a', ('CCO', 'O3')))
+
+    cache.set_many('ligand', {key1: b'1', key2: b'22'})
+    assertion.eq(cache.get_info(), (2, 3))
+    assertion.eq(cache.get_many([key1, key2, 'bob']), {key1: b'1', key2: b'22'})
+
+    cache2 = pickle.loads(pickle.dumps(cache))
+    assertion.eq(cache2.get_many([key1]), {key1: b'1'})
+
+    cache.clear('qd')
+    assertion.eq(cache.get_info()[0], 2)
+    cache.clear('ligand')
+    assertion.eq(cache.get_info()[0], 0)
+
+
+@delete_finally(CACHE_PATH)
+def test_cache_evict() -> None:
+    """Tests for the LRU eviction of :class:`CAT.cache.ResultCache`."""
+    cache = ResultCache(CACHE_PATH, max_size=10)
+    cache.set_many('ligand', {'a': b'a' * 4})
+    time.sleep(0.01)
+    cache.set_many('ligand', {'b': b'b' * 4})
+    time.sleep(0.01)
+
+    # Access "a"; "b" is now the least recently used entry
+    cache.get_many(['a'])
+    time.sleep(0.01)
+    cache.set_many('ligand', {'c': b'c' * 4})
+    assertion.eq(cache.get_many(['a', 'b', 'c']).keys(), {'a', 'c'})
+    assertion.eq(cache.get_info(), (2, 8))
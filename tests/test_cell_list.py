@@ -0,0 +1,80 @@
+"""Tests for :mod:`CAT.attachment.cell_list`."""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from assertionlib import assertion
+
+from CAT.attachment.cell_list import CellList
+
+
+def test_cell_list() -> None:
+    """Test :class:`CAT.attachment.cell_list.CellList`."""
+    np.random.seed(1)
+    xyz = 20 * np.random.rand(200, 3)
+    xyz_query = 25 * np.random.rand(50, 3)
+
+    cell_list = CellList(xyz[:100], distance_upper_bound=3.0)
+    for i in range(100, 200, 25):
+        cell_list.insert(xyz[i:i+25])
+    assertion.len_eq(cell_list, 200)
+    np.testing.assert_array_equal(cell_list.xyz, xyz)
+
+    tree = cKDTree(xyz)
+    dist_ref, idx_ref = tree.query(xyz_query, k=10, distance_upper_bound=3.0)
+    dist, idx = cell_list.query(xyz_query, k=10)
+    np.testing.assert_allclose(dist, dist_ref)
+    np.testing.assert_array_equal(idx, idx_ref)
+
+    assertion.assert_(CellList, xyz, distance_upper_bound=0, exception=ValueError)
+
+
+def test_cell_list_update() -> None:
+    """Test :meth:`CAT.attachment.cell_list.CellList.remove` and :meth:`~CellList.update`."""
+    np.random.seed(2)
+    xyz = 20 * np.random.rand(200, 3)
+    xyz_query = 25 * np.random.rand(50, 3)
+    cell_list = CellList(xyz, distance_upper_bound=3.0)
+
+    cell_list.remove(np.arange(150, 200))
+    dist, _ = cell_list.query(xyz_query, k=10)
+    dist_ref, _ = cKDTree(xyz[:150]).query(xyz_query, k=10, distance_upper_bound=3.0)
+    np.testing.assert_allclose(dist, dist_ref)
+
+    xyz[150:] = 20 * np.random.rand(50, 3)
+    cell_list.update(np.arange(150, 200), xyz[150:])
+    cell_list.update(np.arange(0, 10), xyz[:10])
+    assertion.len_eq(cell_list, 200)
+    dist, idx = cell_list.query(xyz_query, k=10)
+    dist_ref, idx_ref = cKDTree(xyz).query(xyz_query, k=10, distance_upper_bound=3.0)
+    np.testing.assert_allclose(dist, dist_ref)
+    np.testing.assert_array_equal(idx, idx_ref)
+
+
+def test_cell_list_nan() -> None:
+    """Test :class:`CAT.attachment.cell_list.CellList` with ``nan``-padded coordinates."""
+    np.random.seed(3)
+    xyz = 20 * np.random.rand(200, 3)
+    xyz_query = 25 * np.random.rand(50, 3)
+    xyz[::4] = np.nan
+    xyz_query[::5] = np.nan
+    finite = np.isfinite(xyz_query).all(axis=1)
+
+    cell_list = CellList(xyz, distance_upper_bound=3.0)
+    assertion.len_eq(cell_list, 200)
+    dist, idx = cell_list.query(xyz_query, k=10)
+    assertion.assert_(np.all, dist[~finite] == np.inf)
+    np.testing.assert_array_equal(idx[~finite], len(cell_list))
+
+    dist_ref, _ = cKDTree(np.delete(xyz, np.s_[::4], axis=0)).query(
+        xyz_query[finite], k=10, distance_upper_bound=3.0
+    )
+    np.testing.assert_allclose(dist[finite], dist_ref)
+
+    # Replace the nan-padded points
+    xyz[::4] = 20 * np.random.rand(50, 3)
+    cell_list.update(np.arange(0, 200, 4), xyz[::4])
+    dist, idx = cell_list.query(xyz_query[finite], k=10)
+    dist_ref, idx_ref = cKDTree(xyz).query(xyz_query[finite], k=10, distance_upper_bound=3.0)
+    np.testing.assert_allclose(dist, dist_ref)
+    np.testing.assert_array_equal(idx, idx_ref)
@@ -0,0 +1,88 @@
+"""Tests for :mod:`CAT.checkpoint`."""
+
+import os
+import pickle
+from pathlib import Path
+
+import pandas as pd
+
+from scm.plams import Settings, Molecule
+from assertionlib import assertion
+from nanoutils import delete_finally
+
+from CAT.checkpoint import Checkpoint, get_fingerprints, STAGES
+from CAT.settings_dataframe import SettingsDataFrame
+
+PATH = Path('tests') / 'test_files'
+CHECKPOINT_PATH = PATH / 'checkpoint'
+MOL = Molecule(PATH / 'Methanol.xyz')
+
+SETTINGS = Settings({
+    'path': str(PATH),
+    'input_cores': ['Cd68Se55.xyz'],
+    'input_ligands': ['CO', 'CCO'],
+    'optional': {'qd': {'optimize': True}},
+})
+
+
+def test_get_fingerprints() -> None:
+    """Tests for :func:`CAT.checkpoint.get_fingerprints`."""
+    fp = get_fingerprints(SETTINGS)
+    assertion.eq(fp.keys(), STAGES.keys())
+    assertion.eq(fp, get_fingerprints(SETTINGS.copy()))
+
+    s = SETTINGS.copy()
+    s.optional.qd.optimize = False
+    fp2 = get_fingerprints(s)
+    assertion.eq(fp['core'], fp2['core'])
+    assertion.eq(fp['ligand'], fp2['ligand'])
+    assertion.ne(fp['qd'], fp2['qd'])
+
+    s = SETTINGS.copy()
+    s.optional.core.dummy = 'Br'
+    fp3 = get_fingerprints(s)
+    assertion.ne(fp['core'], fp3['core'])
+    assertion.eq(fp['ligand'], fp3['ligand'])
+    assertion.ne(fp['qd'], fp3['qd'])
+
+    s = SETTINGS.copy()
+    s.optional.ligand = True  # Should not raise a TypeError
+    assertion.ne(fp['ligand'], get_fingerprints(s)['ligand'])
+
+
+@delete_finally(CHECKPOINT_PATH)
+def test_checkpoint() -> None:
+    """Tests for :class:`CAT.checkpoint.Checkpoint`."""
+    checkpoint = Checkpoint(CHECKPOINT_PATH, get_fingerprints(SETTINGS), interval=1)
+    assertion.isdir(CHECKPOINT_PATH)
+    assertion.is_(checkpoint.load('core'), None)
+
+    checkpoint2 = pickle.loads(pickle.dumps(checkpoint))
+    assertion.eq(checkpoint2.path, checkpoint.path)
+    assertion.eq(checkpoint2.fingerprints, checkpoint.fingerprints)
+    assertion.eq(checkpoint2.interval, checkpoint.interval)
+
+    # Intra-workflow checkpoints
+    mol_series = pd.Series([MOL, MOL.copy()])
+    key = checkpoint.get_key('asa', mol_series.index)
+    assertion.is_(checkpoint.load_chunk('core', key, 0), None)
+    checkpoint.save_chunk('core', key, 0, [1.0, 2.0], mol_series)
+    value, mol_series2 = checkpoint.load_chunk('core', key, 0)
+    assertion.eq(value, [1.0, 2.0])
+    assertion.eq(len(mol_series2), 2)
+    for mol1, mol2 in zip(mol_series, mol_series2):
+        assertion.eq(mol1.as_array().tolist(), mol2.as_array().tolist())
+
+    # Stage checkpoints; these should remove all intra-workflow checkpoints
+    df = SettingsDataFrame({'mol': mol_series}, settings={'a': 1})
+    checkpoint.save('core', df)
+    assertion.eq(len(os.listdir(CHECKPOINT_PATH)), 1)
+    df2 = checkpoint.load('core')
+    assertion.isinstance(df2, pd.DataFrame)
+    assertion.eq(df2.index.tolist(), df.index.tolist())
+    assertion.eq(df2.columns.tolist(), df.columns.tolist())
+
+    # Checkpoints with a different fingerprint should be ignored
+    fingerprints = dict(checkpoint.fingerprints, core='0' * 64)
+    checkpoint3 = Checkpoint(CHECKPOINT_PATH, fingerprints)
+    assertion.is_(checkpoint3.load('core'), None)
@@ -18,10 +18,11 @@ PATH = Path('tests') / 'test_files'
 LIG_PATH = PATH / 'ligand'
 QD_PATH = PATH / 'qd'
 DB_PATH = PATH / 'database'
+TIMINGS_PATHS = (PATH / 'timings.json', PATH / 'timings.csv')
 PATH_REF = PATH / 'ligand_ref'
 
 
-@delete_finally(LIG_PATH, QD_PATH, DB_PATH)
+@delete_finally(LIG_PATH, QD_PATH, DB_PATH, *TIMINGS_PATHS)
 def test_main() -> None:
     """Test :func:`CAT.data_handling.entry_points.main`."""
     filename = str(PATH / 'input2.yaml')
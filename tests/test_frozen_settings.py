@@ -1,5 +1,7 @@
 """Tests for :mod:`CAT.frozen_settings`."""
 
+import pickle
+
 from assertionlib import assertion
 
 from CAT.frozen_settings import FrozenSettings
@@ -30,3 +32,10 @@ def test_copy() -> None:
     settings = SETTINGS.copy()
     assertion.eq(settings, SETTINGS)
     assertion.is_not(settings, SETTINGS)
+
+
+def test_pickle() -> None:
+    """Tests for :meth:`CAT.frozen_settings.FrozenSettings.__reduce__`."""
+    settings = pickle.loads(pickle.dumps(SETTINGS))
+    assertion.eq(settings, SETTINGS)
+    assertion.isinstance(settings, FrozenSettings)
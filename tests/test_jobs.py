@@ -0,0 +1,46 @@
+"""Tests for :mod:`CAT.jobs`."""
+
+import time
+import threading
+from typing import List, Optional
+
+from scm.plams import Molecule, JobRunner
+from assertionlib import assertion
+
+from CAT.jobs import map_parallel_jobs
+
+
+def _append(mol: Molecule, out: List[int], jobrunner: Optional[JobRunner] = None) -> None:
+    mol.properties.jobrunner = jobrunner
+    mol.properties.thread = threading.get_ident()
+    time.sleep(0.1)
+    out.append(mol.properties.i)
+
+
+def test_map_parallel_jobs() -> None:
+    """Tests for :func:`CAT.jobs.map_parallel_jobs`."""
+    mol_list = [Molecule() for _ in range(4)]
+    for i, mol in enumerate(mol_list):
+        mol.properties.i = i
+
+    out: List[int] = []
+    map_parallel_jobs(_append, mol_list, out)
+    assertion.eq(out, [0, 1, 2, 3])
+    for mol in mol_list:
+        assertion.is_(mol.properties.jobrunner, None)
+
+    out = []
+    map_parallel_jobs(_append, mol_list, out, max_parallel_jobs=2)
+    assertion.eq(sorted(out), [0, 1, 2, 3])
+    assertion.eq(len({mol.properties.thread for mol in mol_list}), 2)
+
+    jobrunner = mol_list[0].properties.jobrunner
+    assertion.isinstance(jobrunner, JobRunner)
+    assertion.is_(jobrunner.parallel, True)
+    assertion.eq(jobrunner.maxjobs, 2)
+    for mol in mol_list:
+        assertion.is_(mol.properties.jobrunner, jobrunner)
+
+    mol_list.append(None)  # Exception: the error should be re-raised in the main thread
+    assertion.assert_(map_parallel_jobs, _append, mol_list, out, max_parallel_jobs=2,
+                      exception=AttributeError)
@@ -0,0 +1,61 @@
+"""Tests for :mod:`CAT.attachment.kernels`."""
+
+import numpy as np
+
+from assertionlib import assertion
+
+from CAT.attachment.cell_list import CellList
+from CAT.attachment.kernels import (
+    NUMBA, get_backend, set_backend, weighted_dist, nan_update_arg
+)
+from CAT.attachment.ligand_attach import _get_weighted_dist
+
+
+def test_weighted_dist() -> None:
+    """Test :func:`CAT.attachment.kernels.weighted_dist`."""
+    np.random.seed(3)
+    xyz_other = 15 * np.random.rand(300, 3)
+    xyz = 5 + 5 * np.random.rand(8, 12, 3)
+    cell_list = CellList(xyz_other, distance_upper_bound=4.0)
+
+    backend = get_backend()
+    try:
+        set_backend('numpy')
+        ref = _get_weighted_dist(cell_list, xyz, k=10)
+    finally:
+        set_backend(backend)
+
+    xyz_candidates = cell_list.xyz[cell_list.query_candidates(xyz)]
+    assertion.le(len(xyz_candidates), len(xyz_other))
+    np.testing.assert_allclose(weighted_dist(xyz, xyz_candidates, 4.0, 10), ref)
+    np.testing.assert_allclose(weighted_dist(xyz, xyz_other, 4.0, 10), ref)
+
+
+def test_nan_update_arg() -> None:
+    """Test :func:`CAT.attachment.kernels.nan_update_arg`."""
+    np.random.seed(4)
+    dist_sqr = np.random.rand(20, 20)
+    np.fill_diagonal(dist_sqr, np.nan)
+
+    for arg_func, is_min in [(np.nanargmin, True), (np.nanargmax, False)]:
+        dist_1d = dist_sqr[0].copy()
+        dist_1d_ref = dist_1d.copy()
+        i = i_ref = 0
+        for _ in range(10):
+            i = nan_update_arg(dist_sqr, dist_1d, i, is_min)
+
+            dist_1d_ref[i_ref] = np.nan
+            dist_1d_ref += dist_sqr[i_ref]
+            i_ref = arg_func(dist_1d_ref)
+            assertion.eq(i, i_ref)
+        np.testing.assert_allclose(dist_1d, dist_1d_ref)
+
+
+def test_set_backend() -> None:
+    """Test :func:`CAT.attachment.kernels.set_backend`."""
+    backend = get_backend()
+    assertion.contains({'numpy', 'numba'}, backend)
+    assertion.assert_(set_backend, 'bob', exception=ValueError)
+    if NUMBA is not None:
+        assertion.assert_(set_backend, 'numba', exception=ImportError)
+    assertion.eq(get_backend(), backend)
@@ -1,12 +1,23 @@
 """Tests for :mod:`CAT.attachment.ligand_attach`."""
 
+import warnings
 from os.path import join
 
 import numpy as np
+import pandas as pd
 
+from scm.plams import Settings, Molecule, Atom, MoleculeError
+from scm.plams.interfaces.molecule.rdkit import from_smiles
 from assertionlib import assertion
 
-from CAT.attachment.ligand_attach import (_get_rotmat1, _get_rotmat2)
+from CAT.workflows import MOL, HDF5_INDEX, OPT, CLASH_MIN_DIST, CLASH_COUNT, FOOTPRINT_RATIO
+from CAT.attachment.ligand_attach import (
+    _get_rotmat1, _get_rotmat2, _get_df, _take_mol, ligand_to_qd, ligands_to_qd, get_core_geometry,
+    array_to_qd, assemble_qd, rot_mol, rotation_check_kdtree, _iter_rotamers,
+    get_clash_stats, clash_check, get_ligand_beads, _color_anchors, get_rotamer_library,
+    get_ligand_footprint, get_anchor_spacing, steric_screening, get_torsion_bonds, relieve_torsions
+)
+from CAT.attachment.substitution_symmetry import get_symmetry_operations, get_anchor_orbits
 
 PATH = join('tests', 'test_files')
 
@@ -58,3 +69,405 @@ def test_get_rotmat2() -> None:
 
     rotmat2 = _get_rotmat2(vec2)
     np.testing.assert_allclose(rotmat2, ref2)
+
+
+def test_get_df() -> None:
+    """Test :func:`CAT.attachment.ligand_attach._get_df`."""
+    core_tups = [('Cd2Se', '1 2'), ('Cd1Se', '3 4'), ('Cd1Se', '1 2')]
+    lig_tups = [('CO', 'O2'), ('CCO', 'O3'), ('CCCO', 'O4')]
+    core_index = pd.MultiIndex.from_tuples(core_tups, names=['formula', 'anchor'])
+    lig_index = pd.MultiIndex.from_tuples(lig_tups, names=['smiles', 'anchor'])[[0, 2]]
+
+    df = _get_df(core_index, lig_index, Settings())
+    ref = pd.MultiIndex.from_tuples(
+        [i + j for i in core_tups for j in [lig_tups[0], lig_tups[2]]],
+        names=['core', 'core anchor', 'ligand smiles', 'ligand anchor']
+    )
+    assertion.assert_(df.index.equals, ref)
+    assertion.eq(df.index.names, ref.names)
+    assertion.eq(df[HDF5_INDEX].tolist(), 6 * [-1])
+    assertion.eq(df[OPT].tolist(), 6 * [False])
+
+    df.sort_index(inplace=True)
+    assertion.assert_(df.index.equals, ref.sort_values())
+
+
+def test_take_mol() -> None:
+    """Test :func:`CAT.attachment.ligand_attach._take_mol`."""
+    index = pd.MultiIndex.from_tuples([('a', 1), ('b', 2), ('c', 3)])
+    df = pd.DataFrame({MOL: [1, 2, 3]}, index=index)
+
+    ref = np.array([3, 1, 1])
+    out = _take_mol(df, index[[2, 0, 0]])
+    np.testing.assert_array_equal(out, ref)
+
+    index2 = pd.MultiIndex.from_tuples([('a', 1), ('d', 4)])
+    assertion.assert_(_take_mol, df, index2, exception=KeyError)
+
+
+def test_get_core_geometry() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.get_core_geometry`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    core.properties.dummies = [at for at in core if at.symbol == 'Cd'][:4]
+    core.properties.name = 'Cd68Se55'
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    ligand.properties.dummies = ligand[2]
+    ligand.properties.name = 'CO'
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # The dummy atoms are still part of the core
+        for allignment in ('sphere', 'surface'):
+            core_geometry = get_core_geometry(core, allignment)
+            assertion.eq(core_geometry.anchor.shape, (4, 3))
+            assertion.eq(core_geometry.vec.shape, (4, 3))
+
+            qd_ref = ligand_to_qd(core, ligand, PATH, allignment=allignment)
+            for _ in range(2):  # core_geometry should not be modified inplace
+                qd = ligand_to_qd(core, ligand, PATH, core_geometry=core_geometry)
+                np.testing.assert_allclose(qd.as_array(), qd_ref.as_array())
+
+    assertion.assert_(get_core_geometry, core, 'bob', exception=ValueError)
+
+
+def test_ligands_to_qd() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.ligands_to_qd`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    core.properties.dummies = [at for at in core if at.symbol == 'Cd'][:4]
+    core.properties.name = 'Cd68Se55'
+    ligand1 = Molecule(join(PATH, 'Methanol.xyz'))
+    ligand1.properties.dummies = ligand1[2]
+    ligand1.properties.name = 'CO'
+    ligand2 = Molecule(join(PATH, 'Acetate.xyz'))
+    ligand2.properties.dummies = ligand2[3]
+    ligand2.properties.name = 'CC(=O)[O-]'
+    ligands = [ligand1, ligand2, ligand1]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')  # The dummy atoms are still part of the core
+        core_geometry = get_core_geometry(core)
+        for kwargs in ({}, {'rotamer_refinement': True, 'packing_sweeps': 2}):
+            qd_list = ligands_to_qd(core, ligands, PATH, core_geometry=core_geometry, **kwargs)
+            assertion.len_eq(qd_list, 3)
+            for qd, ligand in zip(qd_list, ligands):
+                qd_ref = ligand_to_qd(core, ligand, PATH, core_geometry=core_geometry, **kwargs)
+                assertion.eq(qd.properties.name, qd_ref.properties.name)
+                assertion.eq(qd.properties.indices, qd_ref.properties.indices)
+                np.testing.assert_allclose(qd.as_array(), qd_ref.as_array(), atol=0.002)
+
+
+def test_assemble_qd() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.assemble_qd`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    for at in core:
+        at.properties.pdb_info.ResidueNumber = 1
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    ligand.guess_bonds()
+    xyz = np.random.rand(4, len(ligand), 3)
+
+    ref = core.copy()
+    array_to_qd(ligand, xyz, mol_out=ref)
+    ref.round_coords()
+    qd = assemble_qd(core, ligand, xyz)
+
+    np.testing.assert_array_equal(qd.as_array(), ref.as_array())
+    assertion.eq([at.symbol for at in qd], [at.symbol for at in ref])
+    assertion.eq([at.properties.pdb_info.ResidueNumber for at in qd],
+                 [at.properties.pdb_info.ResidueNumber for at in ref])
+    assertion.eq(sorted(qd.index(b) for b in qd.bonds), sorted(ref.index(b) for b in ref.bonds))
+    for at in qd:
+        assertion.is_(at.mol, qd)
+
+
+def test_rot_mol_refine() -> None:
+    """Test the **refine** parameter of :func:`CAT.attachment.ligand_attach.rot_mol`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'][:4])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    vec1 = np.array([-1, 0, 0], dtype=float)
+    vec2 = np.array(core.get_center_of_mass()) - anchor
+
+    kwargs = {'atoms_other': anchor, 'core': core.as_array(), 'idx': 1, 'ret_min_dist': True}
+    _, dist_ref = rot_mol(ligand, vec1, vec2.copy(), **kwargs)
+    _, dist = rot_mol(ligand, vec1, vec2.copy(), refine=True, **kwargs)
+    assertion.le(dist[0], dist_ref[0])
+    _, dist = rot_mol(ligand, vec1, vec2.copy(), step=None, refine=True, **kwargs)
+    assertion.len_eq(dist, 4)
+
+    xyz, dist = rot_mol(ligand, vec1, vec2.copy(), n_sweeps=3, **kwargs)
+    assertion.eq(xyz.shape, (4, len(ligand), 3))
+    assertion.len_eq(dist, 4)
+
+    assertion.len_eq(_get_rotmat2(vec1, step=2/13), 13)
+    assertion.len_eq(_get_rotmat2(vec1, step=1/16), 32)
+
+
+def test_iter_rotamers() -> None:
+    """Test :func:`CAT.attachment.ligand_attach._iter_rotamers`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'][:4])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    xyz = np.repeat(ligand.as_array()[None, ...], 4, axis=0)
+    xyz -= xyz[:, 1, None]
+    rotmat = _get_rotmat2(np.array(core.get_center_of_mass()) - anchor)
+
+    ref = np.swapaxes(xyz@rotmat, 0, 1)
+    ref += (anchor[..., None, :] - ref[:, :, 1])[..., None, :]
+    rotamers = list(_iter_rotamers(xyz, rotmat, anchor, idx=1))
+    assertion.len_eq(rotamers, 4)
+    np.testing.assert_allclose(rotamers, ref)
+
+    ret1 = rotation_check_kdtree(iter(rotamers), anchor, core.as_array())
+    ret2 = rotation_check_kdtree(ref, anchor, core.as_array())
+    np.testing.assert_allclose(ret1, ret2)
+
+
+def test_get_ligand_beads() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.get_ligand_beads`."""
+    ligand = Molecule(join(PATH, 'Acetate.xyz'))
+    xyz = ligand.as_array()
+
+    beads = get_ligand_beads(ligand, atoms_per_bead=2)
+    assertion.eq(beads.weight.shape[1], len(ligand))
+    assertion.len_eq(beads.radius, len(beads.weight))
+    np.testing.assert_allclose(beads.weight.sum(axis=1), 1)
+    np.testing.assert_array_equal((beads.weight > 0).sum(axis=0), 1)
+
+    # Every atom should be located within the radius of its bead
+    labels = beads.weight.argmax(axis=0)
+    dist = np.linalg.norm(xyz - (beads.weight @ xyz)[labels], axis=1)
+    assertion.assert_(np.all, dist <= beads.radius[labels] + 1e-8)
+
+    beads = get_ligand_beads(ligand, atoms_per_bead=100)
+    assertion.len_eq(beads.radius, 1)
+
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'][:4])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    vec1 = np.array([-1, 0, 0], dtype=float)
+    vec2 = np.array(core.get_center_of_mass()) - anchor
+
+    kwargs = {'atoms_other': anchor, 'core': core.as_array(), 'idx': 1, 'ret_min_dist': True}
+    beads = get_ligand_beads(ligand)
+    xyz_ref, dist_ref = rot_mol(ligand, vec1, vec2.copy(), **kwargs)
+    xyz, dist = rot_mol(ligand, vec1, vec2.copy(), beads=beads, n_candidates=32, **kwargs)
+    np.testing.assert_allclose(xyz, xyz_ref)
+    _, dist = rot_mol(ligand, vec1, vec2.copy(), beads=beads, n_candidates=4, **kwargs)
+    assertion.len_eq(dist, 4)
+
+
+def test_parallel_placement() -> None:
+    """Test the **parallel** parameter of :func:`CAT.attachment.ligand_attach.rot_mol`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    vec1 = np.array([-1, 0, 0], dtype=float)
+    vec2 = np.array(core.get_center_of_mass()) - anchor
+
+    colors = _color_anchors(anchor, 2.0, 5.0)
+    np.testing.assert_array_equal(np.sort(np.concatenate(colors)), np.arange(len(anchor)))
+    for idx in colors:
+        dist = np.linalg.norm(anchor[idx, None] - anchor[None, idx], axis=-1)
+        np.fill_diagonal(dist, np.inf)
+        assertion.assert_(np.all, dist >= 9.0)
+    assertion.len_eq(_color_anchors(anchor, 0.0, 0.1), 1)
+
+    kwargs = {'atoms_other': anchor, 'core': core.as_array(), 'idx': 1, 'ret_min_dist': True}
+    xyz, dist = rot_mol(ligand, vec1, vec2.copy(), parallel=True, **kwargs)
+    assertion.eq(xyz.shape, (len(anchor), len(ligand), 3))
+    assertion.len_eq(dist, len(anchor))
+
+    kwargs['atoms_other'] = anchor[:1]
+    xyz_ref, dist_ref = rot_mol(ligand, vec1, vec2[:1].copy(), **kwargs)
+    xyz, dist = rot_mol(ligand, vec1, vec2[:1].copy(), parallel=True, **kwargs)
+    np.testing.assert_allclose(xyz, xyz_ref)
+    np.testing.assert_allclose(dist, dist_ref)
+
+
+def test_get_rotamer_library() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.get_rotamer_library`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'][:4])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    ligand.properties.dummies = ligand[2]
+    vec1 = np.array([-1, 0, 0], dtype=float)
+    vec2 = np.array(core.get_center_of_mass()) - anchor
+    vec2[0] = -vec1  # An anti-parallel vector; i.e. an improper rotation
+
+    library = get_rotamer_library(ligand, vec=vec1)
+    assertion.eq(library.xyz.shape, (32, len(ligand), 3))
+    assertion.eq(library.step, 1/16)
+    np.testing.assert_allclose(library.xyz[:, 1], 0, atol=1e-8)
+
+    kwargs = {'atoms_other': anchor, 'core': core.as_array(), 'idx': 1, 'ret_min_dist': True}
+    xyz_ref, dist_ref = rot_mol(ligand, vec1, vec2.copy(), **kwargs)
+    xyz, dist = rot_mol(ligand, vec1, vec2.copy(), library=library, **kwargs)
+    np.testing.assert_allclose(xyz, xyz_ref, atol=1e-8)
+    np.testing.assert_allclose(dist, dist_ref)
+
+    library = get_rotamer_library(ligand, vec=vec1, step=None)
+    xyz_ref, _ = rot_mol(ligand, vec1, vec2.copy(), step=None, **kwargs)
+    xyz, _ = rot_mol(ligand, vec1, vec2.copy(), library=library, **kwargs)
+    np.testing.assert_allclose(xyz, xyz_ref, atol=1e-8)
+
+
+def test_symmetric_placement() -> None:
+    """Test the **orbits** parameter of :func:`CAT.attachment.ligand_attach.rot_mol`."""
+    square = Molecule()
+    for coords in [(2, 0, 0), (0, 2, 0), (-2, 0, 0), (0, -2, 0)]:
+        square.add_atom(Atom(symbol='Cd', coords=coords))
+    anchor = square.as_array()
+
+    center, rotmat = get_symmetry_operations(square)
+    np.testing.assert_allclose(center, 0, atol=1e-8)
+    assertion.ge(len(rotmat), 5)
+    np.testing.assert_allclose(np.linalg.det(rotmat), 1)
+    for mat in rotmat:
+        dist = np.linalg.norm(anchor @ mat.T - anchor[:, None], axis=-1)
+        assertion.assert_(np.all, dist.min(axis=0) < 1e-8)
+
+    _, orbits = get_anchor_orbits(square, anchor)
+    assertion.len_eq(orbits, 1)
+    idx, rotmat = orbits[0]
+    np.testing.assert_array_equal(np.sort(idx), np.arange(4))
+    np.testing.assert_allclose(rotmat[0], np.eye(3), atol=1e-8)
+    np.testing.assert_allclose(anchor[idx[0]] @ rotmat.transpose(0, 2, 1), anchor[idx], atol=1e-8)
+
+    # Orbits consisting of a single anchor are equivalent to the sequential placement
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    anchor = np.array([at.coords for at in core if at.symbol == 'Cd'])
+    ligand = Molecule(join(PATH, 'Methanol.xyz'))
+    vec1 = np.array([-1, 0, 0], dtype=float)
+    vec2 = np.array(core.get_center_of_mass()) - anchor
+    orbits = [(np.array([i]), np.eye(3)[None]) for i in range(len(anchor))]
+
+    kwargs = {'atoms_other': anchor, 'core': core.as_array(), 'idx': 1, 'ret_min_dist': True}
+    xyz_ref, dist_ref = rot_mol(ligand, vec1, vec2.copy(), **kwargs)
+    xyz, dist = rot_mol(ligand, vec1, vec2.copy(), orbits=orbits, center=np.zeros(3), **kwargs)
+    np.testing.assert_allclose(xyz, xyz_ref)
+    np.testing.assert_allclose(dist, dist_ref)
+
+
+def test_get_clash_stats() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.get_clash_stats`."""
+    mol = Molecule()
+    coords = [(0, 0, 0), (0.5, 0, 0), (3, 0, 0), (3.8, 0, 0), (10, 0, 0), (10.8, 0, 0)]
+    residues = [(1, 'COR'), (1, 'COR'), (2, 'LIG'), (2, 'LIG'), (3, 'LIG'), (3, 'LIG')]
+    for xyz, (i, name) in zip(coords, residues):
+        at = Atom(symbol='C', coords=xyz)
+        at.properties.pdb_info.ResidueNumber = i
+        at.properties.pdb_info.ResidueName = name
+        mol.add_atom(at)
+
+    # Neither core-core nor intra-ligand pairs are considered
+    min_dist, n = get_clash_stats(mol)
+    np.testing.assert_allclose(min_dist, 2.5)
+    assertion.eq(n, 0)
+
+    mol[5].coords = (4.5, 0, 0)  # An inter-ligand clash
+    min_dist, n = get_clash_stats(mol)
+    np.testing.assert_allclose(min_dist, 0.7)
+    assertion.eq(n, 1)
+
+    mol[3].coords = (1.0, 0, 0)  # A ligand-core clash
+    min_dist, n = get_clash_stats(mol, threshold=0.6)
+    np.testing.assert_allclose(min_dist, 0.5)
+    assertion.eq(n, 1)
+
+    df = pd.DataFrame({MOL: [mol, None]})
+    df.columns = pd.MultiIndex.from_tuples([MOL])
+    df_skip = df.copy()
+    assertion.assert_(clash_check, df, threshold=0.8, action='raise', exception=MoleculeError)
+    np.testing.assert_allclose(df[CLASH_MIN_DIST], [0.5, np.nan])
+    np.testing.assert_array_equal(df[CLASH_COUNT], [2, -1])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        clash_check(df_skip, threshold=0.8, action='skip')
+    assertion.len_eq(df_skip, 1)
+    assertion.assert_(clash_check, df, action='bob', exception=ValueError)
+
+
+def test_relieve_torsions() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.relieve_torsions`."""
+    ligand = from_smiles('OCCCC')
+    ligand.properties.dummies = ligand[1]
+
+    # Only the C1-C2 and C2-C3 bonds are rotatable backbone bonds
+    bonds = get_torsion_bonds(ligand)
+    assertion.eq([(i, j) for i, j, *_ in bonds], [(1, 2), (2, 3)])
+    for i, j, moving, static in bonds:
+        assertion.eq(np.intersect1d(moving, static).size, 0)
+        assertion.eq(len(moving) + len(static), len(ligand) - 2)
+        assertion.contains(static, 0)
+    assertion.len_eq(get_torsion_bonds(ligand, n_bonds=1), 1)
+
+    # Two partially overlapping ligands
+    xyz = ligand.as_array()
+    xyz = np.array([xyz, xyz + [0, 0.5, 0]])
+    core = np.empty((0, 3), dtype=float)
+    bond_idx = np.array([ligand.get_index(b) for b in ligand.bonds]) - 1
+
+    def get_clash_count(ar: np.ndarray) -> int:
+        return int((np.linalg.norm(ar[0, :, None] - ar[1, None], axis=-1) <= 1.0).sum())
+
+    def get_bond_length(ar: np.ndarray) -> np.ndarray:
+        return np.linalg.norm(ar[:, bond_idx[:, 0]] - ar[:, bond_idx[:, 1]], axis=-1)
+
+    xyz_new = relieve_torsions(xyz, ligand, core)
+    assertion.le(get_clash_count(xyz_new), get_clash_count(xyz))
+    np.testing.assert_allclose(get_bond_length(xyz_new), get_bond_length(xyz))
+    np.testing.assert_allclose(xyz_new[:, 0], xyz[:, 0])
+
+    # A stepsize of 2 pi leaves only the identity rotation
+    np.testing.assert_allclose(relieve_torsions(xyz, ligand, core, step=2), xyz)
+
+    # Ligands without any clashes are left untouched
+    xyz[1] += [0, 20, 0]
+    np.testing.assert_array_equal(relieve_torsions(xyz, ligand, core), xyz)
+
+
+def test_steric_screening() -> None:
+    """Test :func:`CAT.attachment.ligand_attach.steric_screening`."""
+    core = Molecule(join(PATH, 'core', 'Cd68Se55.xyz'))
+    core.properties.dummies = [at for at in core if at.symbol == 'Cd']
+    ligand1 = Molecule(join(PATH, 'Methanol.xyz'))
+    ligand1.properties.dummies = ligand1[3]
+    ligand2 = Molecule(join(PATH, 'Acetate.xyz'))
+    ligand2.properties.dummies = ligand2[3]
+
+    # The footprint is invariant with respect to rotations about the ligand axis
+    footprint = get_ligand_footprint(ligand2, vec=[0, 0, 1])
+    ligand2_rot = ligand2.copy()
+    ligand2_rot.rotate(_get_rotmat2(np.array([0, 0, 1.0]), step=1/3)[1, 0])
+    ligand2_rot.properties.dummies = ligand2_rot[3]
+    assertion.isclose(get_ligand_footprint(ligand2_rot, vec=[0, 0, 1]), footprint)
+
+    spacing = get_anchor_spacing(core)
+    assertion.lt(0, spacing)
+    core_empty = core.copy()
+    core_empty.properties.dummies = [core_empty[1]]
+    assertion.eq(get_anchor_spacing(core_empty), np.inf)
+
+    core_df = pd.DataFrame({MOL: [core]}, index=pd.MultiIndex.from_tuples([('Cd68Se55', 'Cd')]))
+    ligand_df = pd.DataFrame({MOL: [ligand1, ligand2]},
+                             index=pd.MultiIndex.from_tuples([('CO', 'O3'), ('CC(=O)[O-]', 'O4')]))
+    qd_df = pd.DataFrame({MOL: [None, None]}, index=pd.MultiIndex.from_tuples(
+        [('Cd68Se55', 'Cd', 'CO', 'O3'), ('Cd68Se55', 'Cd', 'CC(=O)[O-]', 'O4')]
+    ))
+    for df in (core_df, ligand_df, qd_df):
+        df.columns = pd.MultiIndex.from_tuples([MOL])
+
+    ratio = [2 * get_ligand_footprint(lig) / spacing for lig in (ligand1, ligand2)]
+    threshold = np.mean(ratio)
+    qd_df_skip = qd_df.copy()
+    steric_screening(qd_df, core_df, ligand_df, threshold=max(ratio) + 1, action='raise')
+    np.testing.assert_allclose(qd_df[FOOTPRINT_RATIO], ratio)
+
+    assertion.assert_(steric_screening, qd_df, core_df, ligand_df, threshold=min(ratio) / 2,
+                      action='raise', exception=MoleculeError)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        steric_screening(qd_df_skip, core_df, ligand_df, threshold=threshold, action='skip')
+    assertion.len_eq(qd_df_skip, 1)
+    assertion.assert_(steric_screening, qd_df, core_df, ligand_df, action='bob',
+                      exception=ValueError)
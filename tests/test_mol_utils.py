@@ -1,5 +1,6 @@
 """Tests for :mod:`CAT.mol_utils`."""
 
+import pickle
 from os.path import join
 
 from scm.plams import Molecule, PeriodicTable, PTError
@@ -8,7 +9,7 @@ from assertionlib import assertion
 
 from CAT.mol_utils import (  # noqa: F401
     from_mol_other, from_rdmol, get_index, separate_mod,
-    to_atnum, to_symbol, adf_connectivity, fix_carboxyl, fix_h
+    to_atnum, to_symbol, adf_connectivity, fix_carboxyl, fix_h, pickle_dumps
 )
 
 PATH = join('tests', 'test_files')
@@ -125,3 +126,21 @@ def test_fix_h() -> None:
     H, C1, C2 = mol[3], mol[1], mol[2]
     angle = C1.angle(H, C2, result_unit='degree')
     assertion.eq(round(angle), 120)
+
+
+def test_pickle_dumps() -> None:
+    """Test :func:`CAT.mol_utils.pickle_dumps`."""
+    mol = MOL.copy()
+    mol.properties.dummies = mol[3]
+    mol.properties.indices = [mol[1], mol[2]]
+
+    mol_new = pickle.loads(pickle_dumps(mol))
+    assertion.is_not(mol_new, mol)
+    assertion.contains(mol_new.atoms, mol_new.properties.dummies)
+    assertion.eq(mol_new.properties.dummies.coords, mol[3].coords)
+    for at in mol_new.properties.indices:
+        assertion.contains(mol_new.atoms, at)
+    assertion.eq(len(mol_new.bonds), len(mol.bonds))
+
+    mol_list = pickle.loads(pickle_dumps([mol, mol]))
+    assertion.is_(mol_list[0], mol_list[1])
@@ -0,0 +1,55 @@
+"""Tests for :mod:`CAT.plan`."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+from scm.plams import Settings
+from assertionlib import assertion
+from nanoutils import delete_finally
+
+from CAT.plan import plan, _get_solvents
+
+PATH = Path('tests') / 'test_files'
+LIG_PATH = PATH / 'ligand'
+QD_PATH = PATH / 'qd'
+DB_PATH = PATH / 'database'
+
+
+@mock.patch.dict(os.environ,
+                 {'ADFBIN': 'a', 'ADFHOME': '2019', 'ADFRESOURCES': 'b', 'SCMLICENSE': 'c'})
+@delete_finally(LIG_PATH, QD_PATH, DB_PATH)
+def test_plan() -> None:
+    """Tests for :func:`CAT.plan.plan`."""
+    arg = Settings()
+    arg.path = PATH
+    arg.input_cores = ['Cd68Se55.xyz']
+    arg.input_ligands = ['CO', 'CCO', 'OCCO']
+    arg.optional.database.read = False
+    arg.optional.database.write = False
+    arg.optional.core.dummy = 'Cl'
+    arg.optional.ligand.optimize = False
+    arg.optional.ligand.split = True
+    arg.optional.ligand['cosmo-rs'] = True
+    arg.optional.qd.optimize = True
+    arg.optional.qd.dissociate = {'core_atom': 'Cd', 'lig_count': 2}
+
+    ret = plan(arg)
+    assertion.eq(ret.ligand.count, 4)  # OCCO has two functional groups
+    assertion.eq(ret.core.count, 1)
+    assertion.eq(ret.core.anchor_count, [26])
+    assertion.eq(ret.qd.count, 4)
+
+    # Cd68Se55 + 26 ligands: methoxide (5 atoms), ethoxide (8 atoms), 2x 2-hydroxyethoxide (9 atoms)
+    assertion.eq(ret.qd.atom_count.min, 123 + 26 * 5)
+    assertion.eq(ret.qd.atom_count.max, 123 + 26 * 9)
+    assertion.lt(0, ret.qd.nbytes)
+
+    jobs = ret.job_count
+    assertion.eq(jobs.ligand_opt, 0)
+    assertion.eq(jobs.cdft, 0)
+    assertion.eq(jobs.activation_strain, 0)
+    assertion.eq(jobs.crs, 4 * (1 + len(_get_solvents())))
+    assertion.eq(jobs.qd_opt, 4 * 2)
+    assertion.eq(jobs.dissociate, 4 * (68 + 2))
+    assertion.eq(jobs.total, sum(v for k, v in jobs.items() if k != 'total'))
@@ -0,0 +1,87 @@
+"""Tests for :mod:`CAT.scheduler`."""
+
+import pandas as pd
+from assertionlib import assertion
+
+from CAT.workflows import MOL
+from CAT.timing import TIMING_REPORT
+from CAT.scheduler import Stage, run_stages, _sort_stages, _merge
+from CAT.settings_dataframe import SettingsDataFrame
+
+
+def _get_df() -> SettingsDataFrame:
+    """Construct a dataframe with a *mol* column."""
+    df = pd.DataFrame({MOL: [1, 2, 3]})
+    df.columns = pd.MultiIndex.from_tuples([MOL], names=['index', 'sub index'])
+    return SettingsDataFrame(df, settings={'optional': {'n_workers': 1}})
+
+
+def _add(df: pd.DataFrame, value: int = 1) -> None:
+    """Add the ``("add", str(value))`` column to **df**."""
+    with TIMING_REPORT.record(f'add {value}', n_mol=len(df)):
+        df['add', str(value)] = df[MOL] + value
+
+
+def _double(df: pd.DataFrame) -> None:
+    """Double the *mol* column of **df**."""
+    df[MOL] *= 2
+
+
+def _sum(df: pd.DataFrame) -> None:
+    """Add the ``("sum", "")`` column to **df**; requires the output of :func:`_add`."""
+    df['sum', ''] = df[MOL] + df['add', '1']
+
+
+def test_sort_stages() -> None:
+    """Tests for :func:`CAT.scheduler._sort_stages`."""
+    stages = [
+        Stage('c', _sum, requires=('a', 'b')),
+        Stage('b', _add, requires=('a', 'd')),
+        Stage('a', _add),
+    ]
+    names = [stage.name for stage in _sort_stages(stages)]
+    assertion.eq(names, ['a', 'b', 'c'])
+
+    stages_circular = [Stage('a', _add, requires=('b',)), Stage('b', _add, requires=('a',))]
+    assertion.assert_(_sort_stages, stages_circular, exception=ValueError)
+
+
+def test_merge() -> None:
+    """Tests for :func:`CAT.scheduler._merge`."""
+    df = _get_df()
+    ret = pd.DataFrame(df).copy()
+    _double(ret)
+    _add(ret)
+
+    _merge(df, ret)
+    assertion.eq(df[MOL].tolist(), [1, 2, 3])
+    assertion.eq(df['add', '1'].tolist(), [3, 5, 7])
+
+    _merge(df, ret, modifies_mol=True)
+    assertion.eq(df[MOL].tolist(), [2, 4, 6])
+
+
+def test_run_stages() -> None:
+    """Tests for :func:`CAT.scheduler.run_stages`."""
+    stages = [
+        Stage('sum', _sum, requires=('add',)),
+        Stage('add', _add),
+        Stage('add 2', _add, args=(2,)),
+        Stage('double', _double, modifies_mol=True, requires=('sum',)),
+    ]
+    ref = {
+        MOL: [2, 4, 6],
+        ('add', '1'): [2, 3, 4],
+        ('add', '2'): [3, 4, 5],
+        ('sum', ''): [3, 5, 7],
+    }
+
+    for max_workers in (1, 2):
+        TIMING_REPORT.clear()
+        df = _get_df()
+        run_stages(df, stages, max_workers=max_workers)
+        for k, v in ref.items():
+            assertion.eq(df[k].tolist(), v)
+
+        names = sorted(record.name for record in TIMING_REPORT.records)
+        assertion.eq(names, ['add 1', 'add 2'])
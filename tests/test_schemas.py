@@ -13,7 +13,8 @@ from CAT.utils import get_template
 from CAT.data_handling.str_to_func import str_to_func
 from CAT.data_handling.validation_schemas import (
     mol_schema, core_schema, ligand_schema, qd_schema, database_schema,
-    mongodb_schema, bde_schema, qd_opt_schema, crs_schema, subset_schema
+    mongodb_schema, bde_schema, qd_opt_schema, crs_schema, subset_schema, optional_schema,
+    checkpoint_schema, cache_schema
 )
 
 PATH = join('tests', 'test_files')
@@ -198,11 +199,96 @@ def test_qd_schema() -> None:
         'dissociate': False,
         'bulkiness': False,
         'construct_qd': True,
-        'multi_ligand': None
+        'multi_ligand': None,
+        'chunk_size': None,
+        'rotamer_refinement': False,
+        'packing_sweeps': 0,
+        'bead_candidates': None,
+        'parallel_placement': False,
+        'batch_size': None,
+        'screening_threshold': None,
+        'symmetric_placement': False,
+        'torsional_relief': None,
+        'clash_threshold': 1.0,
+        'clash_action': 'warn'
     }
 
     assertion.eq(qd_schema.validate(qd_dict), ref)
 
+    qd_dict['chunk_size'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['chunk_size'] = 0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['chunk_size'] = 10.0
+    assertion.eq(qd_schema.validate(qd_dict)['chunk_size'], 10)
+    qd_dict['chunk_size'] = None
+
+    qd_dict['rotamer_refinement'] = 1  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['rotamer_refinement'] = False
+
+    qd_dict['packing_sweeps'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['packing_sweeps'] = -1  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['packing_sweeps'] = 2.0
+    assertion.eq(qd_schema.validate(qd_dict)['packing_sweeps'], 2)
+    qd_dict['packing_sweeps'] = 0
+
+    qd_dict['bead_candidates'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['bead_candidates'] = 0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['bead_candidates'] = 8.0
+    assertion.eq(qd_schema.validate(qd_dict)['bead_candidates'], 8)
+    qd_dict['bead_candidates'] = None
+
+    qd_dict['parallel_placement'] = 1  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['parallel_placement'] = False
+
+    qd_dict['batch_size'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['batch_size'] = 0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['batch_size'] = 100.0
+    assertion.eq(qd_schema.validate(qd_dict)['batch_size'], 100)
+    qd_dict['batch_size'] = None
+
+    qd_dict['screening_threshold'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['screening_threshold'] = 0.0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['screening_threshold'] = 2
+    assertion.eq(qd_schema.validate(qd_dict)['screening_threshold'], 2.0)
+    qd_dict['screening_threshold'] = None
+
+    qd_dict['symmetric_placement'] = 1  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['symmetric_placement'] = False
+
+    qd_dict['torsional_relief'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['torsional_relief'] = 0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['torsional_relief'] = 3.0
+    assertion.eq(qd_schema.validate(qd_dict)['torsional_relief'], 3)
+    qd_dict['torsional_relief'] = None
+
+    qd_dict['clash_threshold'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['clash_threshold'] = -1.0  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['clash_threshold'] = 1.0
+
+    qd_dict['clash_action'] = 1  # Exception: incorrect type
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['clash_action'] = 'bob'  # Exception: incorrect value
+    assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
+    qd_dict['clash_action'] = 'SKIP'
+    assertion.eq(qd_schema.validate(qd_dict)['clash_action'], 'skip')
+    qd_dict['clash_action'] = 'warn'
+
     qd_dict['activation_strain'] = 1  # Exception: incorrect type
     assertion.assert_(qd_schema.validate, qd_dict, exception=SchemaError)
     qd_dict['activation_strain'] = True
@@ -286,11 +372,23 @@ def test_qd_opt_schema() -> None:
         'job2': AMSJob,
         's2': _qd_opt_s2_default,
         'keep_files': True,
-        'use_ff': False
+        'use_ff': False,
+        'max_parallel_jobs': 1
     })
 
     assertion.eq(qd_opt_schema.validate(qd_opt_dict), ref)
 
+    qd_opt_dict['max_parallel_jobs'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(qd_opt_schema.validate, qd_opt_dict, exception=SchemaError)
+    qd_opt_dict['max_parallel_jobs'] = 0  # Exception: incorrect value
+    assertion.assert_(qd_opt_schema.validate, qd_opt_dict, exception=SchemaError)
+    qd_opt_dict['max_parallel_jobs'] = 2.5  # Exception: incorrect value
+    assertion.assert_(qd_opt_schema.validate, qd_opt_dict, exception=SchemaError)
+    qd_opt_dict['max_parallel_jobs'] = 4.0
+    assertion.eq(qd_opt_schema.validate(qd_opt_dict)['max_parallel_jobs'], 4)
+    qd_opt_dict['max_parallel_jobs'] = 4
+    assertion.eq(qd_opt_schema.validate(qd_opt_dict)['max_parallel_jobs'], 4)
+
     for job in ('job1', 'job2'):
         qd_opt_dict[job] = 1  # Exception: incorrect type
         assertion.assert_(qd_opt_schema.validate, qd_opt_dict, exception=SchemaError)
@@ -605,3 +703,93 @@ def test_subset_schema() -> None:
     assertion.eq(subset_schema.validate(subset_dict)['randomness'], 1.0)
     subset_dict['randomness'] = 0
     assertion.eq(subset_schema.validate(subset_dict)['randomness'], 0)
+
+
+def test_optional_schema() -> None:
+    """Test :data:`CAT.data_handling.validation_schemas.optional_schema`."""
+    optional_dict = {'database': {'read': True}}
+    ref = {'database': {'read': True}, 'n_workers': 1, 'max_parallel_stages': 1,
+           'checkpoint': False, 'cache': False}
+
+    assertion.eq(optional_schema.validate(optional_dict), ref)
+
+    optional_dict['n_workers'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['n_workers'] = 1.5  # Exception: incorrect value
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['n_workers'] = 0  # Exception: incorrect value
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['n_workers'] = 4
+    assertion.eq(optional_schema.validate(optional_dict)['n_workers'], 4)
+    optional_dict['n_workers'] = 4.0
+    assertion.eq(optional_schema.validate(optional_dict)['n_workers'], 4)
+    optional_dict['n_workers'] = None
+    assertion.eq(optional_schema.validate(optional_dict)['n_workers'], os.cpu_count() or 1)
+
+    optional_dict['max_parallel_stages'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['max_parallel_stages'] = 0  # Exception: incorrect value
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['max_parallel_stages'] = 3
+    assertion.eq(optional_schema.validate(optional_dict)['max_parallel_stages'], 3)
+    optional_dict['max_parallel_stages'] = None
+    assertion.eq(optional_schema.validate(optional_dict)['max_parallel_stages'],
+                 os.cpu_count() or 1)
+
+    optional_dict['checkpoint'] = 1  # Exception: incorrect type
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['checkpoint'] = True
+    assertion.eq(optional_schema.validate(optional_dict)['checkpoint'], {})
+    optional_dict['checkpoint'] = False
+    assertion.is_(optional_schema.validate(optional_dict)['checkpoint'], False)
+    optional_dict['checkpoint'] = {'interval': 10}
+    assertion.eq(optional_schema.validate(optional_dict)['checkpoint'], {'interval': 10})
+
+    optional_dict['cache'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(optional_schema.validate, optional_dict, exception=SchemaError)
+    optional_dict['cache'] = True
+    assertion.eq(optional_schema.validate(optional_dict)['cache'], {})
+    optional_dict['cache'] = False
+    assertion.is_(optional_schema.validate(optional_dict)['cache'], False)
+
+
+def test_checkpoint_schema() -> None:
+    """Test :data:`CAT.data_handling.validation_schemas.checkpoint_schema`."""
+    checkpoint_dict = {}
+    ref = {'dirname': 'checkpoint', 'interval': None}
+
+    assertion.eq(checkpoint_schema.validate(checkpoint_dict), ref)
+
+    checkpoint_dict['dirname'] = 1  # Exception: incorrect type
+    assertion.assert_(checkpoint_schema.validate, checkpoint_dict, exception=SchemaError)
+    checkpoint_dict['dirname'] = 'bob'
+    assertion.eq(checkpoint_schema.validate(checkpoint_dict)['dirname'], 'bob')
+
+    checkpoint_dict['interval'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(checkpoint_schema.validate, checkpoint_dict, exception=SchemaError)
+    checkpoint_dict['interval'] = 1.5  # Exception: incorrect value
+    assertion.assert_(checkpoint_schema.validate, checkpoint_dict, exception=SchemaError)
+    checkpoint_dict['interval'] = 0  # Exception: incorrect value
+    assertion.assert_(checkpoint_schema.validate, checkpoint_dict, exception=SchemaError)
+    checkpoint_dict['interval'] = 10.0
+    assertion.eq(checkpoint_schema.validate(checkpoint_dict)['interval'], 10)
+
+
+def test_cache_schema() -> None:
+    """Test :data:`CAT.data_handling.validation_schemas.cache_schema`."""
+    cache_dict = {}
+    ref = {'filename': 'cache.db', 'max_size': None}
+
+    assertion.eq(cache_schema.validate(cache_dict), ref)
+
+    cache_dict['filename'] = 1  # Exception: incorrect type
+    assertion.assert_(cache_schema.validate, cache_dict, exception=SchemaError)
+    cache_dict['filename'] = 'bob.db'
+    assertion.eq(cache_schema.validate(cache_dict)['filename'], 'bob.db')
+
+    cache_dict['max_size'] = 'bob'  # Exception: incorrect type
+    assertion.assert_(cache_schema.validate, cache_dict, exception=SchemaError)
+    cache_dict['max_size'] = 0  # Exception: incorrect value
+    assertion.assert_(cache_schema.validate, cache_dict, exception=SchemaError)
+    cache_dict['max_size'] = 1e6
+    assertion.eq(cache_schema.validate(cache_dict)['max_size'], 10**6)
@@ -1,5 +1,7 @@
 """Tests for :mod:`CAT.settings_dataframe`."""
 
+import pickle
+
 import numpy as np
 
 from assertionlib import assertion
@@ -22,3 +24,16 @@ def test_df_and_series() -> None:
     assertion.eq(SERIES.to_frame().settings, settings)
     assertion.eq(DF.copy().settings, settings)
     assertion.eq(SERIES.copy().settings, settings)
+
+
+def test_pickle() -> None:
+    """Tests for pickling :class:`.SettingsDataFrame` and :class:`.SettingsSeries`."""
+    settings = FrozenSettings(_DICT)
+
+    df = pickle.loads(pickle.dumps(DF))
+    series = pickle.loads(pickle.dumps(SERIES.rename('bob')))
+    assertion.eq(df.settings, settings)
+    assertion.eq(series.settings, settings)
+    assertion.eq(series.name, 'bob')
+    np.testing.assert_array_equal(df, DF)
+    np.testing.assert_array_equal(series, SERIES)
@@ -0,0 +1,76 @@
+"""Tests for :mod:`CAT.timing`."""
+
+import csv
+import json
+import math
+from pathlib import Path
+
+from assertionlib import assertion
+from nanoutils import delete_finally
+
+from CAT.timing import TimingReport, TimingRecord
+
+PATH = Path('tests') / 'test_files'
+JSON_PATH = PATH / 'timings.json'
+CSV_PATH = PATH / 'timings.csv'
+
+
+def test_record() -> None:
+    """Tests for :meth:`CAT.timing.TimingReport.record`."""
+    report = TimingReport()
+    with report.record('a', n_mol=5) as counter:
+        counter.n_failed += 2
+    with report.record('b') as counter:
+        counter.n_mol += 1
+
+    try:
+        with report.record('c', n_mol=3):
+            raise ValueError
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Failed to raise a ValueError")
+
+    a, b, c = report.records
+    assertion.eq((a.name, a.n_mol, a.n_failed), ('a', 5, 2))
+    assertion.eq((b.name, b.n_mol, b.n_failed), ('b', 1, 0))
+    assertion.eq((c.name, c.n_mol, c.n_failed), ('c', 3, 3))
+    assertion.le(a.start, b.start)
+    assertion.le(0, a.wall_time)
+    assertion.le(0, a.cpu_time)
+
+    report.clear()
+    assertion.eq(report.records, [])
+
+
+def test_mol_per_sec() -> None:
+    """Tests for :attr:`CAT.timing.TimingRecord.mol_per_sec`."""
+    record = TimingRecord('a', 0.0, 2.0, 1.0, 10, 0)
+    assertion.eq(record.mol_per_sec, 5.0)
+    assertion.eq(record.as_dict()['mol_per_sec'], 5.0)
+
+    record2 = record._replace(wall_time=0.0)
+    assertion.assert_(math.isnan, record2.mol_per_sec)
+
+
+@delete_finally(JSON_PATH, CSV_PATH)
+def test_export() -> None:
+    """Tests for :meth:`CAT.timing.TimingReport.export`."""
+    report = TimingReport()
+    for name in ('a', 'b'):
+        with report.record(name, n_mol=2):
+            pass
+    report.export(PATH)
+
+    with open(JSON_PATH, 'r') as f:
+        json_data = json.load(f)
+    with open(CSV_PATH, 'r', newline='') as f:
+        csv_data = list(csv.DictReader(f))
+
+    df = report.to_dataframe()
+    assertion.eq(df.columns.tolist(), list(TimingReport.FIELDS))
+    assertion.eq(df['name'].tolist(), ['a', 'b'])
+    assertion.eq([i['name'] for i in json_data], ['a', 'b'])
+    assertion.eq([i['n_mol'] for i in json_data], [2, 2])
+    assertion.eq([i['name'] for i in csv_data], ['a', 'b'])
+    assertion.eq(list(csv_data[0].keys()), list(TimingReport.FIELDS))
@@ -49,7 +49,7 @@ def test_validate_input() -> None:
     ref.ligand['cosmo-rs'] = False
     ref.ligand.dirname = join(PATH, 'ligand')
     ref.ligand.optimize = {'job1': None, 'job2': None, 's1': None, 's2': Settings(),
-                           'use_ff': False, 'keep_files': True}
+                           'use_ff': False, 'keep_files': True, 'max_parallel_jobs': 1}
     ref.ligand.split = True
     ref.ligand.cdft = False
 
@@ -59,9 +59,24 @@ def test_validate_input() -> None:
     ref.qd.dirname = join(PATH, 'qd')
     ref.qd.dissociate = False
     ref.qd.multi_ligand = None
-    ref.qd.optimize = {'job1': AMSJob, 'keep_files': True, 'use_ff': False, 's2': {'description': 'UFF with the default forcefield', 'input': {'uff': {'library': 'uff'}, 'ams': {'system': {'bondorders': {'_1': None}}}}}, 's1': {'description': 'UFF with the default forcefield', 'input': {'uff': {'library': 'uff'}, 'ams': {'system': {'bondorders': {'_1': None}}}}}, 'job2': AMSJob}  # noqa
+    ref.qd.chunk_size = None
+    ref.qd.rotamer_refinement = False
+    ref.qd.packing_sweeps = 0
+    ref.qd.bead_candidates = None
+    ref.qd.parallel_placement = False
+    ref.qd.batch_size = None
+    ref.qd.screening_threshold = None
+    ref.qd.symmetric_placement = False
+    ref.qd.torsional_relief = None
+    ref.qd.clash_threshold = 1.0
+    ref.qd.clash_action = 'warn'
+    ref.qd.optimize = {'job1': AMSJob, 'keep_files': True, 'use_ff': False, 'max_parallel_jobs': 1, 's2': {'description': 'UFF with the default forcefield', 'input': {'uff': {'library': 'uff'}, 'ams': {'system': {'bondorders': {'_1': None}}}}}, 's1': {'description': 'UFF with the default forcefield', 'input': {'uff': {'library': 'uff'}, 'ams': {'system': {'bondorders': {'_1': None}}}}}, 'job2': AMSJob}  # noqa
 
     ref.forcefield = Settings()
+    ref.n_workers = 1
+    ref.max_parallel_stages = 1
+    ref.checkpoint = None
+    ref.cache = None
 
     func_groups = s.optional.ligand.pop('functional_groups')
 
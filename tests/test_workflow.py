@@ -0,0 +1,133 @@
+"""Tests for :mod:`CAT.workflows.workflow`."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from assertionlib import assertion
+from scm.plams import Settings
+from nanoutils import delete_finally
+
+from CAT.cache import ResultCache
+from CAT.checkpoint import Checkpoint
+from CAT.workflows import MOL
+from CAT.workflows.workflow import _get_chunks, _concatenate, WorkFlow
+
+PATH = Path('tests') / 'test_files'
+CHECKPOINT_PATH = PATH / 'checkpoint_workflow'
+CACHE_PATH = PATH / 'cache_workflow.db'
+
+
+def _double(mol_series: pd.Series, **kwargs) -> pd.Series:
+    return 2 * mol_series
+
+
+def _raise(mol_series: pd.Series, **kwargs) -> pd.Series:
+    raise AssertionError("Results should have been loaded from a checkpoint")
+
+
+def test_get_chunks() -> None:
+    """Tests for :func:`CAT.workflows.workflow._get_chunks`."""
+    for n in (1, 5, 10, 101):
+        for n_workers in (1, 2, 3, 8):
+            chunks = _get_chunks(n, n_workers)
+            assertion.eq(chunks[0][0], 0)
+            assertion.eq(chunks[-1][1], n)
+            for (_, j), (i, _) in zip(chunks[:-1], chunks[1:]):
+                assertion.eq(i, j)
+            assertion.assert_(all, (j > i for i, j in chunks))
+
+
+def test_concatenate() -> None:
+    """Tests for :func:`CAT.workflows.workflow._concatenate`."""
+    assertion.is_(_concatenate([None, None]), None)
+    assertion.eq(_concatenate([[1, 2], [3]]), [1, 2, 3])
+
+    ar = _concatenate([np.ones((2, 3)), np.zeros((2, 1))], no_loc=True)
+    assertion.eq(ar.shape, (2, 4))
+
+    series = _concatenate([pd.Series([1, 2]), pd.Series([3], index=[2])])
+    np.testing.assert_array_equal(series, [1, 2, 3])
+
+
+def test_call_parallel() -> None:
+    """Tests for :meth:`CAT.workflows.workflow.WorkFlow._call_parallel`."""
+    workflow = WorkFlow(name='asa', n_workers=2)
+    series = pd.Series(np.arange(10, dtype=float))
+
+    value, series_new = workflow._call_parallel(_double, series)
+    np.testing.assert_array_equal(value, 2 * series)
+    np.testing.assert_array_equal(series_new, series)
+    np.testing.assert_array_equal(series_new.index, series.index)
+
+
+@delete_finally(CHECKPOINT_PATH)
+def test_call_checkpoint() -> None:
+    """Tests for :meth:`CAT.workflows.workflow.WorkFlow._call_checkpoint`."""
+    checkpoint = Checkpoint(CHECKPOINT_PATH, {'qd': '0' * 64}, interval=3)
+    workflow = WorkFlow(name='asa', checkpoint=checkpoint)
+    series = pd.Series(np.arange(10, dtype=float))
+
+    value, series_new = workflow._call_checkpoint(_double, series)
+    np.testing.assert_array_equal(value, 2 * series)
+    np.testing.assert_array_equal(series_new, series)
+    assertion.eq(len(os.listdir(CHECKPOINT_PATH)), 4)
+
+    # All chunks should now be loaded from the checkpoints
+    value2, _ = workflow._call_checkpoint(_raise, series)
+    np.testing.assert_array_equal(value2, value)
+
+
+@delete_finally(CACHE_PATH)
+def test_cache() -> None:
+    """Tests for :meth:`CAT.workflows.workflow.WorkFlow._from_cache` and ``_to_cache``."""
+    cache = ResultCache(CACHE_PATH)
+    workflow = WorkFlow(name='asa', cache=cache)
+    columns = pd.MultiIndex.from_tuples([MOL, ('value', '')])
+    cache_hash = workflow.get_cache_hash(_double, [('value', '')])
+
+    df1 = pd.DataFrame([[1.0, np.nan]], index=['a'], columns=columns)
+    is_cached = workflow._from_cache(df1, df1.index, [('value', '')], cache_hash)
+    np.testing.assert_array_equal(is_cached, [False])
+
+    df1['value', ''] = 2.0
+    workflow._to_cache(df1, df1.index, [('value', '')], cache_hash)
+    assertion.eq(cache.get_info()[0], 1)
+
+    # Only the first row should be loaded from the cache
+    df2 = pd.DataFrame([[np.nan, np.nan], [5.0, np.nan]], index=['a', 'b'], columns=columns)
+    is_cached = workflow._from_cache(df2, df2.index, [('value', '')], cache_hash)
+    np.testing.assert_array_equal(is_cached, [True, False])
+    assertion.eq(df2.at['a', MOL], 1.0)
+    assertion.eq(df2.at['a', ('value', '')], 2.0)
+    assertion.assert_(np.isnan, df2.at['b', ('value', '')])
+
+
+def test_get_cache_hash() -> None:
+    """Tests for :meth:`CAT.workflows.workflow.WorkFlow.get_cache_hash`."""
+    workflow = WorkFlow(name='asa')
+    cache_hash = workflow.get_cache_hash(_double, [('value', '')])
+    assertion.eq(cache_hash, WorkFlow(name='asa').get_cache_hash(_double, [('value', '')]))
+
+    # Settings which do not affect the results should not affect the hash
+    workflow.path = PATH
+    workflow.n_workers = 4
+    assertion.eq(cache_hash, workflow.get_cache_hash(_double, [('value', '')]))
+
+    workflow.use_ff = True
+    assertion.ne(cache_hash, workflow.get_cache_hash(_double, [('value', '')]))
+    assertion.ne(cache_hash, WorkFlow(name='asa').get_cache_hash(_raise, [('value', '')]))
+
+    # Arrays and non-string keys should be serialized in a deterministic manner
+    workflow.ar = np.zeros(5000)
+    workflow.dct = Settings({1: 'a', 'b': {2: None}})
+    cache_hash = workflow.get_cache_hash(_double, [('value', '')])
+    assertion.eq(cache_hash, workflow.get_cache_hash(_double, [('value', '')]))
+
+    workflow.ar[2500] = 1
+    assertion.ne(cache_hash, workflow.get_cache_hash(_double, [('value', '')]))
+
+    workflow.obj = object()
+    assertion.assert_(workflow.get_cache_hash, _double, [('value', '')], exception=TypeError)